@@ -295,3 +295,333 @@ export function createSeededRng(seed) {
     return ((n ^ (n >>> 14)) >>> 0) / 4294967296;
   };
 }
+
+
+// XDZ1 share tokens: raw deflate of the canonical JSON against a preset
+// dictionary. Browsers cannot deflate with a preset dictionary, so both
+// directions are implemented here. The dictionary, canonical JSON and checksum
+// (first 8 hex of SHA-256 over the JSON bytes) match
+// simulation/codex_eigenstate.py byte for byte, so tokens from either side
+// decode on the other.
+export const COMPRESSED_VERSION = "XDZ1";
+const MAX_INFLATED_BYTES = 1 << 20;
+
+export const SHARE_DICTIONARY = [
+  '{"enemies_per_wave":10,"enemy_speed":,"free_energy_threshold":0.,"id":"level_0,"minimum_bonds":,"name":"',
+  '"path_points":[[,"spawn_interval":0.,"star_targets":{"low_heat":0.,"natural_fold":0.},"starting_heat":0.',
+  '"tutorial_steps":["],"unlocked_towers":["hydrophobic_anchor","polar_hydrator","cationic_defender",',
+  '"anionic_repulsor","proline_hinge","alpha_helix_pulsar","beta_sheet_fortifier","molecular_chaperone"],',
+  '"wave_count":}{"level_id":"level_0","map_topology":{"path_nodes":[{"x":64,"y":64},{"x":640,"y":360}]},',
+  '"render_constraints":{"heat_overlay_resolution":128,"max_energy_edges":120,"max_mobs":80,"max_towers":24},',
+  '"schema":"campaign_level_geometry_v0_8"}{"energy":{"fiedler_sign_balance":0.5,"lambda2":,"lambda3":},',
+  '"heat":{"instability_count":0,"mean":,"q95":,"std":},"schema":"eigenstate_delta_v1","tick":}',
+  '{"custom":{"alpha":,"beta":},"level":,"loadout":["kinetic","thermal","energy","reaction","pulse","field",',
+  '"conversion","control"],"schema":"burzen_action_v1","session":"s000","tick":,"version_id":}',
+  '{"h":,"p":[[0,0],[1,0],[2,0],[2,1],[2,2]],"r":"","s":12,"w":[[1,10],[2,12],[3,14]]}',
+].join("");
+
+const SHARE_DICTIONARY_BYTES = new TextEncoder().encode(SHARE_DICTIONARY);
+
+const LENGTH_BASE = [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 15, 17, 19, 23, 27, 31, 35, 43, 51, 59, 67, 83, 99, 115, 131, 163, 195, 227, 258];
+const LENGTH_EXTRA = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 5, 0];
+const DIST_BASE = [
+  1, 2, 3, 4, 5, 7, 9, 13, 17, 25, 33, 49, 65, 97, 129, 193, 257, 385, 513, 769, 1025, 1537, 2049, 3073, 4097, 6145,
+  8193, 12289, 16385, 24577
+];
+const DIST_EXTRA = [0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 9, 9, 10, 10, 11, 11, 12, 12, 13, 13];
+const CODE_LENGTH_ORDER = [16, 17, 18, 0, 8, 7, 9, 6, 10, 5, 11, 4, 12, 3, 13, 2, 14, 1, 15];
+const WINDOW_SIZE = 32768;
+
+export function canonicalJson(value) {
+  if (Array.isArray(value)) return `[${value.map(canonicalJson).join(",")}]`;
+  if (value && typeof value === "object") {
+    const keys = Object.keys(value).filter((key) => value[key] !== undefined).sort();
+    return `{${keys.map((key) => `${JSON.stringify(key)}:${canonicalJson(value[key])}`).join(",")}}`;
+  }
+  return JSON.stringify(value);
+}
+
+function bytesToBase64url(bytes) {
+  let binary = "";
+  for (let i = 0; i < bytes.length; i += 1) binary += String.fromCharCode(bytes[i]);
+  return btoa(binary).replace(/\+/g, "-").replace(/\//g, "_").replace(/=+$/g, "");
+}
+
+function base64urlToBytes(base64url) {
+  const base64 = base64url.replace(/-/g, "+").replace(/_/g, "/") + "===".slice((base64url.length + 3) % 4);
+  const binary = atob(base64);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i += 1) bytes[i] = binary.charCodeAt(i);
+  return bytes;
+}
+
+async function sha256Hex8(bytes) {
+  const hash = await crypto.subtle.digest("SHA-256", bytes);
+  return Array.from(new Uint8Array(hash).slice(0, 4))
+    .map((b) => b.toString(16).padStart(2, "0"))
+    .join("");
+}
+
+class BitWriter {
+  constructor() {
+    this.bytes = [];
+    this.acc = 0;
+    this.count = 0;
+  }
+
+  bits(value, count) {
+    this.acc |= value << this.count;
+    this.count += count;
+    while (this.count >= 8) {
+      this.bytes.push(this.acc & 255);
+      this.acc >>>= 8;
+      this.count -= 8;
+    }
+  }
+
+  huffman(code, length) {
+    let reversed = 0;
+    for (let i = 0; i < length; i += 1) reversed = (reversed << 1) | ((code >> i) & 1);
+    this.bits(reversed, length);
+  }
+
+  finish() {
+    if (this.count > 0) this.bytes.push(this.acc & 255);
+    return Uint8Array.from(this.bytes);
+  }
+}
+
+function writeFixedSymbol(out, symbol) {
+  if (symbol < 144) out.huffman(0x30 + symbol, 8);
+  else if (symbol < 256) out.huffman(0x190 + symbol - 144, 9);
+  else if (symbol < 280) out.huffman(symbol - 256, 7);
+  else out.huffman(0xc0 + symbol - 280, 8);
+}
+
+function writeMatch(out, length, distance) {
+  let code = LENGTH_BASE.length - 1;
+  while (LENGTH_BASE[code] > length) code -= 1;
+  writeFixedSymbol(out, 257 + code);
+  out.bits(length - LENGTH_BASE[code], LENGTH_EXTRA[code]);
+  let dcode = DIST_BASE.length - 1;
+  while (DIST_BASE[dcode] > distance) dcode -= 1;
+  out.huffman(dcode, 5);
+  out.bits(distance - DIST_BASE[dcode], DIST_EXTRA[dcode]);
+}
+
+// Greedy LZ77 over dictionary + input with one fixed-Huffman block. Share
+// payloads are small, so this stays within a few percent of zlib -9.
+export function deflateRawWithDictionary(data, dictionary = SHARE_DICTIONARY_BYTES) {
+  const buf = new Uint8Array(dictionary.length + data.length);
+  buf.set(dictionary);
+  buf.set(data, dictionary.length);
+  const head = new Map();
+  const prev = new Int32Array(buf.length).fill(-1);
+  const insert = (i) => {
+    if (i + 2 >= buf.length) return;
+    const key = (buf[i] << 16) | (buf[i + 1] << 8) | buf[i + 2];
+    prev[i] = head.has(key) ? head.get(key) : -1;
+    head.set(key, i);
+  };
+  for (let i = Math.max(0, dictionary.length - WINDOW_SIZE); i < dictionary.length; i += 1) insert(i);
+
+  const out = new BitWriter();
+  out.bits(1, 1);
+  out.bits(1, 2);
+  let i = dictionary.length;
+  while (i < buf.length) {
+    let bestLength = 0;
+    let bestDistance = 0;
+    if (i + 2 < buf.length) {
+      const max = Math.min(258, buf.length - i);
+      let candidate = head.get((buf[i] << 16) | (buf[i + 1] << 8) | buf[i + 2]) ?? -1;
+      for (let chain = 0; candidate >= 0 && i - candidate <= WINDOW_SIZE && chain < 256; chain += 1) {
+        let length = 0;
+        while (length < max && buf[candidate + length] === buf[i + length]) length += 1;
+        if (length > bestLength) {
+          bestLength = length;
+          bestDistance = i - candidate;
+          if (length === max) break;
+        }
+        candidate = prev[candidate];
+      }
+    }
+    if (bestLength >= 3) {
+      writeMatch(out, bestLength, bestDistance);
+      for (let k = 0; k < bestLength; k += 1) insert(i + k);
+      i += bestLength;
+    } else {
+      writeFixedSymbol(out, buf[i]);
+      insert(i);
+      i += 1;
+    }
+  }
+  writeFixedSymbol(out, 256);
+  return out.finish();
+}
+
+function buildHuffman(lengths) {
+  const counts = new Array(16).fill(0);
+  for (const length of lengths) counts[length] += 1;
+  counts[0] = 0;
+  const offsets = new Array(16).fill(0);
+  for (let len = 1; len < 15; len += 1) offsets[len + 1] = offsets[len] + counts[len];
+  const symbols = new Array(lengths.length);
+  lengths.forEach((length, symbol) => {
+    if (length) symbols[offsets[length]++] = symbol;
+  });
+  return { counts, symbols };
+}
+
+const FIXED_LITERALS = buildHuffman(Array.from({ length: 288 }, (_, s) => (s < 144 ? 8 : s < 256 ? 9 : s < 280 ? 7 : 8)));
+const FIXED_DISTANCES = buildHuffman(new Array(30).fill(5));
+
+export function inflateRawWithDictionary(data, dictionary = SHARE_DICTIONARY_BYTES, maxOutput = MAX_INFLATED_BYTES) {
+  let pos = 0;
+  let bit = 0;
+  const readBits = (count) => {
+    let value = 0;
+    for (let k = 0; k < count; k += 1) {
+      if (pos >= data.length) throw new Error("Malformed compressed payload.");
+      value |= ((data[pos] >> bit) & 1) << k;
+      bit += 1;
+      if (bit === 8) {
+        bit = 0;
+        pos += 1;
+      }
+    }
+    return value;
+  };
+  const decode = (table) => {
+    let code = 0;
+    let first = 0;
+    let index = 0;
+    for (let len = 1; len <= 15; len += 1) {
+      code |= readBits(1);
+      const count = table.counts[len];
+      if (code - count < first) return table.symbols[index + (code - first)];
+      index += count;
+      first = (first + count) << 1;
+      code <<= 1;
+    }
+    throw new Error("Malformed compressed payload.");
+  };
+
+  let out = new Uint8Array(Math.max(1024, dictionary.length * 2));
+  out.set(dictionary);
+  let length = dictionary.length;
+  const push = (byte) => {
+    if (length - dictionary.length >= maxOutput) throw new Error("Compressed payload exceeds size limit.");
+    if (length === out.length) {
+      const grown = new Uint8Array(out.length * 2);
+      grown.set(out);
+      out = grown;
+    }
+    out[length] = byte;
+    length += 1;
+  };
+
+  let final = 0;
+  while (!final) {
+    final = readBits(1);
+    const type = readBits(2);
+    if (type === 0) {
+      if (bit) {
+        bit = 0;
+        pos += 1;
+      }
+      if (pos + 4 > data.length) throw new Error("Malformed compressed payload.");
+      const size = data[pos] | (data[pos + 1] << 8);
+      if ((size ^ 0xffff) !== (data[pos + 2] | (data[pos + 3] << 8))) throw new Error("Malformed compressed payload.");
+      pos += 4;
+      if (pos + size > data.length) throw new Error("Malformed compressed payload.");
+      for (let k = 0; k < size; k += 1) push(data[pos + k]);
+      pos += size;
+      continue;
+    }
+    let literals = FIXED_LITERALS;
+    let distances = FIXED_DISTANCES;
+    if (type === 2) {
+      const nlen = readBits(5) + 257;
+      const ndist = readBits(5) + 1;
+      const ncode = readBits(4) + 4;
+      const codeLengths = new Array(19).fill(0);
+      for (let k = 0; k < ncode; k += 1) codeLengths[CODE_LENGTH_ORDER[k]] = readBits(3);
+      const lengthCode = buildHuffman(codeLengths);
+      const lengths = [];
+      while (lengths.length < nlen + ndist) {
+        const symbol = decode(lengthCode);
+        if (symbol < 16) lengths.push(symbol);
+        else if (symbol === 16) {
+          if (!lengths.length) throw new Error("Malformed compressed payload.");
+          const previous = lengths[lengths.length - 1];
+          for (let r = 3 + readBits(2); r > 0; r -= 1) lengths.push(previous);
+        } else {
+          for (let r = symbol === 17 ? 3 + readBits(3) : 11 + readBits(7); r > 0; r -= 1) lengths.push(0);
+        }
+      }
+      if (lengths.length > nlen + ndist) throw new Error("Malformed compressed payload.");
+      literals = buildHuffman(lengths.slice(0, nlen));
+      distances = buildHuffman(lengths.slice(nlen));
+    } else if (type !== 1) {
+      throw new Error("Malformed compressed payload.");
+    }
+    for (;;) {
+      let symbol = decode(literals);
+      if (symbol < 256) {
+        push(symbol);
+        continue;
+      }
+      if (symbol === 256) break;
+      symbol -= 257;
+      if (symbol >= 29) throw new Error("Malformed compressed payload.");
+      const matchLength = LENGTH_BASE[symbol] + readBits(LENGTH_EXTRA[symbol]);
+      const dsym = decode(distances);
+      if (dsym >= 30) throw new Error("Malformed compressed payload.");
+      const distance = DIST_BASE[dsym] + readBits(DIST_EXTRA[dsym]);
+      if (distance > length) throw new Error("Malformed compressed payload.");
+      for (let k = 0; k < matchLength; k += 1) push(out[length - distance]);
+    }
+  }
+  return out.slice(dictionary.length, length);
+}
+
+export async function encodeCompressedPayload(payload) {
+  const raw = new TextEncoder().encode(canonicalJson(payload));
+  return `${COMPRESSED_VERSION}.${bytesToBase64url(deflateRawWithDictionary(raw))}.${await sha256Hex8(raw)}`;
+}
+
+export async function decodeCompressedPayload(token) {
+  const [version, payload, sum] = token.split(".");
+  if (version !== COMPRESSED_VERSION || !payload || !sum) throw new Error("Malformed token.");
+  const raw = inflateRawWithDictionary(base64urlToBytes(payload));
+  if ((await sha256Hex8(raw)) !== sum) throw new Error("Checksum mismatch.");
+  return JSON.parse(new TextDecoder().decode(raw));
+}
+
+export async function encodeLevelCompressed(level) {
+  const valid = validate(level);
+  if (!valid.ok) throw new Error(valid.reason);
+  const token = await encodeCompressedPayload(serialize(valid.level));
+  if (token.length > LIMITS.maxEncodedLength) {
+    throw new Error(`Encoded level too large (${token.length} chars).`);
+  }
+  return token;
+}
+
+export async function decodeCompressedToken(token) {
+  const level = deserialize(await decodeCompressedPayload(token));
+  const valid = validate(level);
+  if (!valid.ok) throw new Error(valid.reason);
+  return valid.level;
+}
+
+// Share links are `#XDZ1.<payload>.<sum>` (compressed) or legacy `#XDX1.<lzw>.<sum>`.
+export async function decodeShareHash(hash) {
+  const normalized = (hash || "").replace(/^#/, "");
+  if (normalized.startsWith(`${COMPRESSED_VERSION}.`)) {
+    return { token: normalized, level: await decodeCompressedToken(normalized) };
+  }
+  const token = parseHash(normalized);
+  return { token, level: await decodeToken(token) };
+}
@@ -1,4 +1,4 @@
-import { encodeLevel, validate, VERSION, parseHash, decodeToken } from "../core/codec.js";
+import { encodeLevelCompressed, validate, decodeShareHash } from "../core/codec.js";
 
 const canvas = document.getElementById("grid");
 const ctx = canvas.getContext("2d");
@@ -90,8 +90,8 @@ document.getElementById("generate").addEventListener("click", async () => {
   try {
     const valid = validate(model);
     if (!valid.ok) throw new Error(valid.reason);
-    const token = await encodeLevel(valid.level);
-    const url = `${location.origin}${location.pathname.replace(/\/editor\/?$/, "/play/")}#${VERSION}.${token}`;
+    const token = await encodeLevelCompressed(valid.level);
+    const url = `${location.origin}${location.pathname.replace(/\/editor\/?$/, "/play/")}#${token}`;
     output.value = url;
     status.textContent = `Valid level encoded (${token.length} chars).`;
     status.className = "ok";
@@ -113,8 +113,7 @@ document.getElementById("copy").addEventListener("click", async () => {
 async function loadFromHash() {
   if (!location.hash) return;
   try {
-    const token = parseHash(location.hash);
-    const level = await decodeToken(token);
+    const { level } = await decodeShareHash(location.hash);
     model.size = level.size;
     model.path = level.path;
     model.waves = level.waves;
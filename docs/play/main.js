@@ -1,4 +1,4 @@
-import { decodeToken, deterministicSeedFromToken, parseHash, VERSION } from "../core/codec.js";
+import { decodeShareHash, deterministicSeedFromToken } from "../core/codec.js";
 import { XodexGame } from "../core/game.js";
 
 const stats = document.getElementById("stats");
@@ -7,12 +7,11 @@ const editLink = document.getElementById("editLink");
 
 async function boot() {
   try {
-    const token = parseHash(location.hash);
-    const level = await decodeToken(token);
+    const { token, level } = await decodeShareHash(location.hash);
     const seed = deterministicSeedFromToken(token);
-    status.textContent = `Loaded ${VERSION} token. Deterministic seed ${seed}.`;
+    status.textContent = `Loaded ${location.hash.slice(1, 5)} token. Deterministic seed ${seed}.`;
 
-    editLink.href = `../editor/#${VERSION}.${token}`;
+    editLink.href = `../editor/${location.hash}`;
 
     const game = new XodexGame({ canvas: document.getElementById("game"), level, token });
     game.onState = (state) => {
@@ -0,0 +1,11 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+SRC="$ROOT_DIR/simulation/c/burzen_engine.c"
+OUT="${1:-$ROOT_DIR/simulation/c/libburzen_engine.so}"
+CC="${CC:-cc}"
+
+# Shared library for the optional ctypes backend in simulation/burzen_native.py.
+"$CC" -O2 -shared -fPIC -o "$OUT" "$SRC" -lm
+echo "Built $OUT"
@@ -0,0 +1,267 @@
+"""ctypes binding for the C SoA engine in ``c/burzen_engine.c``.
+
+Ticks go through ``burzen_step_parity``, a fixed-topology float32 engine: every
+tower pair is coupled with energy weight 0.08 and heat weight 0.05 and alpha is
+0.9. It applies the REACTION burst and the FIELD/THERMAL coupling modifiers, but
+has no tick counter or burst input, so PULSE towers and ``burst_spend`` are not
+modelled. The original ``burzen_step`` symbol, which the WASM build calls, keeps
+its own semantics. ``NativeBackend`` only dispatches ticks that match that contract and
+routes everything else through the Python reference model; on supported states
+the engine tracks ``burzen_td.burzen_step`` within ``NATIVE_PARITY_TOLERANCE``,
+which ``run_parity`` measures per tick.
+
+Build the shared library with ``scripts/build_engine_lib.sh`` or point
+``BURZEN_ENGINE_LIB`` at an existing build.
+"""
+
+from __future__ import annotations
+
+import copy
+import ctypes
+import os
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+from burzen_td import (
+    ARCHETYPE_CODE,
+    BASELINE_PARAMS,
+    BurzenTDState,
+    CouplingMatrix,
+    EigenstateDelta,
+    SimulationConfig,
+    SparseCoupling,
+    TowerArchetype,
+    burzen_step,
+    complete_coupling,
+    summarize_delta,
+)
+
+DEFAULT_LIBRARY = Path(__file__).parent / "c" / "libburzen_engine.so"
+NATIVE_ENERGY_COUPLING = 0.08
+NATIVE_HEAT_DIFFUSION = 0.05
+NATIVE_ALPHA = 0.9
+NATIVE_PARITY_TOLERANCE = 1e-3
+
+
+class _BurzenSoA(ctypes.Structure):
+    _fields_ = [
+        ("cell_count", ctypes.c_size_t),
+        ("energy", ctypes.POINTER(ctypes.c_float)),
+        ("heat", ctypes.POINTER(ctypes.c_float)),
+        ("activity", ctypes.POINTER(ctypes.c_float)),
+        ("tower_type", ctypes.POINTER(ctypes.c_int)),
+    ]
+
+
+class _NativeDelta(ctypes.Structure):
+    _fields_ = [
+        ("atp_eigenstate", ctypes.c_float),
+        ("fold_eigen_delta", ctypes.c_float),
+        ("metabolic_eigen_delta", ctypes.c_float),
+        ("stress_eigen_delta", ctypes.c_float),
+        ("lysosome_pruning_delta", ctypes.c_float),
+    ]
+
+
+def load_library(path: str | os.PathLike[str] | None = None) -> ctypes.CDLL | None:
+    """Load the engine from ``path``, ``$BURZEN_ENGINE_LIB`` or the default build location."""
+
+    candidate = Path(path or os.environ.get("BURZEN_ENGINE_LIB") or DEFAULT_LIBRARY)
+    try:
+        lib = ctypes.CDLL(str(candidate))
+    except OSError:
+        return None
+    lib.burzen_init.argtypes = [ctypes.POINTER(_BurzenSoA), ctypes.c_size_t]
+    lib.burzen_init.restype = None
+    lib.burzen_destroy.argtypes = [ctypes.POINTER(_BurzenSoA)]
+    lib.burzen_destroy.restype = None
+    lib.burzen_step.argtypes = [ctypes.POINTER(_BurzenSoA), ctypes.c_float]
+    lib.burzen_step.restype = _NativeDelta
+    lib.burzen_step_parity.argtypes = [ctypes.POINTER(_BurzenSoA), ctypes.c_float]
+    lib.burzen_step_parity.restype = _NativeDelta
+    return lib
+
+
+def _copy_in(target: ctypes.POINTER(ctypes.c_float), values: list[float]) -> None:
+    data = array("f", values)
+    ctypes.memmove(target, data.buffer_info()[0], len(data) * data.itemsize)
+
+
+def _copy_out(source: ctypes.POINTER(ctypes.c_float), n: int) -> list[float]:
+    data = array("f", bytes(n * 4))
+    ctypes.memmove(data.buffer_info()[0], source, n * data.itemsize)
+    return data.tolist()
+
+
+class NativeBoard:
+    """One ``BurzenSoA`` owned by the C allocator, sized for a tower count."""
+
+    def __init__(self, lib: ctypes.CDLL, n: int) -> None:
+        self._lib = lib
+        self.soa = _BurzenSoA()
+        self.size = n
+        lib.burzen_init(ctypes.byref(self.soa), n)
+
+    def load(self, state: BurzenTDState) -> None:
+        towers = state.towers
+        _copy_in(self.soa.energy, [t.energy for t in towers])
+        _copy_in(self.soa.heat, [t.heat for t in towers])
+        _copy_in(self.soa.activity, [t.activity for t in towers])
+        codes = array("i", [ARCHETYPE_CODE[t.archetype] for t in towers])
+        ctypes.memmove(self.soa.tower_type, codes.buffer_info()[0], len(codes) * codes.itemsize)
+
+    def step(self, dt: float) -> None:
+        self._lib.burzen_step_parity(ctypes.byref(self.soa), dt)
+
+    def energies(self) -> list[float]:
+        return _copy_out(self.soa.energy, self.size)
+
+    def heats(self) -> list[float]:
+        return _copy_out(self.soa.heat, self.size)
+
+    def close(self) -> None:
+        if self.soa.cell_count:
+            self._lib.burzen_destroy(ctypes.byref(self.soa))
+
+    def __del__(self) -> None:
+        self.close()
+
+
+def _is_native_graph(matrix: CouplingMatrix, n: int, weight: float) -> bool:
+    expected = complete_coupling(n, weight)
+    if matrix is expected:
+        return True
+    sparse = matrix if isinstance(matrix, SparseCoupling) else SparseCoupling.from_dense(matrix)
+    return sparse == expected
+
+
+class NativeBackend:
+    name = "native"
+
+    def __init__(self, lib: ctypes.CDLL) -> None:
+        self._lib = lib
+        self._board: NativeBoard | None = None
+        self._graph: tuple[CouplingMatrix, CouplingMatrix, int, bool] | None = None
+        self.native_ticks = 0
+        self.fallback_ticks = 0
+
+    def supports(
+        self,
+        state: BurzenTDState,
+        couplings: CouplingMatrix,
+        heat_diffusion: CouplingMatrix,
+        config: SimulationConfig,
+    ) -> bool:
+        n = len(state.towers)
+        return (
+            n > 0
+            and config.alpha == NATIVE_ALPHA
+            and all(t.archetype != TowerArchetype.PULSE and t.burst_spend == 0.0 for t in state.towers)
+            and self._native_graph(couplings, heat_diffusion, n)
+        )
+
+    def _native_graph(self, couplings: CouplingMatrix, heat_diffusion: CouplingMatrix, n: int) -> bool:
+        """Check the coupling topology once per coupling objects, as ``TickPlan.matches`` does."""
+
+        graph = self._graph
+        if graph is None or graph[0] is not couplings or graph[1] is not heat_diffusion or graph[2] != n:
+            native = _is_native_graph(couplings, n, NATIVE_ENERGY_COUPLING) and _is_native_graph(
+                heat_diffusion, n, NATIVE_HEAT_DIFFUSION
+            )
+            graph = self._graph = (couplings, heat_diffusion, n, native)
+        return graph[3]
+
+    def step(
+        self,
+        state: BurzenTDState,
+        couplings: CouplingMatrix,
+        heat_diffusion: CouplingMatrix,
+        config: SimulationConfig = SimulationConfig(),
+    ) -> EigenstateDelta:
+        if not self.supports(state, couplings, heat_diffusion, config):
+            self.fallback_ticks += 1
+            return burzen_step(state, couplings, heat_diffusion, config)
+
+        n = len(state.towers)
+        if self._board is None or self._board.size != n:
+            if self._board is not None:
+                self._board.close()
+            self._board = NativeBoard(self._lib, n)
+        self._board.load(state)
+        self._board.step(config.dt)
+        next_energy = self._board.energies()
+        next_heat = self._board.heats()
+
+        instability_count = 0
+        for tower, e, h in zip(state.towers, next_energy, next_heat):
+            params = BASELINE_PARAMS[tower.archetype]
+            overflow_ratio = max(0.0, (h - params.theta) / max(params.theta, 1e-9))
+            ticks = tower.instability_ticks + 1 if config.beta * (overflow_ratio**2) > config.instability_threshold else 0
+            tower.instability_ticks = ticks
+            if ticks >= config.instability_consecutive_ticks:
+                instability_count += 1
+            tower.energy = e
+            tower.heat = h
+        state.tick += 1
+        self.native_ticks += 1
+        return summarize_delta(state.tick, next_energy, next_heat, instability_count)
+
+
+def load_native_backend(path: str | os.PathLike[str] | None = None) -> NativeBackend | None:
+    lib = load_library(path)
+    return NativeBackend(lib) if lib is not None else None
+
+
+@dataclass(frozen=True)
+class ParityTick:
+    tick: int
+    max_energy_diff: float
+    max_heat_diff: float
+    delta_diffs: dict[str, float]
+
+    @property
+    def worst(self) -> float:
+        return max(self.max_energy_diff, self.max_heat_diff, *self.delta_diffs.values())
+
+
+def run_parity(
+    state: BurzenTDState,
+    ticks: int,
+    config: SimulationConfig = SimulationConfig(),
+    backend: NativeBackend | None = None,
+) -> list[ParityTick]:
+    """Step copies of ``state`` on both backends and report per-tick divergence.
+
+    Uses the native engine's fixed all-pairs couplings so every tick of a
+    supported state is dispatched to C; raises ``RuntimeError`` when no library
+    can be loaded.
+    """
+
+    backend = backend or load_native_backend()
+    if backend is None:
+        raise RuntimeError("Native engine library is not available")
+    n = len(state.towers)
+    couplings = complete_coupling(n, NATIVE_ENERGY_COUPLING)
+    heat_diffusion = complete_coupling(n, NATIVE_HEAT_DIFFUSION)
+    config = copy.copy(config)
+    config.alpha = NATIVE_ALPHA
+
+    reference = copy.deepcopy(state)
+    native = copy.deepcopy(state)
+    report: list[ParityTick] = []
+    for _ in range(ticks):
+        expected = burzen_step(reference, couplings, heat_diffusion, config)
+        actual = backend.step(native, couplings, heat_diffusion, config)
+        report.append(
+            ParityTick(
+                tick=expected.tick,
+                max_energy_diff=max(abs(a.energy - b.energy) for a, b in zip(native.towers, reference.towers)),
+                max_heat_diff=max(abs(a.heat - b.heat) for a, b in zip(native.towers, reference.towers)),
+                delta_diffs={
+                    name: abs(getattr(actual, name) - getattr(expected, name))
+                    for name in ("energy_lambda2", "energy_lambda3", "heat_mean", "heat_std", "heat_q95")
+                },
+            )
+        )
+    return report
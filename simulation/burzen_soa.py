@@ -0,0 +1,693 @@
+"""Struct-of-arrays NumPy backend for the BURZEN TD v1.0 tick.
+
+Mirrors the ``BurzenSoA`` layout from ``c/burzen_engine.h``: per-tower fields
+live in contiguous arrays and the neighbour energy/heat exchange is computed as
+matrix-vector products instead of the nested i/j loop in ``burzen_td``.
+Results match ``burzen_td.burzen_step`` within ``SOA_PARITY_TOLERANCE``.
+
+``BurzenEnsembleState`` batches K independent boards as (K, n) arrays so balance
+sweeps over configs, loadouts and starting energies step together.
+``LaplacianSpectrum`` optionally replaces the sorted-energy proxies with the
+coupling graph's algebraic connectivity and Fiedler split. ``wave_log_strengths``
+evaluates the counter-based infinite-wave schedule for a whole range at once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from array import array
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Callable, Sequence
+
+import numpy as np
+
+from burzen_checkpoint import BurzenCheckpoint
+from burzen_td import (
+    ARCHETYPE_CODE,
+    ARCHETYPE_ORDER,
+    BASELINE_PARAMS,
+    LOG_WAVE_GROWTH,
+    BurzenTDState,
+    EigenstateDelta,
+    SimulationConfig,
+    SparseCoupling,
+    TowerArchetype,
+    TowerState,
+)
+
+if TYPE_CHECKING:
+    from streaming_stats import HeatRunAccumulator
+
+# Absolute tolerance for every EigenstateDelta float field versus the reference
+# path. The only divergence is summation order inside the matrix products.
+SOA_PARITY_TOLERANCE = 1e-6
+
+_PARAM_TABLE = np.array(
+    [
+        [p.g, p.c, p.eta, p.gamma, p.rho, p.theta, p.e_max, p.h_max]
+        for p in (BASELINE_PARAMS[a] for a in ARCHETYPE_ORDER)
+    ],
+    dtype=np.float64,
+)
+_G, _C, _ETA, _GAMMA, _RHO, _THETA, _E_MAX, _H_MAX = range(8)
+
+_PULSE = ARCHETYPE_CODE[TowerArchetype.PULSE]
+_REACTION = ARCHETYPE_CODE[TowerArchetype.REACTION]
+_FIELD = ARCHETYPE_CODE[TowerArchetype.FIELD]
+_THERMAL = ARCHETYPE_CODE[TowerArchetype.THERMAL]
+
+
+@dataclass
+class BurzenSoAState:
+    archetype: np.ndarray
+    energy: np.ndarray
+    heat: np.ndarray
+    activity: np.ndarray
+    burst_spend: np.ndarray
+    instability_ticks: np.ndarray
+    tick: int = 0
+
+    def __len__(self) -> int:
+        return int(self.archetype.shape[0])
+
+    @classmethod
+    def from_state(cls, state: BurzenTDState) -> "BurzenSoAState":
+        towers = state.towers
+        return cls(
+            archetype=np.array([ARCHETYPE_CODE[t.archetype] for t in towers], dtype=np.int8),
+            energy=np.array([t.energy for t in towers], dtype=np.float64),
+            heat=np.array([t.heat for t in towers], dtype=np.float64),
+            activity=np.array([t.activity for t in towers], dtype=np.float64),
+            burst_spend=np.array([t.burst_spend for t in towers], dtype=np.float64),
+            instability_ticks=np.array([t.instability_ticks for t in towers], dtype=np.int64),
+            tick=state.tick,
+        )
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: BurzenCheckpoint) -> "BurzenSoAState":
+        return cls(
+            archetype=np.frombuffer(checkpoint.archetype, dtype=np.uint8).astype(np.int8),
+            energy=np.frombuffer(checkpoint.energy, dtype=np.float64).copy(),
+            heat=np.frombuffer(checkpoint.heat, dtype=np.float64).copy(),
+            activity=np.frombuffer(checkpoint.activity, dtype=np.float64).copy(),
+            burst_spend=np.frombuffer(checkpoint.burst_spend, dtype=np.float64).copy(),
+            instability_ticks=np.frombuffer(checkpoint.instability_ticks, dtype=np.int64).copy(),
+            tick=checkpoint.tick,
+        )
+
+    def to_checkpoint(self) -> BurzenCheckpoint:
+        def column(typecode: str, values: np.ndarray, dtype: type) -> array:
+            out = array(typecode)
+            out.frombytes(np.ascontiguousarray(values, dtype=dtype).tobytes())
+            return out
+
+        return BurzenCheckpoint(
+            tick=self.tick,
+            archetype=column("B", self.archetype, np.uint8),
+            energy=column("d", self.energy, np.float64),
+            heat=column("d", self.heat, np.float64),
+            activity=column("d", self.activity, np.float64),
+            burst_spend=column("d", self.burst_spend, np.float64),
+            instability_ticks=column("q", self.instability_ticks, np.int64),
+        )
+
+    def to_state(self) -> BurzenTDState:
+        towers = [
+            TowerState(
+                archetype=ARCHETYPE_ORDER[int(code)],
+                energy=float(e),
+                heat=float(h),
+                activity=float(a),
+                burst_spend=float(b),
+                instability_ticks=int(k),
+            )
+            for code, e, h, a, b, k in zip(
+                self.archetype,
+                self.energy,
+                self.heat,
+                self.activity,
+                self.burst_spend,
+                self.instability_ticks,
+            )
+        ]
+        return BurzenTDState(towers=towers, tick=self.tick)
+
+
+@dataclass(frozen=True)
+class CSRArrays:
+    """Array form of a ``SparseCoupling`` with precomputed non-empty row starts and degrees."""
+
+    rows: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    starts: np.ndarray
+    filled_rows: np.ndarray
+    degree: np.ndarray
+    size: int
+
+    @classmethod
+    def from_sparse(cls, coupling: SparseCoupling) -> "CSRArrays":
+        indptr = np.asarray(coupling.indptr, dtype=np.int64)
+        weights = np.asarray(coupling.weights, dtype=np.float64)
+        rows = np.repeat(np.arange(coupling.size, dtype=np.int64), np.diff(indptr))
+        return cls(
+            rows=rows,
+            indices=np.asarray(coupling.indices, dtype=np.int64),
+            weights=weights,
+            starts=indptr[:-1][indptr[:-1] != indptr[1:]],
+            filled_rows=indptr[:-1] != indptr[1:],
+            degree=np.bincount(rows, weights=weights, minlength=coupling.size),
+            size=coupling.size,
+        )
+
+    def exchange(self, values: np.ndarray) -> np.ndarray:
+        if self.weights.shape[0] == 0:
+            return np.zeros_like(values)
+        # Segment sums over the non-empty CSR rows only: their starts are strictly
+        # increasing, so each segment ends exactly where the next filled row
+        # begins (or at the end), and empty rows simply stay zero.
+        pulled = np.zeros_like(values)
+        pulled[..., self.filled_rows] = np.add.reduceat(
+            values[..., self.indices] * self.weights, self.starts, axis=-1
+        )
+        return pulled - self.degree * values
+
+
+@dataclass(frozen=True)
+class DenseArrays:
+    """Dense coupling with a zeroed diagonal and precomputed row sums."""
+
+    matrix: np.ndarray
+    degree: np.ndarray
+    size: int
+
+    @classmethod
+    def from_dense(cls, matrix: object) -> "DenseArrays":
+        dense = np.array(matrix, dtype=np.float64)
+        if dense.ndim != 2 or dense.shape[0] != dense.shape[1]:
+            raise ValueError(f"Coupling matrix must be square, got {dense.shape}")
+        np.fill_diagonal(dense, 0.0)
+        return cls(matrix=dense, degree=dense.sum(axis=1), size=dense.shape[0])
+
+    def exchange(self, values: np.ndarray) -> np.ndarray:
+        # sum_j w_ij (v_j - v_i) == (W v)_i - (sum_j w_ij) v_i
+        return values @ self.matrix.T - self.degree * values
+
+
+def prepare_coupling(matrix: object) -> CSRArrays | DenseArrays:
+    """Convert a coupling once so repeated ticks skip the per-call conversion."""
+
+    if isinstance(matrix, (CSRArrays, DenseArrays)):
+        return matrix
+    if isinstance(matrix, SparseCoupling):
+        return CSRArrays.from_sparse(matrix)
+    return DenseArrays.from_dense(matrix)
+
+
+def _exchange(matrix: object, values: np.ndarray) -> np.ndarray:
+    """Return ``sum_j w_ij (v_j - v_i)`` along the last axis of ``values``.
+
+    ``values`` may be one board (n,) or an ensemble batch (K, n) sharing the
+    same graph.
+    """
+
+    prepared = prepare_coupling(matrix)
+    n = values.shape[-1]
+    if prepared.size != n:
+        raise ValueError(f"Coupling graph must cover {n} towers, got {prepared.size}")
+    return prepared.exchange(values)
+
+
+def _advance(
+    codes: np.ndarray,
+    energy: np.ndarray,
+    heat: np.ndarray,
+    activity: np.ndarray,
+    burst_spend: np.ndarray,
+    instability_ticks: np.ndarray,
+    tick: object,
+    couplings: object,
+    heat_diffusion: object,
+    dt: object,
+    alpha: object,
+    beta: object,
+    instability_threshold: object,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Shared tick kernel; scalars broadcast per board, (K, 1) columns per member."""
+
+    params = _PARAM_TABLE[codes]
+    theta = params[..., _THETA]
+
+    pulse_on = np.where(np.asarray(tick) % 3 == 0, 1.0, 0.0)
+    activity = np.where(codes == _PULSE, pulse_on, activity)
+    reaction_burst = np.where((codes == _REACTION) & (heat > 0.8 * theta), 4.0, 0.0)
+
+    overflow = np.maximum(0.0, (heat - theta) / np.maximum(theta, 1e-9))
+    eta_eff = params[..., _ETA] * np.exp(-alpha * overflow)
+    p_gen = activity * params[..., _G] * eta_eff
+    p_use = activity * params[..., _C] + burst_spend + reaction_burst
+
+    neighbor_energy = _exchange(couplings, energy)
+    neighbor_heat = _exchange(heat_diffusion, heat)
+    neighbor_energy = np.where(codes == _FIELD, neighbor_energy * 1.15, neighbor_energy)
+    neighbor_heat = np.where(codes == _THERMAL, neighbor_heat * 1.10, neighbor_heat)
+
+    next_energy = np.clip(energy + dt * (p_gen - p_use + neighbor_energy), 0.0, params[..., _E_MAX])
+    next_heat = np.clip(
+        heat + dt * (params[..., _GAMMA] * p_use + neighbor_heat - params[..., _RHO] * heat),
+        0.0,
+        params[..., _H_MAX],
+    )
+
+    overflow_ratio = np.maximum(0.0, (next_heat - theta) / np.maximum(theta, 1e-9))
+    hazard = beta * overflow_ratio**2
+    next_ticks = np.where(hazard > instability_threshold, instability_ticks + 1, 0)
+    return next_energy, next_heat, next_ticks
+
+
+def _summary_arrays(energy: np.ndarray, heat: np.ndarray) -> tuple[np.ndarray, ...]:
+    """EigenstateDelta statistics along the tower axis using O(n) partitions."""
+
+    n = energy.shape[-1]
+    low = np.partition(energy, tuple(range(min(3, n))), axis=-1)
+    q_idx = min(n - 1, max(0, int(np.ceil(0.95 * n)) - 1))
+    energy_mean = energy.mean(axis=-1, keepdims=True)
+    heat_mean = heat.mean(axis=-1, keepdims=True)
+    return (
+        low[..., 1] if n > 1 else low[..., 0],
+        low[..., 2] if n > 2 else energy.max(axis=-1),
+        np.count_nonzero(energy >= energy_mean, axis=-1) / n,
+        heat_mean[..., 0],
+        np.sqrt(np.mean((heat - heat_mean) ** 2, axis=-1)),
+        np.partition(heat, q_idx, axis=-1)[..., q_idx],
+    )
+
+
+def summarize_soa(tick: int, energy: np.ndarray, heat: np.ndarray, instability_count: int) -> EigenstateDelta:
+    if energy.shape[0] == 0:
+        return EigenstateDelta(tick, 0.0, 0.0, 0.5, 0.0, 0.0, 0.0, instability_count)
+    lambda2, lambda3, balance, heat_mean, heat_std, heat_q95 = _summary_arrays(energy, heat)
+    return EigenstateDelta(
+        tick=tick,
+        energy_lambda2=float(lambda2),
+        energy_lambda3=float(lambda3),
+        fiedler_sign_balance=float(balance),
+        heat_mean=float(heat_mean),
+        heat_std=float(heat_std),
+        heat_q95=float(heat_q95),
+        instability_count=instability_count,
+    )
+
+
+class LaplacianSpectrum:
+    """Opt-in algebraic connectivity of the coupling graph, cached across ticks.
+
+    Uses the symmetrized Laplacian ``L = D - (W + W^T) / 2``. The two smallest
+    eigenpairs orthogonal to the constant vector come from a block LOBPCG solve
+    warm-started with the previous tick's vectors, and are only recomputed when
+    the coupling weights change. Boards up to ``dense_limit`` towers use a
+    direct dense eigensolve instead.
+    """
+
+    def __init__(self, tolerance: float = 1e-6, max_iterations: int = 400, dense_limit: int = 48) -> None:
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.dense_limit = dense_limit
+        self.solves = 0
+        self.iterations = 0
+        self._source: object = None
+        self._fingerprint: bytes | None = None
+        self._vectors: np.ndarray | None = None
+        self._values = (0.0, 0.0, 0.5)
+
+    def update(self, coupling: object) -> tuple[float, float, float]:
+        """Return ``(lambda2, lambda3, fiedler_sign_balance)`` for ``coupling``."""
+
+        # SparseCoupling is immutable, so seeing the same object again is a hit.
+        if isinstance(coupling, SparseCoupling) and coupling is self._source:
+            return self._values
+        prepared = prepare_coupling(coupling)
+        fingerprint = _coupling_fingerprint(prepared)
+        self._source = coupling
+        if fingerprint == self._fingerprint:
+            return self._values
+        self._fingerprint = fingerprint
+        self._values = self._solve(prepared)
+        self.solves += 1
+        return self._values
+
+    def _solve(self, prepared: CSRArrays | DenseArrays) -> tuple[float, float, float]:
+        n = prepared.size
+        if n < 2:
+            self._vectors = None
+            return (0.0, 0.0, 0.5)
+        laplacian, scale = _laplacian_operator(prepared)
+        if n <= self.dense_limit:
+            values, vectors = np.linalg.eigh(laplacian(np.eye(n)))
+            values, vectors = values[1:3], vectors[:, 1:3]
+        else:
+            values, vectors = self._lobpcg(laplacian, n, scale)
+        self._vectors = vectors
+        lambda2 = float(max(values[0], 0.0))
+        lambda3 = float(max(values[-1], 0.0))
+        fiedler = vectors[:, 0]
+        if fiedler[np.argmax(np.abs(fiedler))] < 0:
+            fiedler = -fiedler
+        return (lambda2, lambda3, float(np.count_nonzero(fiedler >= 0.0) / n))
+
+    def _lobpcg(self, laplacian: Callable[[np.ndarray], np.ndarray], n: int, scale: float) -> tuple[np.ndarray, np.ndarray]:
+        block = 2
+        if self._vectors is not None and self._vectors.shape == (n, block):
+            x = self._vectors.copy()
+        else:
+            x = np.random.default_rng(0).standard_normal((n, block))
+        x = _orthonormal(_deflate(x))
+        p: np.ndarray | None = None
+        threshold = self.tolerance * max(scale, 1e-12)
+        for _ in range(self.max_iterations):
+            ax = laplacian(x)
+            ritz = np.einsum("ij,ij->j", x, ax)
+            residual = _deflate(ax - x * ritz)
+            self.iterations += 1
+            if np.linalg.norm(residual, axis=0).max() <= threshold:
+                break
+            search = residual if p is None else np.hstack([residual, p])
+            for _ in range(2):
+                search = search - x @ (x.T @ search)
+            q = np.hstack([x, _orthonormal(_deflate(search))])
+            values, coords = np.linalg.eigh(q.T @ laplacian(q))
+            x_next = q @ coords[:, :block]
+            p = x_next - x @ (x.T @ x_next)
+            x = x_next
+        values, coords = np.linalg.eigh(x.T @ laplacian(x))
+        return values, x @ coords
+
+
+def _coupling_fingerprint(prepared: CSRArrays | DenseArrays) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(prepared, CSRArrays):
+        digest.update(prepared.rows.tobytes())
+        digest.update(prepared.indices.tobytes())
+        digest.update(prepared.weights.tobytes())
+    else:
+        digest.update(prepared.matrix.tobytes())
+    return digest.digest()
+
+
+def _laplacian_operator(prepared: CSRArrays | DenseArrays) -> tuple[Callable[[np.ndarray], np.ndarray], float]:
+    """Block matvec for the symmetrized Laplacian plus its Gershgorin spectral bound."""
+
+    n = prepared.size
+    if isinstance(prepared, DenseArrays):
+        sym = 0.5 * (prepared.matrix + prepared.matrix.T)
+        degree = sym.sum(axis=1)
+        return (lambda block: degree[:, None] * block - sym @ block), 2.0 * float(np.abs(degree).max())
+
+    rows = np.concatenate([prepared.rows, prepared.indices])
+    cols = np.concatenate([prepared.indices, prepared.rows])
+    weights = 0.5 * np.concatenate([prepared.weights, prepared.weights])
+    degree = np.bincount(rows, weights=weights, minlength=n)
+
+    def apply(block: np.ndarray) -> np.ndarray:
+        pulled = weights[:, None] * block[cols]
+        out = np.column_stack([np.bincount(rows, weights=pulled[:, k], minlength=n) for k in range(block.shape[1])])
+        return degree[:, None] * block - out
+
+    return apply, 2.0 * float(np.abs(degree).max()) if n else 0.0
+
+
+def _deflate(block: np.ndarray) -> np.ndarray:
+    # Remove the constant null vector of L so the solver targets lambda2/lambda3.
+    return block - block.mean(axis=0, keepdims=True)
+
+
+def _orthonormal(block: np.ndarray) -> np.ndarray:
+    # QR keeps full precision (a Gram-matrix factorization stalls near sqrt(eps));
+    # near-dependent directions are dropped before Rayleigh-Ritz.
+    q, r = np.linalg.qr(block)
+    diag = np.abs(np.diag(r))
+    return q[:, diag > 1e-10 * max(1.0, float(diag.max(initial=0.0)))]
+
+
+def _advance_soa(
+    state: BurzenSoAState,
+    couplings: object,
+    heat_diffusion: object,
+    config: SimulationConfig,
+) -> int:
+    if len(state):
+        state.energy, state.heat, state.instability_ticks = _advance(
+            state.archetype,
+            state.energy,
+            state.heat,
+            state.activity,
+            state.burst_spend,
+            state.instability_ticks,
+            state.tick,
+            couplings,
+            heat_diffusion,
+            config.dt,
+            config.alpha,
+            config.beta,
+            config.instability_threshold,
+        )
+    state.tick += 1
+    return int(np.count_nonzero(state.instability_ticks >= config.instability_consecutive_ticks))
+
+
+def _with_spectrum(delta: EigenstateDelta, spectrum: LaplacianSpectrum | None, couplings: object) -> EigenstateDelta:
+    if spectrum is None:
+        return delta
+    lambda2, lambda3, balance = spectrum.update(couplings)
+    return replace(delta, energy_lambda2=lambda2, energy_lambda3=lambda3, fiedler_sign_balance=balance)
+
+
+def burzen_step_soa(
+    state: BurzenSoAState,
+    couplings: object,
+    heat_diffusion: object,
+    config: SimulationConfig = SimulationConfig(),
+    spectrum: LaplacianSpectrum | None = None,
+) -> EigenstateDelta:
+    """Vectorized ``burzen_step``.
+
+    ``couplings``/``heat_diffusion`` may be n×n array-likes, ``SparseCoupling``
+    or the output of ``prepare_coupling`` (cheapest when reused across ticks).
+    Passing a ``LaplacianSpectrum`` replaces the energy_lambda2/energy_lambda3/
+    fiedler_sign_balance proxies with the coupling graph's real spectrum.
+    """
+
+    instability_count = _advance_soa(state, couplings, heat_diffusion, config)
+    delta = summarize_soa(state.tick, state.energy, state.heat, instability_count)
+    return _with_spectrum(delta, spectrum, couplings)
+
+
+def run_soa(
+    state: BurzenSoAState,
+    couplings: object,
+    heat_diffusion: object,
+    ticks: int,
+    config: SimulationConfig = SimulationConfig(),
+    *,
+    stride: int | None = None,
+    until: Callable[[EigenstateDelta], bool] | None = None,
+    heat_stats: HeatRunAccumulator | None = None,
+    spectrum: LaplacianSpectrum | None = None,
+) -> list[EigenstateDelta]:
+    """Array-backed ``burzen_td.run``; couplings are prepared once for the whole run."""
+
+    if ticks < 0:
+        raise ValueError("ticks must be non-negative")
+    if stride is not None and stride <= 0:
+        raise ValueError("stride must be positive")
+
+    couplings = prepare_coupling(couplings)
+    heat_diffusion = prepare_coupling(heat_diffusion)
+    samples: list[EigenstateDelta] = []
+    for step in range(1, ticks + 1):
+        instability_count = _advance_soa(state, couplings, heat_diffusion, config)
+        if heat_stats is not None:
+            heat_stats.update(state.heat.tolist())
+        if step != ticks and (stride is None or step % stride):
+            continue
+        delta = summarize_soa(state.tick, state.energy, state.heat, instability_count)
+        samples.append(_with_spectrum(delta, spectrum, couplings))
+        if until is not None and until(samples[-1]):
+            break
+    return samples
+
+
+@dataclass
+class EnsembleConfig:
+    """Per-member ``SimulationConfig`` fields as (K, 1) columns for broadcasting."""
+
+    dt: np.ndarray
+    alpha: np.ndarray
+    beta: np.ndarray
+    instability_threshold: np.ndarray
+    instability_consecutive_ticks: np.ndarray
+    safe_heat_q95: np.ndarray
+
+    @classmethod
+    def from_configs(cls, configs: Sequence[SimulationConfig]) -> "EnsembleConfig":
+        def column(name: str, dtype: type = np.float64) -> np.ndarray:
+            return np.array([getattr(c, name) for c in configs], dtype=dtype).reshape(-1, 1)
+
+        return cls(
+            dt=column("dt"),
+            alpha=column("alpha"),
+            beta=column("beta"),
+            instability_threshold=column("instability_threshold"),
+            instability_consecutive_ticks=column("instability_consecutive_ticks", np.int64),
+            safe_heat_q95=column("safe_heat_q95"),
+        )
+
+
+@dataclass
+class BurzenEnsembleState:
+    """K independent boards with the same tower count, stored as (K, n) arrays."""
+
+    archetype: np.ndarray
+    energy: np.ndarray
+    heat: np.ndarray
+    activity: np.ndarray
+    burst_spend: np.ndarray
+    instability_ticks: np.ndarray
+    tick: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.archetype.shape[0])
+
+    @property
+    def tower_count(self) -> int:
+        return int(self.archetype.shape[1])
+
+    @classmethod
+    def from_states(cls, states: Sequence[BurzenTDState]) -> "BurzenEnsembleState":
+        if not states:
+            raise ValueError("Ensemble requires at least one member state")
+        members = [BurzenSoAState.from_state(s) for s in states]
+        if len({len(m) for m in members}) != 1:
+            raise ValueError("Ensemble members must have the same tower count")
+        return cls(
+            archetype=np.stack([m.archetype for m in members]),
+            energy=np.stack([m.energy for m in members]),
+            heat=np.stack([m.heat for m in members]),
+            activity=np.stack([m.activity for m in members]),
+            burst_spend=np.stack([m.burst_spend for m in members]),
+            instability_ticks=np.stack([m.instability_ticks for m in members]),
+            tick=np.array([m.tick for m in members], dtype=np.int64),
+        )
+
+    def member(self, k: int) -> BurzenSoAState:
+        return BurzenSoAState(
+            archetype=self.archetype[k].copy(),
+            energy=self.energy[k].copy(),
+            heat=self.heat[k].copy(),
+            activity=self.activity[k].copy(),
+            burst_spend=self.burst_spend[k].copy(),
+            instability_ticks=self.instability_ticks[k].copy(),
+            tick=int(self.tick[k]),
+        )
+
+    def to_states(self) -> list[BurzenTDState]:
+        return [self.member(k).to_state() for k in range(len(self))]
+
+
+@dataclass(frozen=True)
+class EnsembleDelta:
+    """Batched ``EigenstateDelta``: every field is a (K,) array."""
+
+    tick: np.ndarray
+    energy_lambda2: np.ndarray
+    energy_lambda3: np.ndarray
+    fiedler_sign_balance: np.ndarray
+    heat_mean: np.ndarray
+    heat_std: np.ndarray
+    heat_q95: np.ndarray
+    instability_count: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.tick.shape[0])
+
+    def member(self, k: int) -> EigenstateDelta:
+        return EigenstateDelta(
+            tick=int(self.tick[k]),
+            energy_lambda2=float(self.energy_lambda2[k]),
+            energy_lambda3=float(self.energy_lambda3[k]),
+            fiedler_sign_balance=float(self.fiedler_sign_balance[k]),
+            heat_mean=float(self.heat_mean[k]),
+            heat_std=float(self.heat_std[k]),
+            heat_q95=float(self.heat_q95[k]),
+            instability_count=int(self.instability_count[k]),
+        )
+
+
+def burzen_step_ensemble(
+    ensemble: BurzenEnsembleState,
+    couplings: object,
+    heat_diffusion: object,
+    configs: EnsembleConfig | Sequence[SimulationConfig] | SimulationConfig = SimulationConfig(),
+) -> EnsembleDelta:
+    """Advance every member one tick over a shared coupling graph.
+
+    ``configs`` is one ``SimulationConfig`` for all members, a sequence with one
+    per member, or a prebuilt ``EnsembleConfig`` (cheapest across ticks).
+    """
+
+    k = len(ensemble)
+    if isinstance(configs, SimulationConfig):
+        configs = [configs] * k
+    if not isinstance(configs, EnsembleConfig):
+        configs = EnsembleConfig.from_configs(configs)
+    if configs.dt.shape[0] != k:
+        raise ValueError(f"Expected {k} member configs, got {configs.dt.shape[0]}")
+
+    if ensemble.tower_count == 0:
+        ensemble.tick += 1
+        zeros = np.zeros(k)
+        return EnsembleDelta(ensemble.tick.copy(), zeros, zeros, zeros + 0.5, zeros, zeros, zeros, np.zeros(k, np.int64))
+
+    ensemble.energy, ensemble.heat, ensemble.instability_ticks = _advance(
+        ensemble.archetype,
+        ensemble.energy,
+        ensemble.heat,
+        ensemble.activity,
+        ensemble.burst_spend,
+        ensemble.instability_ticks,
+        ensemble.tick[:, None],
+        couplings,
+        heat_diffusion,
+        configs.dt,
+        configs.alpha,
+        configs.beta,
+        configs.instability_threshold,
+    )
+    instability_count = np.count_nonzero(ensemble.instability_ticks >= configs.instability_consecutive_ticks, axis=1)
+    ensemble.tick += 1
+    return EnsembleDelta(ensemble.tick.copy(), *_summary_arrays(ensemble.energy, ensemble.heat), instability_count)
+
+
+_SPLITMIX_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_SPLITMIX_M1 = np.uint64(0xBF58476D1CE4E5B9)
+_SPLITMIX_M2 = np.uint64(0x94D049BB133111EB)
+
+
+def _splitmix64_array(x: np.ndarray) -> np.ndarray:
+    x = x + _SPLITMIX_GAMMA
+    x = (x ^ (x >> np.uint64(30))) * _SPLITMIX_M1
+    x = (x ^ (x >> np.uint64(27))) * _SPLITMIX_M2
+    return x ^ (x >> np.uint64(31))
+
+
+def wave_log_strengths(seed: int, start: int, count: int, entropy: float = 0.2) -> np.ndarray:
+    """Array form of ``burzen_td.log_waves``; uint64 arithmetic wraps exactly like the mask."""
+
+    if count < 0:
+        raise ValueError("count must be non-negative")
+    mask = (1 << 64) - 1
+    seed_key = _splitmix64_array(np.array([seed & mask], dtype=np.uint64))
+    index = np.arange(count, dtype=np.int64) + start
+    bits = _splitmix64_array(seed_key ^ index.astype(np.uint64)) >> np.uint64(11)
+    unit = bits.astype(np.float64) / 9007199254740992.0
+    return np.maximum(index - 1, 0) * LOG_WAVE_GROWTH + np.log(1.0 + entropy * (2.0 * unit - 1.0))
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import heapq
 import math
+import os
 import random
+import warnings
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Sequence
+
+if TYPE_CHECKING:
+    from burzen_native import NativeBackend
+    from streaming_stats import HeatRunAccumulator
 
 
 class TowerArchetype(str, Enum):
@@ -17,6 +26,11 @@ class TowerArchetype(str, Enum):
     CONTROL = "control"
 
 
+# Stable integer codes for array/binary layouts; enum order matches ``TowerArchetype`` in c/burzen_engine.h.
+ARCHETYPE_ORDER: tuple[TowerArchetype, ...] = tuple(TowerArchetype)
+ARCHETYPE_CODE: dict[TowerArchetype, int] = {a: i for i, a in enumerate(ARCHETYPE_ORDER)}
+
+
 @dataclass(frozen=True)
 class TowerParams:
     g: float
@@ -79,6 +93,92 @@ class BurzenTDState:
     tick: int = 0
 
 
+@dataclass(frozen=True)
+class SparseCoupling:
+    """CSR neighbour weights: row ``i`` is ``indices/weights[indptr[i]:indptr[i + 1]]``."""
+
+    indptr: tuple[int, ...]
+    indices: tuple[int, ...]
+    weights: tuple[float, ...]
+
+    def __post_init__(self) -> None:
+        if not self.indptr or self.indptr[0] != 0 or self.indptr[-1] != len(self.indices):
+            raise ValueError("indptr must start at 0 and end at the edge count")
+        if len(self.indices) != len(self.weights):
+            raise ValueError("indices and weights must have the same length")
+
+    @property
+    def size(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices)
+
+    def row(self, i: int) -> Iterator[tuple[int, float]]:
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        return zip(self.indices[start:stop], self.weights[start:stop])
+
+    @classmethod
+    def from_neighbors(cls, neighbors: Sequence[Iterable[tuple[int, float]]]) -> "SparseCoupling":
+        indptr = [0]
+        indices: list[int] = []
+        weights: list[float] = []
+        for i, row in enumerate(neighbors):
+            for j, w in sorted(row):
+                if j != i and w != 0.0:
+                    indices.append(j)
+                    weights.append(float(w))
+            indptr.append(len(indices))
+        return cls(tuple(indptr), tuple(indices), tuple(weights))
+
+    @classmethod
+    def from_dense(cls, matrix: Sequence[Sequence[float]]) -> "SparseCoupling":
+        return cls.from_neighbors([list(enumerate(row)) for row in matrix])
+
+
+CouplingMatrix = list[list[float]] | SparseCoupling
+
+
+def build_sparse_coupling(
+    positions: Sequence[tuple[float, float]],
+    cutoff: float,
+    weight: float,
+) -> SparseCoupling:
+    """Couple every tower pair closer than ``cutoff`` with a uniform ``weight``.
+
+    Towers are bucketed on a ``cutoff``-sized grid so only the 3x3 surrounding
+    cells are probed per tower.
+    """
+
+    if cutoff <= 0.0:
+        raise ValueError("cutoff must be positive")
+    buckets: dict[tuple[int, int], list[int]] = {}
+    cells = [(math.floor(x / cutoff), math.floor(y / cutoff)) for x, y in positions]
+    for i, cell in enumerate(cells):
+        buckets.setdefault(cell, []).append(i)
+
+    cutoff_sq = cutoff * cutoff
+    neighbors: list[list[tuple[int, float]]] = []
+    for i, ((x, y), (cx, cy)) in enumerate(zip(positions, cells)):
+        row: list[tuple[int, float]] = []
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for j in buckets.get((gx, gy), ()):
+                    ox, oy = positions[j]
+                    if j != i and (ox - x) ** 2 + (oy - y) ** 2 <= cutoff_sq:
+                        row.append((j, weight))
+        neighbors.append(row)
+    return SparseCoupling.from_neighbors(neighbors)
+
+
+@lru_cache(maxsize=32)
+def complete_coupling(n: int, weight: float) -> SparseCoupling:
+    """Uniform all-pairs coupling, cached since loadout boards reuse it every tick."""
+
+    return SparseCoupling.from_neighbors([[(j, weight) for j in range(n) if j != i] for i in range(n)])
+
+
 @dataclass(frozen=True)
 class CampaignProgress:
     current_level: int = 1
@@ -94,21 +194,92 @@ class CustomSettings:
     override_beta: float | None = None
 
 
+WAVE_GROWTH = 1.18
+LOG_WAVE_GROWTH = math.log(WAVE_GROWTH)
+_MASK64 = (1 << 64) - 1
+
+
+def _splitmix64(x: int) -> int:
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def wave_jitter_unit(seed: int, wave_index: int) -> float:
+    """Uniform [0, 1) draw for one wave, hashed from (seed, wave_index) alone."""
+
+    return (_splitmix64(_splitmix64(seed & _MASK64) ^ (wave_index & _MASK64)) >> 11) / 9007199254740992.0
+
+
+def wave_log_strength(seed: int, wave_index: int, entropy: float = 0.2) -> float:
+    """Natural log of wave ``wave_index``'s strength; finite for any depth."""
+
+    jitter = 1.0 + entropy * (2.0 * wave_jitter_unit(seed, wave_index) - 1.0)
+    return max(0, wave_index - 1) * LOG_WAVE_GROWTH + math.log(jitter)
+
+
+def wave_strength(seed: int, wave_index: int, entropy: float = 0.2) -> float:
+    """``WAVE_GROWTH ** (wave_index - 1)`` times jitter; ``inf`` once past float range."""
+
+    log_strength = wave_log_strength(seed, wave_index, entropy)
+    return math.exp(log_strength) if log_strength < 709.0 else math.inf
+
+
+def log_waves(seed: int, start: int, count: int, entropy: float = 0.2) -> list[float]:
+    """Natural-log strengths of waves ``start .. start + count - 1``, each computed independently."""
+
+    if count < 0:
+        raise ValueError("count must be non-negative")
+    # Same arithmetic as wave_log_strength, with the seed hash hoisted out.
+    seed_key = _splitmix64(seed & _MASK64)
+    log = math.log
+    return [
+        max(0, k - 1) * LOG_WAVE_GROWTH
+        + log(1.0 + entropy * (2.0 * ((_splitmix64(seed_key ^ (k & _MASK64)) >> 11) / 9007199254740992.0) - 1.0))
+        for k in range(start, start + count)
+    ]
+
+
+def waves(seed: int, start: int, count: int, entropy: float = 0.2) -> list[float]:
+    """Strengths of waves ``start .. start + count - 1`` as ``wave_strength`` gives them."""
+
+    return [math.exp(v) if v < 709.0 else math.inf for v in log_waves(seed, start, count, entropy)]
+
+
 @dataclass
 class InfiniteMode:
+    """Infinite-mode cursor; any wave's strength depends only on (seed, wave_index).
+
+    ``rng`` is kept for callers that drew from it, but it no longer drives the
+    wave schedule and reading it warns.
+    """
+
     seed: int
     wave_index: int = 1
     entropy: float = 0.2
-    rng: random.Random = field(init=False)
-
-    def __post_init__(self) -> None:
-        self.rng = random.Random(self.seed)
+    _rng: random.Random | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def rng(self) -> random.Random:
+        warnings.warn(
+            "InfiniteMode.rng is deprecated; wave jitter comes from wave_jitter_unit(seed, wave_index)",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        if self._rng is None:
+            self._rng = random.Random(self.seed)
+        return self._rng
+
+    def next_wave_log_strength(self) -> float:
+        log_strength = wave_log_strength(self.seed, self.wave_index, self.entropy)
+        self.wave_index += 1
+        return log_strength
 
     def next_wave_strength(self) -> float:
-        base = 1.18 ** max(0, self.wave_index - 1)
-        jitter = 1.0 + self.rng.uniform(-self.entropy, self.entropy)
+        strength = wave_strength(self.seed, self.wave_index, self.entropy)
         self.wave_index += 1
-        return base * jitter
+        return strength
 
 
 FOUR_SLOT_LOADOUT = 4
@@ -126,29 +297,58 @@ def effective_efficiency(params: TowerParams, heat: float, alpha: float) -> floa
     return params.eta * math.exp(-alpha * overflow)
 
 
-def _quantile(sorted_values: list[float], q: float) -> float:
-    if not sorted_values:
+def _select(values: list[float], k: int) -> float:
+    """Return the ``k``-th smallest value without sorting the full list.
+
+    A strided sample brackets the target rank, one pass keeps only values inside
+    the bracket, and just that slice is sorted. Falls back to a full sort if the
+    bracket misses (adversarial layouts), so the result is always exact.
+    """
+
+    n = len(values)
+    if n <= 256:
+        return sorted(values)[k]
+    sample = sorted(values[:: n // 128])
+    m = len(sample)
+    pos = k * m // n
+    spread = 2 * math.isqrt(m) + 1
+    lo = sample[max(0, pos - spread)]
+    hi = sample[min(m - 1, pos + spread)]
+    window = [v for v in values if lo <= v <= hi]
+    below = sum(1 for v in values if v < lo)
+    if below <= k < below + len(window):
+        window.sort()
+        return window[k - below]
+    return sorted(values)[k]
+
+
+def _quantile(values: list[float], q: float) -> float:
+    if not values:
         return 0.0
-    idx = min(len(sorted_values) - 1, max(0, int(math.ceil(q * len(sorted_values)) - 1)))
-    return sorted_values[idx]
+    idx = min(len(values) - 1, max(0, int(math.ceil(q * len(values)) - 1)))
+    return _select(values, idx)
 
 
-def burzen_step(
+def _row_items(matrix: CouplingMatrix, i: int) -> Iterable[tuple[int, float]]:
+    if isinstance(matrix, SparseCoupling):
+        return matrix.row(i)
+    return enumerate(matrix[i])
+
+
+def _advance(
     state: BurzenTDState,
-    couplings: list[list[float]],
-    heat_diffusion: list[list[float]],
-    config: SimulationConfig = SimulationConfig(),
-) -> EigenstateDelta:
-    n = len(state.towers)
-    if n == 0:
-        state.tick += 1
-        return EigenstateDelta(state.tick, 0.0, 0.0, 0.5, 0.0, 0.0, 0.0, 0)
+    couplings: CouplingMatrix,
+    heat_diffusion: CouplingMatrix,
+    config: SimulationConfig,
+) -> tuple[list[float], list[float], int]:
+    """Apply one tick to ``state`` in place; returns the new energies, heats and instability count."""
 
+    towers = state.towers
     next_energy: list[float] = []
     next_heat: list[float] = []
     instability_count = 0
 
-    for i, tower in enumerate(state.towers):
+    for i, tower in enumerate(towers):
         params = BASELINE_PARAMS[tower.archetype]
         activity = tower.activity
         if tower.archetype == TowerArchetype.PULSE:
@@ -163,18 +363,20 @@ def burzen_step(
         p_use = activity * params.c + tower.burst_spend + reaction_burst
 
         neighbor_energy = 0.0
-        neighbor_heat = 0.0
-        for j, neighbor in enumerate(state.towers):
+        for j, kappa in _row_items(couplings, i):
             if i == j:
                 continue
-            kappa = couplings[i][j]
-            d = heat_diffusion[i][j]
             if tower.archetype == TowerArchetype.FIELD:
                 kappa *= 1.15
+            neighbor_energy += kappa * (towers[j].energy - tower.energy)
+
+        neighbor_heat = 0.0
+        for j, d in _row_items(heat_diffusion, i):
+            if i == j:
+                continue
             if tower.archetype == TowerArchetype.THERMAL:
                 d *= 1.10
-            neighbor_energy += kappa * (neighbor.energy - tower.energy)
-            neighbor_heat += d * (neighbor.heat - tower.heat)
+            neighbor_heat += d * (towers[j].heat - tower.heat)
 
         e = max(0.0, min(params.e_max, tower.energy + config.dt * (p_gen - p_use + neighbor_energy)))
         h = max(0.0, min(params.h_max, tower.heat + config.dt * (params.gamma * p_use + neighbor_heat - params.rho * tower.heat)))
@@ -189,31 +391,252 @@ def burzen_step(
         next_energy.append(e)
         next_heat.append(h)
 
-    for tower, e, h in zip(state.towers, next_energy, next_heat):
+    for tower, e, h in zip(towers, next_energy, next_heat):
         tower.energy = e
         tower.heat = h
 
     state.tick += 1
+    return next_energy, next_heat, instability_count
 
-    energy_values = sorted(next_energy)
-    heat_values = sorted(next_heat)
+
+@dataclass(frozen=True)
+class TickPlan:
+    """``burzen_step`` inputs compiled once per tower set.
+
+    Holds per-index parameter tuples, archetype masks and neighbour rows with
+    the FIELD ×1.15 / THERMAL ×1.10 modifiers already applied, so the tick loop
+    does no dictionary or enum work. A plan is tied to the archetype order it
+    was compiled for and to the coupling objects it was built from; recompile
+    after adding or removing towers or replacing the couplings.
+    """
+
+    archetypes: tuple[TowerArchetype, ...]
+    params: tuple[TowerParams, ...]
+    reaction_heat: tuple[float, ...]
+    theta_floor: tuple[float, ...]
+    pulse: tuple[bool, ...]
+    reaction: tuple[bool, ...]
+    energy_rows: tuple[tuple[tuple[int, float], ...], ...]
+    heat_rows: tuple[tuple[tuple[int, float], ...], ...]
+    couplings: CouplingMatrix
+    heat_diffusion: CouplingMatrix
+
+    def matches(self, state: BurzenTDState, couplings: CouplingMatrix, heat_diffusion: CouplingMatrix) -> bool:
+        return (
+            couplings is self.couplings
+            and heat_diffusion is self.heat_diffusion
+            and len(state.towers) == len(self.archetypes)
+            and all(t.archetype is a for t, a in zip(state.towers, self.archetypes))
+        )
+
+
+def compile_tick_plan(
+    state: BurzenTDState,
+    couplings: CouplingMatrix,
+    heat_diffusion: CouplingMatrix,
+) -> TickPlan:
+    archetypes = tuple(t.archetype for t in state.towers)
+    params = tuple(BASELINE_PARAMS[a] for a in archetypes)
+
+    def rows(matrix: CouplingMatrix, boosted: TowerArchetype, factor: float) -> tuple[tuple[tuple[int, float], ...], ...]:
+        compiled = []
+        for i, archetype in enumerate(archetypes):
+            scale = archetype == boosted
+            compiled.append(tuple((j, w * factor if scale else w) for j, w in _row_items(matrix, i) if j != i))
+        return tuple(compiled)
+
+    return TickPlan(
+        archetypes=archetypes,
+        params=params,
+        reaction_heat=tuple(0.8 * p.theta for p in params),
+        theta_floor=tuple(max(p.theta, 1e-9) for p in params),
+        pulse=tuple(a == TowerArchetype.PULSE for a in archetypes),
+        reaction=tuple(a == TowerArchetype.REACTION for a in archetypes),
+        energy_rows=rows(couplings, TowerArchetype.FIELD, 1.15),
+        heat_rows=rows(heat_diffusion, TowerArchetype.THERMAL, 1.10),
+        couplings=couplings,
+        heat_diffusion=heat_diffusion,
+    )
+
+
+def _advance_planned(state: BurzenTDState, plan: TickPlan, config: SimulationConfig) -> tuple[list[float], list[float], int]:
+    """``_advance`` driven by a ``TickPlan``; produces bit-identical results."""
+
+    towers = state.towers
+    energies = [t.energy for t in towers]
+    heats = [t.heat for t in towers]
+    pulse_activity = 1.0 if state.tick % 3 == 0 else 0.0
+    alpha, beta, dt = config.alpha, config.beta, config.dt
+    threshold, consecutive = config.instability_threshold, config.instability_consecutive_ticks
+    next_energy: list[float] = []
+    next_heat: list[float] = []
+    instability_count = 0
+
+    for i, tower in enumerate(towers):
+        params = plan.params[i]
+        energy = energies[i]
+        heat = heats[i]
+        activity = pulse_activity if plan.pulse[i] else tower.activity
+        reaction_burst = 4.0 if plan.reaction[i] and heat > plan.reaction_heat[i] else 0.0
+
+        theta_floor = plan.theta_floor[i]
+        eta_eff = params.eta * math.exp(-alpha * max(0.0, (heat - params.theta) / theta_floor))
+        p_gen = activity * params.g * eta_eff
+        p_use = activity * params.c + tower.burst_spend + reaction_burst
+
+        neighbor_energy = 0.0
+        for j, kappa in plan.energy_rows[i]:
+            neighbor_energy += kappa * (energies[j] - energy)
+        neighbor_heat = 0.0
+        for j, d in plan.heat_rows[i]:
+            neighbor_heat += d * (heats[j] - heat)
+
+        e = max(0.0, min(params.e_max, energy + dt * (p_gen - p_use + neighbor_energy)))
+        h = max(0.0, min(params.h_max, heat + dt * (params.gamma * p_use + neighbor_heat - params.rho * heat)))
+
+        overflow_ratio = max(0.0, (h - params.theta) / theta_floor)
+        ticks = tower.instability_ticks + 1 if beta * (overflow_ratio**2) > threshold else 0
+        tower.instability_ticks = ticks
+        if ticks >= consecutive:
+            instability_count += 1
+
+        next_energy.append(e)
+        next_heat.append(h)
+
+    for tower, e, h in zip(towers, next_energy, next_heat):
+        tower.energy = e
+        tower.heat = h
+
+    state.tick += 1
+    return next_energy, next_heat, instability_count
+
+
+def summarize_delta(tick: int, next_energy: list[float], next_heat: list[float], instability_count: int) -> EigenstateDelta:
+    n = len(next_energy)
+    if n == 0:
+        return EigenstateDelta(tick, 0.0, 0.0, 0.5, 0.0, 0.0, 0.0, instability_count)
+    lowest = heapq.nsmallest(3, next_energy)
     energy_mean = sum(next_energy) / n
     heat_mean = sum(next_heat) / n
     heat_std = math.sqrt(sum((h - heat_mean) ** 2 for h in next_heat) / n)
     sign_balance = sum(1 for e in next_energy if e >= energy_mean) / n
 
     return EigenstateDelta(
-        tick=state.tick,
-        energy_lambda2=energy_values[1] if n > 1 else energy_values[0],
-        energy_lambda3=energy_values[2] if n > 2 else energy_values[-1],
+        tick=tick,
+        energy_lambda2=lowest[1] if n > 1 else lowest[0],
+        energy_lambda3=lowest[2] if n > 2 else lowest[-1],
         fiedler_sign_balance=sign_balance,
         heat_mean=heat_mean,
         heat_std=heat_std,
-        heat_q95=_quantile(heat_values, 0.95),
+        heat_q95=_quantile(next_heat, 0.95),
         instability_count=instability_count,
     )
 
 
+def burzen_step(
+    state: BurzenTDState,
+    couplings: CouplingMatrix,
+    heat_diffusion: CouplingMatrix,
+    config: SimulationConfig = SimulationConfig(),
+    plan: TickPlan | None = None,
+) -> EigenstateDelta:
+    """Advance one tick; couplings may be dense n×n lists or ``SparseCoupling``.
+
+    ``plan`` (from ``compile_tick_plan``) skips the per-tick parameter and
+    modifier lookups; it must have been compiled for these towers and couplings.
+    """
+
+    if plan is None:
+        advanced = _advance(state, couplings, heat_diffusion, config)
+    elif plan.matches(state, couplings, heat_diffusion):
+        advanced = _advance_planned(state, plan, config)
+    else:
+        raise ValueError("Tick plan is stale; recompile after changing towers or couplings")
+    return summarize_delta(state.tick, *advanced)
+
+
+def run(
+    state: BurzenTDState,
+    couplings: CouplingMatrix,
+    heat_diffusion: CouplingMatrix,
+    ticks: int,
+    config: SimulationConfig = SimulationConfig(),
+    *,
+    stride: int | None = None,
+    until: Callable[[EigenstateDelta], bool] | None = None,
+    heat_stats: HeatRunAccumulator | None = None,
+    plan: TickPlan | None = None,
+) -> list[EigenstateDelta]:
+    """Advance ``state`` up to ``ticks`` ticks, summarizing only sampled ticks.
+
+    A delta is built every ``stride`` ticks (``None`` means only after the last
+    tick), and the last executed tick is always included. ``until`` sees each
+    sampled delta; returning True stops the run after that tick. ``heat_stats``
+    receives every tick's heat values for whole-run mean/std/q95. A ``plan``
+    compiled earlier for these towers and couplings is reused instead of
+    compiling one per call.
+    """
+
+    if ticks < 0:
+        raise ValueError("ticks must be non-negative")
+    if stride is not None and stride <= 0:
+        raise ValueError("stride must be positive")
+
+    if plan is None:
+        plan = compile_tick_plan(state, couplings, heat_diffusion)
+    elif not plan.matches(state, couplings, heat_diffusion):
+        raise ValueError("Tick plan is stale; recompile after changing towers or couplings")
+    samples: list[EigenstateDelta] = []
+    for step in range(1, ticks + 1):
+        advanced = _advance_planned(state, plan, config)
+        if heat_stats is not None:
+            heat_stats.update(advanced[1])
+        if step != ticks and (stride is None or step % stride):
+            continue
+        samples.append(summarize_delta(state.tick, *advanced))
+        if until is not None and until(samples[-1]):
+            break
+    return samples
+
+
+class PythonBackend:
+    name = "python"
+
+    def step(
+        self,
+        state: BurzenTDState,
+        couplings: CouplingMatrix,
+        heat_diffusion: CouplingMatrix,
+        config: SimulationConfig = SimulationConfig(),
+    ) -> EigenstateDelta:
+        return burzen_step(state, couplings, heat_diffusion, config)
+
+
+def select_backend(preferred: str | None = None) -> PythonBackend | NativeBackend:
+    """Pick a tick backend: ``"auto"``, ``"python"`` or ``"native"``.
+
+    Defaults to ``$BURZEN_BACKEND`` or ``"auto"``, which uses the ctypes C engine
+    when its shared library loads and the Python reference model otherwise. The
+    native backend itself falls back to Python for any tick it cannot reproduce
+    within ``burzen_native.NATIVE_PARITY_TOLERANCE``.
+    """
+
+    preferred = preferred or os.environ.get("BURZEN_BACKEND", "auto")
+    if preferred not in {"auto", "python", "native"}:
+        raise ValueError(f"Unknown backend: {preferred}")
+    if preferred == "python":
+        return PythonBackend()
+
+    from burzen_native import load_native_backend
+
+    backend = load_native_backend()
+    if backend is not None:
+        return backend
+    if preferred == "native":
+        raise RuntimeError("Native engine library is not available")
+    return PythonBackend()
+
+
 def build_campaign_levels() -> list[dict[str, object]]:
     levels: list[dict[str, object]] = []
     archetypes = list(TowerArchetype)
@@ -91,6 +91,53 @@ EigenstateDelta burzen_step(BurzenSoA *soa, float dt) {
   return delta;
 }
 
+/* burzen_step keeps its original in-place semantics for the WASM build.
+   burzen_step_parity follows simulation/burzen_td.py instead: REACTION bursts,
+   FIELD/THERMAL coupling modifiers and a Jacobi update. */
+EigenstateDelta burzen_step_parity(BurzenSoA *soa, float dt) {
+  EigenstateDelta delta = {0};
+  if (soa->cell_count == 0) return delta;
+
+  /* Every pair is coupled with the same weight, so the neighbour pull on cell i
+     is w * (total - n * value[i]). Both totals are taken from the previous tick
+     before any cell is written, which keeps the update Jacobi-style. */
+  float energy_total = 0.0f;
+  float heat_total = 0.0f;
+  for (size_t i = 0; i < soa->cell_count; i++) {
+    energy_total += soa->energy[i];
+    heat_total += soa->heat[i];
+  }
+  const float n = (float)soa->cell_count;
+
+  for (size_t i = 0; i < soa->cell_count; i++) {
+    float g, c, eta, gamma, rho, theta;
+    const int tower_type = soa->tower_type[i];
+    params_for_tower(tower_type, &g, &c, &eta, &gamma, &rho, &theta);
+    const float energy = soa->energy[i];
+    const float heat = soa->heat[i];
+    float overflow = fmaxf(0.0f, (heat - theta) / fmaxf(theta, 1e-6f));
+    float eta_eff = eta * expf(-0.9f * overflow);
+    float p_gen = soa->activity[i] * g * eta_eff;
+    float p_use = soa->activity[i] * c;
+    if (tower_type == TOWER_REACTION && heat > 0.8f * theta) p_use += 4.0f;
+
+    float energy_weight = tower_type == TOWER_FIELD ? 0.08f * 1.15f : 0.08f;
+    float heat_weight = tower_type == TOWER_THERMAL ? 0.05f * 1.10f : 0.05f;
+    float e_neighbor = energy_weight * (energy_total - n * energy);
+    float h_neighbor = heat_weight * (heat_total - n * heat);
+
+    soa->energy[i] = clampf(energy + dt * (p_gen - p_use + e_neighbor), 0.0f, 100.0f);
+    soa->heat[i] = clampf(heat + dt * (gamma * p_use + h_neighbor - rho * heat), 0.0f, 100.0f);
+  }
+
+  delta.atp_eigenstate = average(soa->energy, soa->cell_count);
+  delta.fold_eigen_delta = average(soa->heat, soa->cell_count);
+  delta.metabolic_eigen_delta = soa->cell_count > 1 ? soa->energy[1] : soa->energy[0];
+  delta.stress_eigen_delta = soa->cell_count > 2 ? soa->energy[2] : delta.metabolic_eigen_delta;
+  delta.lysosome_pruning_delta = 1.0f - clampf(delta.fold_eigen_delta / 100.0f, 0.0f, 1.0f);
+  return delta;
+}
+
 Eigenstate burzen_export_eigenstate(const BurzenSoA *soa) {
   Eigenstate eigen = {0};
   if (soa->cell_count == 0) return eigen;
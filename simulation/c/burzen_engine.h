@@ -46,6 +46,7 @@ typedef struct {
 void burzen_init(BurzenSoA *soa, size_t cell_count);
 void burzen_destroy(BurzenSoA *soa);
 EigenstateDelta burzen_step(BurzenSoA *soa, float dt);
+EigenstateDelta burzen_step_parity(BurzenSoA *soa, float dt);
 Eigenstate burzen_export_eigenstate(const BurzenSoA *soa);
 int codex_encode_eigenstate(Eigenstate eigen, char *buffer, size_t buffer_size);
 
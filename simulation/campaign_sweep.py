@@ -0,0 +1,250 @@
+"""Process-pool campaign/loadout sweep for BURZEN TD v1.0 balance jobs.
+
+Every (level, loadout, config) combination is one ``SweepJob``. Jobs are
+dispatched to worker processes in chunks, results stream back as chunks finish
+and are appended to a JSON-lines log, so an interrupted sweep resumes by
+skipping keys already in the log. Row keys include the tick count, so a sweep
+rerun with different ``ticks`` evaluates every job again. ``write_columnar`` folds the log into a
+column-oriented table.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import combinations, product
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+from burzen_td import (
+    FOUR_SLOT_LOADOUT,
+    BurzenTDState,
+    SimulationConfig,
+    TowerArchetype,
+    TowerState,
+    build_campaign_levels,
+    complete_coupling,
+    run,
+)
+
+RESULT_COLUMNS: tuple[str, ...] = (
+    "key",
+    "level",
+    "loadout",
+    "config",
+    "alpha",
+    "beta",
+    "ticks",
+    "energy_mean",
+    "energy_lambda2",
+    "heat_mean",
+    "heat_std",
+    "heat_q95",
+    "instability_count",
+    "required_generation",
+    "safe_heat_q95",
+    "passed",
+)
+
+
+@dataclass(frozen=True)
+class SweepJob:
+    level: int
+    loadout: tuple[TowerArchetype, ...]
+    config_label: str
+    config: SimulationConfig
+
+    @property
+    def key(self) -> str:
+        """The (level, loadout, config) combination, without the tick count."""
+
+        return f"L{self.level:02d}|{'+'.join(t.value for t in self.loadout)}|{self.config_label}"
+
+    def result_key(self, ticks: int) -> str:
+        """Key of this job's row in a results log for a run of ``ticks`` ticks."""
+
+        return f"{self.key}|T{ticks}"
+
+
+def config_grid(alphas: Sequence[float], betas: Sequence[float]) -> dict[str, SimulationConfig]:
+    # repr is the shortest exact form, so distinct floats never share a label.
+    return {f"a{a!r}_b{b!r}": SimulationConfig(alpha=a, beta=b) for a, b in product(alphas, betas)}
+
+
+def enumerate_jobs(
+    configs: dict[str, SimulationConfig] | None = None,
+    levels: Iterable[int] | None = None,
+) -> list[SweepJob]:
+    """All unlocked 4-tower loadouts for each level, crossed with ``configs``."""
+
+    configs = configs or {"base": SimulationConfig()}
+    campaign = build_campaign_levels()
+    wanted = set(levels) if levels is not None else {int(cfg["level"]) for cfg in campaign}
+    jobs: list[SweepJob] = []
+    for level_cfg in campaign:
+        level = int(level_cfg["level"])
+        if level not in wanted:
+            continue
+        for loadout in combinations(level_cfg["unlocked"], FOUR_SLOT_LOADOUT):
+            for label, config in configs.items():
+                jobs.append(SweepJob(level=level, loadout=tuple(loadout), config_label=label, config=config))
+    return jobs
+
+
+def _check_ticks(ticks: int) -> None:
+    # A job's row is built from its last tick, so an empty run has nothing to report.
+    if ticks < 1:
+        raise ValueError("ticks must be at least 1")
+
+
+def evaluate_job(job: SweepJob, ticks: int) -> dict[str, object]:
+    _check_ticks(ticks)
+    level_cfg = build_campaign_levels()[job.level - 1]
+    state = BurzenTDState(towers=[TowerState(archetype=t) for t in job.loadout])
+    n = len(state.towers)
+    final = run(state, complete_coupling(n, 0.08), complete_coupling(n, 0.05), ticks, job.config)[-1]
+    energy_mean = sum(t.energy for t in state.towers) / n
+    # Safe heat is a per-level threshold, so the level value wins over the config's.
+    passed = (
+        energy_mean >= float(level_cfg["required_generation"])
+        and final.heat_q95 <= float(level_cfg["safe_heat_q95"])
+        and final.instability_count == 0
+    )
+    return {
+        "key": job.result_key(ticks),
+        "level": job.level,
+        "loadout": "+".join(t.value for t in job.loadout),
+        "config": job.config_label,
+        "alpha": job.config.alpha,
+        "beta": job.config.beta,
+        "ticks": final.tick,
+        "energy_mean": energy_mean,
+        "energy_lambda2": final.energy_lambda2,
+        "heat_mean": final.heat_mean,
+        "heat_std": final.heat_std,
+        "heat_q95": final.heat_q95,
+        "instability_count": final.instability_count,
+        "required_generation": level_cfg["required_generation"],
+        "safe_heat_q95": level_cfg["safe_heat_q95"],
+        "passed": passed,
+    }
+
+
+def _evaluate_chunk(jobs: Sequence[SweepJob], ticks: int) -> list[dict[str, object]]:
+    return [evaluate_job(job, ticks) for job in jobs]
+
+
+def completed_keys(results_path: Path) -> set[str]:
+    """Keys already in the log; a torn final line from an interrupted run is ignored."""
+
+    keys: set[str] = set()
+    if not results_path.exists():
+        return keys
+    with results_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                keys.add(json.loads(line)["key"])
+            except (json.JSONDecodeError, KeyError):
+                continue
+    return keys
+
+
+def _terminate_torn_line(results_path: Path) -> None:
+    # An interrupted write can leave a partial last row; start new rows on a fresh line.
+    if not results_path.exists() or results_path.stat().st_size == 0:
+        return
+    with results_path.open("rb+") as handle:
+        handle.seek(-1, os.SEEK_END)
+        if handle.read(1) != b"\n":
+            handle.write(b"\n")
+
+
+def run_sweep(
+    jobs: Sequence[SweepJob],
+    ticks: int,
+    results_path: Path,
+    *,
+    workers: int | None = None,
+    chunk_size: int = 8,
+    max_pending: int | None = None,
+) -> Iterator[dict[str, object]]:
+    """Evaluate ``jobs`` on a process pool, yielding rows as chunks complete.
+
+    Rows are appended to ``results_path`` before being yielded; jobs whose
+    ``result_key(ticks)`` is already logged are skipped. ``ticks`` below 1 raises ValueError before any
+    worker starts. At most ``max_pending`` chunks (default twice the
+    worker count) are in flight, so memory stays bounded for large sweeps.
+    """
+
+    _check_ticks(ticks)
+    results_path = Path(results_path)
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    done = completed_keys(results_path)
+    pending_jobs = [job for job in jobs if job.result_key(ticks) not in done]
+    chunks = iter([pending_jobs[i : i + chunk_size] for i in range(0, len(pending_jobs), chunk_size)])
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+
+    _terminate_torn_line(results_path)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool, results_path.open("a", encoding="utf-8") as log:
+        in_flight = set()
+        for chunk in chunks:
+            in_flight.add(pool.submit(_evaluate_chunk, chunk, ticks))
+            if len(in_flight) >= max_pending:
+                break
+        while in_flight:
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                rows = future.result()
+                for row in rows:
+                    log.write(json.dumps(row, sort_keys=True) + "\n")
+                log.flush()
+                yield from rows
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    in_flight.add(pool.submit(_evaluate_chunk, chunk, ticks))
+
+
+def write_columnar(results_path: Path, table_path: Path) -> dict[str, list[object]]:
+    """Fold the JSON-lines log into ``{column: [values...]}`` ordered by job key."""
+
+    rows: dict[str, dict[str, object]] = {}
+    with Path(results_path).open("r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            rows[row["key"]] = row
+    ordered = [rows[k] for k in sorted(rows)]
+    table = {column: [row.get(column) for row in ordered] for column in RESULT_COLUMNS}
+    Path(table_path).write_text(json.dumps(table, separators=(",", ":")), encoding="utf-8")
+    return table
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Sweep BURZEN TD campaign levels x loadouts x configs.")
+    parser.add_argument("--ticks", type=int, default=240)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=8)
+    parser.add_argument("--alphas", type=float, nargs="+", default=[SimulationConfig().alpha])
+    parser.add_argument("--betas", type=float, nargs="+", default=[SimulationConfig().beta])
+    parser.add_argument("--levels", type=int, nargs="+", default=None)
+    parser.add_argument("--out", type=Path, default=Path(__file__).parent / "logs" / "campaign_sweep.jsonl")
+    args = parser.parse_args(argv)
+
+    jobs = enumerate_jobs(config_grid(args.alphas, args.betas), args.levels)
+    completed = 0
+    for _ in run_sweep(jobs, args.ticks, args.out, workers=args.workers, chunk_size=args.chunk_size):
+        completed += 1
+    table_path = args.out.with_suffix(".columns.json")
+    table = write_columnar(args.out, table_path)
+    print(f"{completed} new rows, {len(table['key'])} total -> {table_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,38 @@ from __future__ import annotations
 import base64
 import hashlib
 import json
+import math
+import struct
+import zlib
 from dataclasses import dataclass
 from enum import Enum
+from typing import BinaryIO, Iterator
 
 VERSION = "XDX1"
+BINARY_VERSION = "XDX2"
+COMPRESSED_VERSION = "XDZ1"
+ENVELOPE_VERSION = "XDE1"
+MAX_INFLATED_BYTES = 1 << 20
+
+# Preset deflate dictionary for XDZ1 tokens, shared byte for byte with
+# docs/core/codec.js. Fragments are canonical JSON (sorted keys, no spaces);
+# deflate reaches the end of the dictionary most cheaply, so the most common
+# shapes (editor share links) come last. Changing it needs a new prefix.
+SHARE_DICTIONARY = b"".join(
+    (
+        b'{"enemies_per_wave":10,"enemy_speed":,"free_energy_threshold":0.,"id":"level_0,"minimum_bonds":,"name":"',
+        b'"path_points":[[,"spawn_interval":0.,"star_targets":{"low_heat":0.,"natural_fold":0.},"starting_heat":0.',
+        b'"tutorial_steps":["],"unlocked_towers":["hydrophobic_anchor","polar_hydrator","cationic_defender",',
+        b'"anionic_repulsor","proline_hinge","alpha_helix_pulsar","beta_sheet_fortifier","molecular_chaperone"],',
+        b'"wave_count":}{"level_id":"level_0","map_topology":{"path_nodes":[{"x":64,"y":64},{"x":640,"y":360}]},',
+        b'"render_constraints":{"heat_overlay_resolution":128,"max_energy_edges":120,"max_mobs":80,"max_towers":24},',
+        b'"schema":"campaign_level_geometry_v0_8"}{"energy":{"fiedler_sign_balance":0.5,"lambda2":,"lambda3":},',
+        b'"heat":{"instability_count":0,"mean":,"q95":,"std":},"schema":"eigenstate_delta_v1","tick":}',
+        b'{"custom":{"alpha":,"beta":},"level":,"loadout":["kinetic","thermal","energy","reaction","pulse","field",',
+        b'"conversion","control"],"schema":"burzen_action_v1","session":"s000","tick":,"version_id":}',
+        b'{"h":,"p":[[0,0],[1,0],[2,0],[2,1],[2,2]],"r":"","s":12,"w":[[1,10],[2,12],[3,14]]}',
+    )
+)
 
 
 class RejectionType(Enum):
@@ -47,8 +75,56 @@ class Eigenstate:
         }
 
 
-def _canonical_json_bytes(payload: dict[str, object]) -> bytes:
-    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+def _canonical_json(value: object) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _js_number(value: float) -> str:
+    """Format ``value`` like JavaScript's ``JSON.stringify`` (``Number::toString``)."""
+
+    if not math.isfinite(value):
+        return "null"
+    if value == 0:
+        return "0"
+    if value < 0:
+        return "-" + _js_number(-value)
+    mantissa, _, exp = repr(value).partition("e")
+    whole, _, fraction = mantissa.partition(".")
+    digits = (whole + fraction).lstrip("0")
+    point = int(exp or 0) + len(whole) - (len(whole + fraction) - len(digits))
+    digits = digits.rstrip("0")
+    if len(digits) <= point <= 21:
+        return digits + "0" * (point - len(digits))
+    if 0 < point <= 21:
+        return f"{digits[:point]}.{digits[point:]}"
+    if -6 < point <= 0:
+        return "0." + "0" * -point + digits
+    head = digits[0] if len(digits) == 1 else f"{digits[0]}.{digits[1:]}"
+    return f"{head}e{'+' if point > 0 else '-'}{abs(point - 1)}"
+
+
+def _js_canonical_json(value: object) -> str:
+    if isinstance(value, float):
+        return _js_number(value)
+    if isinstance(value, dict):
+        items = (f"{_canonical_json(key)}:{_js_canonical_json(value[key])}" for key in sorted(value))
+        return "{" + ",".join(items) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(map(_js_canonical_json, value)) + "]"
+    return _canonical_json(value)
+
+
+def canonical_json_bytes(payload: dict[str, object], *, js_numbers: bool = False) -> bytes:
+    """Return the canonical JSON bytes that tokens carry and checksum.
+
+    Keys are sorted and there is no whitespace. XDX1 keeps Python's float
+    formatting (``1.0``, ``1e-07``); with ``js_numbers`` floats are written the
+    way ``JSON.stringify`` does (``1``, ``1e-7``), which XDZ1 uses so that
+    ``canonicalJson`` in ``docs/core/codec.js`` produces identical bytes.
+    """
+
+    text = _js_canonical_json(payload) if js_numbers else _canonical_json(payload)
+    return text.encode("utf-8")
 
 
 def _checksum8(raw: bytes) -> str:
@@ -64,24 +140,223 @@ def _from_b64url(payload: str) -> bytes:
     return base64.urlsafe_b64decode(padded)
 
 
-def encode_eigenstate(eigenstate: Eigenstate) -> str:
-    raw = _canonical_json_bytes(eigenstate.to_payload_dict())
+# XDX2 packs fixed schemas instead of JSON. The body is: schema tag (varint),
+# flags (bit 0: version_id present), [version_id (zigzag varint)], the schema's
+# integer fields as zigzag varints, then its float fields as little-endian f64.
+# The checksum covers the body bytes exactly as XDX1's covers the JSON bytes.
+_BINARY_SCHEMAS: dict[str, tuple[int, tuple[tuple[str, ...], ...], tuple[tuple[str, ...], ...]]] = {
+    "eigenstate_v1": (
+        1,
+        (),
+        (
+            ("energy_setpoint",),
+            ("epigenetic_profile",),
+            ("cascade_readiness",),
+            ("stress_resilience",),
+            ("differentiation_axis",),
+            ("mechanical_state",),
+        ),
+    ),
+    "eigenstate_delta_v1": (
+        2,
+        (("tick",), ("heat", "instability_count")),
+        (
+            ("energy", "lambda2"),
+            ("energy", "lambda3"),
+            ("energy", "fiedler_sign_balance"),
+            ("heat", "mean"),
+            ("heat", "std"),
+            ("heat", "q95"),
+        ),
+    ),
+}
+_BINARY_TAGS = {spec[0]: (schema, *spec[1:]) for schema, spec in _BINARY_SCHEMAS.items()}
+_BINARY_FLOATS = {tag: struct.Struct(f"<{len(spec[2])}d") for tag, spec in _BINARY_TAGS.items()}
+_FLAG_VERSION_ID = 1
+
+
+def _binary_shape(int_paths: tuple[tuple[str, ...], ...], float_paths: tuple[tuple[str, ...], ...]) -> dict[str, object]:
+    shape: dict[str, object] = {"schema": None}
+    for path in (*int_paths, *float_paths):
+        if len(path) == 1:
+            shape[path[0]] = None
+        else:
+            shape.setdefault(path[0], {})[path[1]] = None
+    return shape
+
+
+_BINARY_SHAPES = {schema: _binary_shape(spec[1], spec[2]) for schema, spec in _BINARY_SCHEMAS.items()}
+
+
+def _get_path(payload: dict[str, object], path: tuple[str, ...]) -> object:
+    return payload[path[0]] if len(path) == 1 else payload[path[0]][path[1]]
+
+
+def _put_uvarint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_uvarint(raw: bytes | memoryview, offset: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        if offset >= len(raw) or shift > 63:
+            raise ValueError("Malformed binary payload")
+        byte = raw[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _put_varint(out: bytearray, value: int) -> None:
+    if not -(1 << 63) <= value < (1 << 63):
+        raise ValueError("Integer field out of 64-bit range")
+    _put_uvarint(out, (value << 1) ^ (value >> 63))
+
+
+def _read_varint(raw: bytes | memoryview, offset: int) -> tuple[int, int]:
+    value, offset = _read_uvarint(raw, offset)
+    return (value >> 1) ^ -(value & 1), offset
+
+
+def _is_int(value: object) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _binary_bytes(payload: dict[str, object]) -> bytes:
+    schema = payload.get("schema")
+    if schema not in _BINARY_SCHEMAS:
+        raise ValueError(f"Schema has no binary form: {schema}")
+    tag, int_paths, float_paths = _BINARY_SCHEMAS[schema]
+    shape = _BINARY_SHAPES[schema]
+    keys = payload.keys() - {"version_id"}
+    if keys != shape.keys() or any(
+        isinstance(payload[k], dict) != isinstance(v, dict) or (isinstance(v, dict) and payload[k].keys() != v.keys())
+        for k, v in shape.items()
+    ):
+        raise ValueError(f"Payload does not match the {schema} binary layout")
+
+    ints = [_get_path(payload, path) for path in int_paths]
+    floats = [_get_path(payload, path) for path in float_paths]
+    if "version_id" in payload:
+        ints.insert(0, payload["version_id"])
+    if not all(_is_int(value) for value in ints) or not all(_is_int(value) or isinstance(value, float) for value in floats):
+        raise ValueError(f"Payload does not match the {schema} binary layout")
+
+    out = bytearray()
+    _put_varint(out, tag)
+    out.append(_FLAG_VERSION_ID if "version_id" in payload else 0)
+    for value in ints:
+        _put_varint(out, value)
+    try:
+        out += _BINARY_FLOATS[tag].pack(*map(float, floats))
+    except OverflowError as exc:
+        raise ValueError(f"Payload does not match the {schema} binary layout") from exc
+    return bytes(out)
+
+
+def _parse_binary(raw: bytes) -> dict[str, object]:
+    tag, offset = _read_varint(raw, 0)
+    if tag not in _BINARY_TAGS:
+        raise ValueError(f"Unsupported binary schema tag: {tag}")
+    schema, int_paths, float_paths = _BINARY_TAGS[tag]
+    if offset >= len(raw):
+        raise ValueError("Malformed binary payload")
+    flags = raw[offset]
+    offset += 1
+    payload: dict[str, object] = {"schema": schema}
+    if flags & _FLAG_VERSION_ID:
+        payload["version_id"], offset = _read_varint(raw, offset)
+    values: list[object] = []
+    for _ in int_paths:
+        value, offset = _read_varint(raw, offset)
+        values.append(value)
+    floats = _BINARY_FLOATS[tag]
+    if len(raw) - offset != floats.size:
+        raise ValueError("Malformed binary payload")
+    values.extend(floats.unpack_from(raw, offset))
+    for path, value in zip((*int_paths, *float_paths), values):
+        if len(path) == 1:
+            payload[path[0]] = value
+        else:
+            payload.setdefault(path[0], {})[path[1]] = value
+    return payload
+
+
+def encode_eigenstate(eigenstate: Eigenstate, *, binary: bool = False) -> str:
+    if binary:
+        return encode_payload_binary(eigenstate.to_payload_dict())
+    raw = canonical_json_bytes(eigenstate.to_payload_dict())
     return f"{VERSION}.{_to_b64url(raw)}.{_checksum8(raw)}"
 
 
 def encode_payload(payload: dict[str, object]) -> str:
-    raw = _canonical_json_bytes(payload)
+    raw = canonical_json_bytes(payload)
     return f"{VERSION}.{_to_b64url(raw)}.{_checksum8(raw)}"
 
 
+def encode_payload_binary(payload: dict[str, object]) -> str:
+    """Encode a fixed-schema payload as an XDX2 token; raises ValueError for other shapes."""
+
+    raw = _binary_bytes(payload)
+    return f"{BINARY_VERSION}.{_to_b64url(raw)}.{_checksum8(raw)}"
+
+
+def encode_payload_compressed(payload: dict[str, object]) -> str:
+    """Encode as an XDZ1 token: raw deflate of the canonical JSON with ``SHARE_DICTIONARY``.
+
+    The checksum covers the canonical JSON bytes, not the deflate stream, so
+    tokens from any conforming compressor (zlib here, the JS codec in the
+    browser) validate the same way.
+    """
+
+    raw = canonical_json_bytes(payload, js_numbers=True)
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15, 9, zlib.Z_DEFAULT_STRATEGY, SHARE_DICTIONARY)
+    body = compressor.compress(raw) + compressor.flush()
+    return f"{COMPRESSED_VERSION}.{_to_b64url(body)}.{_checksum8(raw)}"
+
+
+def _inflate(body: bytes) -> bytes:
+    decompressor = zlib.decompressobj(-15, zdict=SHARE_DICTIONARY)
+    try:
+        raw = decompressor.decompress(body, MAX_INFLATED_BYTES)
+    except zlib.error as exc:
+        raise ValueError("Malformed compressed payload") from exc
+    if decompressor.unconsumed_tail:
+        raise ValueError("Compressed payload exceeds size limit")
+    if not decompressor.eof or decompressor.unused_data:
+        raise ValueError("Malformed compressed payload")
+    return raw
+
+
+_TOKEN_VERSIONS = (VERSION, BINARY_VERSION, COMPRESSED_VERSION)
+
+
+def _payload_bytes(version: str, payload: str) -> bytes:
+    body = _from_b64url(payload)
+    return _inflate(body) if version == COMPRESSED_VERSION else body
+
+
+def _parse_raw(version: str, raw: bytes) -> dict[str, object]:
+    if version == BINARY_VERSION:
+        return _parse_binary(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
 def decode_payload(token: str) -> dict[str, object]:
+    """Decode an XDX1 (JSON), XDX2 (binary) or XDZ1 (deflate) token to the same dict."""
+
     version, payload, checksum = token.split(".")
-    if version != VERSION:
+    if version not in _TOKEN_VERSIONS:
         raise ValueError(f"Unsupported token version: {version}")
-    raw = _from_b64url(payload)
+    raw = _payload_bytes(version, payload)
     if _checksum8(raw) != checksum:
         raise ValueError("Checksum mismatch")
-    return json.loads(raw.decode("utf-8"))
+    return _parse_raw(version, raw)
 
 
 def decode_eigenstate(token: str) -> Eigenstate:
@@ -98,18 +373,394 @@ def decode_eigenstate(token: str) -> Eigenstate:
     )
 
 
-def decode_payload_with_rejection(token: str, *, last_version_id: int = -1) -> dict[str, object]:
+def verify_token(token: str) -> dict[str, object]:
+    """Format, checksum and schema checks of ``decode_payload_with_rejection`` without the order check."""
+
     try:
         version, payload, checksum = token.split(".")
     except ValueError:
         return {"valid": False, "rejection": RejectionType.SCHEMA.value, "reason": "malformed"}
-    if version != VERSION:
+    if version not in _TOKEN_VERSIONS:
         return {"valid": False, "rejection": RejectionType.VERSION.value, "reason": "unsupported_version"}
-    raw = _from_b64url(payload)
+    try:
+        raw = _payload_bytes(version, payload)
+    except ValueError:
+        # A damaged deflate stream cannot be checksummed; treat it as malformed.
+        return {"valid": False, "rejection": RejectionType.SCHEMA.value, "reason": "malformed"}
     if _checksum8(raw) != checksum:
         return {"valid": False, "rejection": RejectionType.CHECKSUM_MISMATCH.value, "reason": "checksum_mismatch"}
-    parsed = json.loads(raw.decode("utf-8"))
-    version_id = int(parsed.get("version_id", -1)) if isinstance(parsed, dict) else -1
-    if version_id <= last_version_id:
-        return {"valid": False, "rejection": RejectionType.ORDER_VIOLATION.value, "reason": "order_violation", "version_id": version_id}
+    try:
+        parsed = _parse_raw(version, raw)
+    except ValueError:
+        return {"valid": False, "rejection": RejectionType.SCHEMA.value, "reason": "malformed"}
+    try:
+        version_id = int(parsed.get("version_id", -1)) if isinstance(parsed, dict) else -1
+    except (TypeError, ValueError, OverflowError):
+        return {"valid": False, "rejection": RejectionType.SCHEMA.value, "reason": "invalid_version_id"}
     return {"valid": True, "payload": parsed, "version_id": version_id}
+
+
+def decode_payload_with_rejection(token: str, *, last_version_id: int = -1) -> dict[str, object]:
+    result = verify_token(token)
+    if result["valid"] and result["version_id"] <= last_version_id:
+        return {
+            "valid": False,
+            "rejection": RejectionType.ORDER_VIOLATION.value,
+            "reason": "order_violation",
+            "version_id": result["version_id"],
+        }
+    return result
+
+
+# Streaming codec. Large payloads (FoldRecordV1 bundles with long conformation
+# histories) are serialised piece by piece into bounded chunks that feed the
+# hasher and a base64 encoder, and decoded by the reverse pipeline, so the only
+# full-size buffer is the JSON body on the decode side and none on encode.
+STREAM_CHUNK_BYTES = 3 << 16  # a multiple of 3 so every chunk but the last base64-encodes without padding
+_STREAM_RUN = 4096
+_CONTAINERS = frozenset({dict, list, tuple})
+
+
+def _iter_canonical_json(value: object) -> Iterator[str]:
+    """Yield ``_canonical_json(value)`` in pieces, descending into containers.
+
+    Lists are cut into runs of ``_STREAM_RUN`` items; runs of scalars go through
+    the C encoder in one call, which is several times faster than ``iterencode``.
+    """
+
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        yield "{"
+        for index, key in enumerate(sorted(value)):
+            yield f'{"," if index else ""}{_canonical_json(key)}:'
+            yield from _iter_canonical_json(value[key])
+        yield "}"
+    elif isinstance(value, (list, tuple)):
+        yield "["
+        for start in range(0, len(value), _STREAM_RUN):
+            run = value[start : start + _STREAM_RUN]
+            if start:
+                yield ","
+            if _CONTAINERS.isdisjoint(map(type, run)):
+                yield _canonical_json(run)[1:-1]
+                continue
+            for index, item in enumerate(run):
+                if index:
+                    yield ","
+                yield from _iter_canonical_json(item)
+        yield "]"
+    else:
+        yield _canonical_json(value)
+
+
+def encode_payload_stream(payload: dict[str, object], out: BinaryIO, *, chunk_size: int = STREAM_CHUNK_BYTES) -> str:
+    """Write the XDX1 token for ``payload`` to the binary file-like ``out``.
+
+    The bytes written equal ``encode_payload(payload)``; the checksum is returned.
+    """
+
+    chunk_size -= chunk_size % 3
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be at least 3")
+    digest = hashlib.sha256()
+    out.write(f"{VERSION}.".encode("ascii"))
+    pending = bytearray()
+    pieces: list[str] = []
+    size = 0
+    for piece in _iter_canonical_json(payload):
+        pieces.append(piece)
+        size += len(piece)
+        if size < chunk_size:
+            continue
+        data = "".join(pieces).encode("utf-8")
+        pieces.clear()
+        size = 0
+        digest.update(data)
+        pending += data
+        cut = len(pending) - len(pending) % 3
+        out.write(base64.urlsafe_b64encode(pending[:cut]))
+        del pending[:cut]
+    data = "".join(pieces).encode("utf-8")
+    digest.update(data)
+    pending += data
+    out.write(base64.urlsafe_b64encode(pending).rstrip(b"="))
+    checksum = digest.hexdigest()[:8]
+    out.write(f".{checksum}".encode("ascii"))
+    return checksum
+
+
+def _iter_token_chunks(source: object, chunk_size: int) -> Iterator[bytes | memoryview]:
+    if hasattr(source, "read"):
+        while chunk := source.read(chunk_size):
+            yield chunk.encode("ascii") if isinstance(chunk, str) else chunk
+        return
+    if isinstance(source, str):
+        source = source.encode("ascii")
+    view = memoryview(source).cast("B")
+    for start in range(0, len(view), chunk_size):
+        yield view[start : start + chunk_size]
+
+
+def decode_payload_stream(
+    source: str | bytes | bytearray | memoryview | BinaryIO,
+    *,
+    chunk_size: int = STREAM_CHUNK_BYTES,
+    max_bytes: int | None = None,
+) -> dict[str, object]:
+    """Decode a token read in chunks from a string, bytes-like object or binary file.
+
+    Accepts the same versions as ``decode_payload`` and returns the same dict.
+    ``max_bytes`` bounds the decoded body; for XDZ1 it defaults to
+    ``MAX_INFLATED_BYTES`` as in ``decode_payload``.
+    """
+
+    prefix = bytearray()  # version, then the checksum trailer
+    text = bytearray()  # base64 characters not yet decoded
+    raw = bytearray()
+    digest = hashlib.sha256()
+    version: str | None = None
+    inflater = None
+    limit = max_bytes
+    in_body = False
+
+    def accept(data: bytes) -> None:
+        if len(raw) + len(data) > limit:
+            raise ValueError("Payload exceeds size limit")
+        digest.update(data)
+        raw.extend(data)
+
+    def feed(data: bytes) -> None:
+        if inflater is None:
+            accept(data)
+            return
+        try:
+            accept(inflater.decompress(data, limit - len(raw) + 1))
+        except zlib.error as exc:
+            raise ValueError("Malformed compressed payload") from exc
+        if inflater.unconsumed_tail:
+            raise ValueError("Payload exceeds size limit")
+
+    for chunk in _iter_token_chunks(source, chunk_size):
+        chunk = bytes(chunk)
+        if version is None:
+            head, dot, chunk = chunk.partition(b".")
+            prefix += head
+            if not dot:
+                if len(prefix) > 8:
+                    raise ValueError("Malformed token")
+                continue
+            version = prefix.decode("ascii", "replace")
+            prefix.clear()
+            if version not in _TOKEN_VERSIONS:
+                raise ValueError(f"Unsupported token version: {version}")
+            if version == COMPRESSED_VERSION:
+                inflater = zlib.decompressobj(-15, zdict=SHARE_DICTIONARY)
+            if limit is None:
+                limit = MAX_INFLATED_BYTES if inflater is not None else 1 << 62
+            in_body = True
+        if in_body:
+            body, dot, chunk = chunk.partition(b".")
+            text += body
+            in_body = not dot
+            cut = len(text) - len(text) % 4 if in_body else len(text)
+            feed(base64.urlsafe_b64decode(bytes(text[:cut]) + b"=" * (-cut % 4)))
+            del text[:cut]
+        prefix += chunk
+        if len(prefix) > 64:
+            raise ValueError("Malformed token")
+
+    if version is None or in_body:
+        raise ValueError("Malformed token")
+    if inflater is not None:
+        accept(inflater.flush())
+        if not inflater.eof or inflater.unused_data:
+            raise ValueError("Malformed compressed payload")
+    if digest.hexdigest()[:8] != prefix.strip().decode("ascii", "replace"):
+        raise ValueError("Checksum mismatch")
+    if version == BINARY_VERSION:
+        return _parse_binary(bytes(raw))
+    document = raw.decode("utf-8")
+    raw.clear()  # drop the bytes before the parser builds objects
+    return json.loads(document)
+
+# XDE1 envelopes carry an ordered list of payloads under one checksum. Body:
+#   member count (uvarint) | key count (uvarint) | keys (uvarint length + UTF-8)
+#   | member end offsets (u32 LE each) | members
+# Members are tagged values; dict keys are indices into the shared key table,
+# so a key repeated across members is stored once. The offset table lets one
+# member be decoded without touching the others.
+_TAG_NULL, _TAG_FALSE, _TAG_TRUE, _TAG_INT, _TAG_FLOAT, _TAG_STR, _TAG_LIST, _TAG_DICT = range(8)
+_F64 = struct.Struct("<d")
+_U32 = struct.Struct("<I")
+
+
+def _collect_keys(value: object, keys: set[str]) -> None:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise ValueError("Envelope payload keys must be strings")
+            keys.add(key)
+            _collect_keys(item, keys)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _collect_keys(item, keys)
+
+
+def _put_value(out: bytearray, value: object, key_ids: dict[str, int]) -> None:
+    if value is None:
+        out.append(_TAG_NULL)
+    elif value is True or value is False:
+        out.append(_TAG_TRUE if value else _TAG_FALSE)
+    elif isinstance(value, int):
+        out.append(_TAG_INT)
+        _put_varint(out, value)
+    elif isinstance(value, float):
+        out.append(_TAG_FLOAT)
+        out += _F64.pack(value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        out.append(_TAG_STR)
+        _put_uvarint(out, len(data))
+        out += data
+    elif isinstance(value, (list, tuple)):
+        out.append(_TAG_LIST)
+        _put_uvarint(out, len(value))
+        for item in value:
+            _put_value(out, item, key_ids)
+    elif isinstance(value, dict):
+        out.append(_TAG_DICT)
+        _put_uvarint(out, len(value))
+        for key in sorted(value):
+            _put_uvarint(out, key_ids[key])
+            _put_value(out, value[key], key_ids)
+    else:
+        raise ValueError(f"Unsupported envelope value type: {type(value).__name__}")
+
+
+def _read_value(raw: memoryview, offset: int, keys: list[str]) -> tuple[object, int]:
+    if offset >= len(raw):
+        raise ValueError("Malformed envelope member")
+    tag = raw[offset]
+    offset += 1
+    if tag == _TAG_NULL:
+        return None, offset
+    if tag == _TAG_FALSE or tag == _TAG_TRUE:
+        return tag == _TAG_TRUE, offset
+    if tag == _TAG_INT:
+        return _read_varint(raw, offset)
+    if tag == _TAG_FLOAT:
+        if offset + _F64.size > len(raw):
+            raise ValueError("Malformed envelope member")
+        return _F64.unpack_from(raw, offset)[0], offset + _F64.size
+    if tag == _TAG_STR:
+        size, offset = _read_uvarint(raw, offset)
+        if offset + size > len(raw):
+            raise ValueError("Malformed envelope member")
+        return str(raw[offset : offset + size], "utf-8"), offset + size
+    if tag == _TAG_LIST:
+        count, offset = _read_uvarint(raw, offset)
+        items = []
+        for _ in range(count):
+            item, offset = _read_value(raw, offset, keys)
+            items.append(item)
+        return items, offset
+    if tag == _TAG_DICT:
+        count, offset = _read_uvarint(raw, offset)
+        mapping: dict[str, object] = {}
+        for _ in range(count):
+            key_id, offset = _read_uvarint(raw, offset)
+            if key_id >= len(keys):
+                raise ValueError("Malformed envelope member")
+            mapping[keys[key_id]], offset = _read_value(raw, offset, keys)
+        return mapping, offset
+    raise ValueError(f"Unknown envelope value tag: {tag}")
+
+
+def encode_envelope(payloads: list[dict[str, object]]) -> str:
+    """Pack ``payloads`` in order into one ``XDE1`` token with a single checksum."""
+
+    keys: set[str] = set()
+    for payload in payloads:
+        if not isinstance(payload, dict):
+            raise ValueError("Envelope members must be payload objects")
+        _collect_keys(payload, keys)
+    key_table = sorted(keys)
+    key_ids = {key: i for i, key in enumerate(key_table)}
+
+    members = bytearray()
+    ends: list[int] = []
+    for payload in payloads:
+        _put_value(members, payload, key_ids)
+        ends.append(len(members))
+    if members and ends[-1] > 0xFFFFFFFF:
+        raise ValueError("Envelope exceeds 4 GiB member area")
+
+    body = bytearray()
+    _put_uvarint(body, len(payloads))
+    _put_uvarint(body, len(key_table))
+    for key in key_table:
+        data = key.encode("utf-8")
+        _put_uvarint(body, len(data))
+        body += data
+    for end in ends:
+        body += _U32.pack(end)
+    body += members
+    return f"{ENVELOPE_VERSION}.{_to_b64url(bytes(body))}.{_checksum8(bytes(body))}"
+
+
+class EnvelopeReader:
+    """Random access to the members of an ``XDE1`` token.
+
+    The checksum and key table are checked once on construction; each member
+    is decoded on first access only.
+    """
+
+    def __init__(self, token: str) -> None:
+        version, payload, checksum = token.split(".")
+        if version != ENVELOPE_VERSION:
+            raise ValueError(f"Unsupported envelope version: {version}")
+        raw = _from_b64url(payload)
+        if _checksum8(raw) != checksum:
+            raise ValueError("Checksum mismatch")
+        view = memoryview(raw)
+        count, offset = _read_uvarint(view, 0)
+        key_count, offset = _read_uvarint(view, offset)
+        keys: list[str] = []
+        for _ in range(key_count):
+            size, offset = _read_uvarint(view, offset)
+            if offset + size > len(view):
+                raise ValueError("Malformed envelope header")
+            keys.append(str(view[offset : offset + size], "utf-8"))
+            offset += size
+        index_end = offset + count * _U32.size
+        if index_end > len(view):
+            raise ValueError("Malformed envelope header")
+        self._ends = [_U32.unpack_from(view, offset + i * _U32.size)[0] for i in range(count)]
+        self._members = view[index_end:]
+        if (self._ends[-1] if count else 0) != len(self._members) or self._ends != sorted(self._ends):
+            raise ValueError("Malformed envelope index")
+        self._keys = keys
+        self._cache: dict[int, dict[str, object]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def __getitem__(self, index: int) -> dict[str, object]:
+        if index < 0:
+            index += len(self._ends)
+        if not 0 <= index < len(self._ends):
+            raise IndexError("Envelope member index out of range")
+        if index not in self._cache:
+            start = self._ends[index - 1] if index else 0
+            member = self._members[start : self._ends[index]]
+            value, consumed = _read_value(member, 0, self._keys)
+            if consumed != len(member) or not isinstance(value, dict):
+                raise ValueError("Malformed envelope member")
+            self._cache[index] = value
+        return self._cache[index]
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+def decode_envelope(token: str) -> list[dict[str, object]]:
+    return list(EnvelopeReader(token))
@@ -9,7 +9,7 @@ This module provides hot-swappable, serializable engines used by Codex runtime l
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from typing import Dict, Iterable, Literal
 
 ResidueClass = Literal["polar", "nonpolar", "charged+", "charged-", "special"]
@@ -92,6 +92,11 @@ class FoldRecordV1:
             misfold_events=list(tick.misfold_events),
         )
 
+    def to_payload(self) -> dict:
+        """Shallow payload dict for the codec; lists are shared, not copied."""
+
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
 
 @dataclass
 class AffinityEngine:
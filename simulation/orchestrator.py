@@ -1,21 +1,35 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import itertools
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable
 
-from codex_eigenstate import decode_payload, encode_payload
+from burzen_checkpoint import BurzenCheckpoint
+from codex_eigenstate import decode_payload, encode_payload, encode_payload_binary
 from burzen_td import (
     FOUR_SLOT_LOADOUT,
     BurzenTDState,
     CampaignProgress,
+    CouplingMatrix,
     CustomSettings,
-    InfiniteMode,
+    EigenstateDelta,
     SimulationConfig,
+    TickPlan,
     TowerArchetype,
     TowerState,
     advance_campaign,
     burzen_step,
     build_campaign_levels,
+    compile_tick_plan,
+    complete_coupling,
+    run,
     validate_loadout,
+    wave_log_strength,
+    wave_strength,
 )
 
 
@@ -25,20 +39,226 @@ class LevelRuntime:
     level_tick: int = 0
 
 
+DEFAULT_MAX_SESSIONS = 256
+DEFAULT_SESSION_IDLE_SECONDS = 600.0
+ACTION_SCHEMA = "burzen_action_v1"
+BATCH_ACTION_SCHEMA = "burzen_batch_action_v1"
+MAX_BATCH_TICKS = 10_000
+
+
+@dataclass
+class LevelSession:
+    """Simulation state carried between ticks of one level run."""
+
+    session_id: str
+    level: int
+    loadout: tuple[TowerArchetype, ...]
+    state: BurzenTDState
+    couplings: CouplingMatrix
+    heat_diffusion: CouplingMatrix
+    plan: TickPlan
+    config: SimulationConfig
+    last_used: float = field(default=0.0, compare=False)
+    # Held while the session's state is read or advanced.
+    lock: threading.Lock = field(default_factory=threading.Lock, compare=False, repr=False)
+
+
+def _resolve_config(action: dict[str, object]) -> SimulationConfig:
+    config = SimulationConfig()
+    if "custom" in action:
+        custom = action["custom"]
+        settings = CustomSettings(
+            allowed_towers=tuple(TowerArchetype(item) for item in custom.get("allowed_towers", [t.value for t in TowerArchetype])),
+            map_energy_scalar=float(custom.get("map_energy_scalar", 1.0)),
+            map_heat_scalar=float(custom.get("map_heat_scalar", 1.0)),
+            override_alpha=custom.get("alpha"),
+            override_beta=custom.get("beta"),
+        )
+        if settings.override_alpha is not None:
+            config.alpha = float(settings.override_alpha)
+        if settings.override_beta is not None:
+            config.beta = float(settings.override_beta)
+    return config
+
+
+def action_session(action: dict[str, object]) -> str | None:
+    """Return the session a tick or batch action names, or None if it names none.
+
+    Raises ValueError when a batch's actions name more than one session.
+    """
+
+    items = action.get("actions")
+    if isinstance(items, list):
+        named = {str(item["session"]) for item in items if isinstance(item, dict) and "session" in item}
+        if len(named) > 1:
+            raise ValueError("Batch actions must all name the same session")
+        return named.pop() if named else None
+    return str(action["session"]) if "session" in action else None
+
+
+def _delta_payload(delta: EigenstateDelta) -> dict[str, object]:
+    return {
+        "schema": "eigenstate_delta_v1",
+        "tick": delta.tick,
+        "energy": {
+            "lambda2": delta.energy_lambda2,
+            "lambda3": delta.energy_lambda3,
+            "fiedler_sign_balance": delta.fiedler_sign_balance,
+        },
+        "heat": {
+            "mean": delta.heat_mean,
+            "std": delta.heat_std,
+            "q95": delta.heat_q95,
+            "instability_count": delta.instability_count,
+        },
+    }
+
+
+def _delta_series_payload(deltas: list[EigenstateDelta]) -> dict[str, object]:
+    # Columnar so a long series repeats each key once rather than once per tick.
+    return {
+        "schema": "eigenstate_delta_batch_v1",
+        "count": len(deltas),
+        "tick": [d.tick for d in deltas],
+        "energy": {
+            "lambda2": [d.energy_lambda2 for d in deltas],
+            "lambda3": [d.energy_lambda3 for d in deltas],
+            "fiedler_sign_balance": [d.fiedler_sign_balance for d in deltas],
+        },
+        "heat": {
+            "mean": [d.heat_mean for d in deltas],
+            "std": [d.heat_std for d in deltas],
+            "q95": [d.heat_q95 for d in deltas],
+            "instability_count": [d.instability_count for d in deltas],
+        },
+    }
+
+
 class WasmutableOrchestrator:
-    """Deterministic payload-only orchestrator for BURZEN TD v1.0."""
+    """Deterministic payload-only orchestrator for BURZEN TD v1.0.
 
-    def __init__(self) -> None:
+    ``start_level`` opens a session that owns the level's ``BurzenTDState``,
+    couplings, compiled tick plan and config; tick actions naming that session
+    advance it in place. Sessions idle for longer than ``session_idle_seconds``
+    are evicted, and the least recently used one is dropped once more than
+    ``max_sessions`` are open. Tick actions without a session keep the original
+    stateless behaviour. With ``binary_deltas`` single-tick deltas are answered
+    as compact XDX2 tokens; ``decode_payload`` reads either format.
+
+    The session table and campaign progress are guarded by one short-held lock
+    and each session's state by its own, so calls for different sessions may
+    run on different threads at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        session_idle_seconds: float = DEFAULT_SESSION_IDLE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        binary_deltas: bool = False,
+    ) -> None:
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
         self.levels = build_campaign_levels()
         self.runtime = LevelRuntime(progress=CampaignProgress())
+        self.max_sessions = max_sessions
+        self.session_idle_seconds = session_idle_seconds
+        self._clock = clock
+        self._encode_delta = encode_payload_binary if binary_deltas else encode_payload
+        self._sessions: OrderedDict[str, LevelSession] = OrderedDict()
+        self._session_ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    @property
+    def session_count(self) -> int:
+        return len(self._sessions)
+
+    def evict_idle_sessions(self) -> list[str]:
+        """Drop sessions idle past the limit, then LRU sessions over capacity."""
+
+        with self._lock:
+            cutoff = self._clock() - self.session_idle_seconds
+            evicted: list[str] = []
+            # The dict is kept in use order, so idle sessions are all at the front.
+            while self._sessions:
+                session_id, session = next(iter(self._sessions.items()))
+                if session.last_used > cutoff and len(self._sessions) <= self.max_sessions:
+                    break
+                del self._sessions[session_id]
+                evicted.append(session_id)
+            return evicted
 
-    def _decode_action(self, action_payload: str) -> dict[str, object]:
+    def session(self, session_id: str) -> LevelSession:
+        with self._lock:
+            self.evict_idle_sessions()
+            try:
+                session = self._sessions[session_id]
+            except KeyError:
+                raise ValueError(f"Unknown or expired session: {session_id}") from None
+            session.last_used = self._clock()
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def close_session(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def export_session(self, session_id: str) -> bytes:
+        """Return the session's simulation state as a BZCK checkpoint."""
+
+        session = self.session(session_id)
+        with session.lock:
+            return BurzenCheckpoint.from_state(session.state).save()
+
+    def restore_session(self, session_id: str, checkpoint: bytes) -> None:
+        """Replace the session's state with one saved by ``export_session``."""
+
+        session = self.session(session_id)
+        state = BurzenCheckpoint.load(checkpoint).to_state()
+        if tuple(t.archetype for t in state.towers) != session.loadout:
+            raise ValueError("Checkpoint does not match the session loadout")
+        with session.lock:
+            session.state = state
+
+    def _open_session(
+        self,
+        level: int,
+        loadout: tuple[TowerArchetype, ...],
+        config: SimulationConfig,
+        session_id: str | None = None,
+    ) -> LevelSession:
+        state = BurzenTDState(towers=[TowerState(archetype=t) for t in loadout])
+        couplings = complete_coupling(len(loadout), 0.08)
+        heat_diff = complete_coupling(len(loadout), 0.05)
+        plan = compile_tick_plan(state, couplings, heat_diff)
+        with self._lock:
+            if session_id is None:
+                session_id = f"s{next(self._session_ids):06d}"
+            elif session_id in self._sessions:
+                raise ValueError(f"Session already open: {session_id}")
+            session = LevelSession(
+                session_id=session_id,
+                level=level,
+                loadout=loadout,
+                state=state,
+                couplings=couplings,
+                heat_diffusion=heat_diff,
+                plan=plan,
+                config=config,
+                last_used=self._clock(),
+            )
+            self._sessions[session_id] = session
+            self.evict_idle_sessions()
+        return session
+
+    def _decode_action(self, action_payload: str, schema: str = ACTION_SCHEMA) -> dict[str, object]:
         payload = decode_payload(action_payload)
-        if payload.get("schema") != "burzen_action_v1":
+        if payload.get("schema") != schema:
             raise ValueError("Unsupported action schema")
         return payload
 
-    def start_level(self, action_payload: str) -> str:
+    def start_level(self, action_payload: str, session_id: str | None = None) -> str:
         action = self._decode_action(action_payload)
         loadout = tuple(TowerArchetype(item) for item in action.get("loadout", []))
         validate_loadout(loadout)
@@ -49,10 +269,12 @@ class WasmutableOrchestrator:
         if not set(loadout).issubset(unlocked):
             raise ValueError("Loadout contains locked towers for level")
 
+        session = self._open_session(level_index, loadout, _resolve_config(action), session_id)
         self.runtime.level_tick = 0
         return encode_payload(
             {
                 "schema": "burzen_level_started_v1",
+                "session": session.session_id,
                 "level": level_index,
                 "tick": self.runtime.level_tick,
                 "slot_limit": FOUR_SLOT_LOADOUT,
@@ -62,70 +284,93 @@ class WasmutableOrchestrator:
             }
         )
 
-    def run_level_tick(self, action_payload: str) -> str:
-        action = self._decode_action(action_payload)
+    def _tick(self, action: dict[str, object]) -> EigenstateDelta:
+        if "session" in action:
+            session = self.session(str(action["session"]))
+            with session.lock:
+                delta = burzen_step(session.state, session.couplings, session.heat_diffusion, session.config, plan=session.plan)
+            self.runtime.level_tick = delta.tick
+            return delta
+
         loadout = tuple(TowerArchetype(item) for item in action["loadout"])
         validate_loadout(loadout)
 
-        config = SimulationConfig()
-        if "custom" in action:
-            custom = action["custom"]
-            settings = CustomSettings(
-                allowed_towers=tuple(TowerArchetype(item) for item in custom.get("allowed_towers", [t.value for t in TowerArchetype])),
-                map_energy_scalar=float(custom.get("map_energy_scalar", 1.0)),
-                map_heat_scalar=float(custom.get("map_heat_scalar", 1.0)),
-                override_alpha=custom.get("alpha"),
-                override_beta=custom.get("beta"),
-            )
-            if settings.override_alpha is not None:
-                config.alpha = float(settings.override_alpha)
-            if settings.override_beta is not None:
-                config.beta = float(settings.override_beta)
-
+        config = _resolve_config(action)
         towers = [TowerState(archetype=t) for t in loadout]
         state = BurzenTDState(towers=towers, tick=int(action.get("tick", 0)))
-        n = len(towers)
-        couplings = [[0.0 if i == j else 0.08 for j in range(n)] for i in range(n)]
-        heat_diff = [[0.0 if i == j else 0.05 for j in range(n)] for i in range(n)]
+        couplings = complete_coupling(len(towers), 0.08)
+        heat_diff = complete_coupling(len(towers), 0.05)
         delta = burzen_step(state, couplings, heat_diff, config=config)
 
         self.runtime.level_tick = state.tick
-        return encode_payload(
-            {
-                "schema": "eigenstate_delta_v1",
-                "tick": delta.tick,
-                "energy": {
-                    "lambda2": delta.energy_lambda2,
-                    "lambda3": delta.energy_lambda3,
-                    "fiedler_sign_balance": delta.fiedler_sign_balance,
-                },
-                "heat": {
-                    "mean": delta.heat_mean,
-                    "std": delta.heat_std,
-                    "q95": delta.heat_q95,
-                    "instability_count": delta.instability_count,
-                },
-            }
-        )
+        return delta
+
+    def run_level_tick(self, action_payload: str) -> str:
+        return self._encode_delta(_delta_payload(self._tick(self._decode_action(action_payload))))
+
+    def run_level_batch(self, action_payload: str) -> str:
+        """Run many ticks from one token and answer with one delta-series token.
+
+        The batch either fast-forwards a session (``{"session", "ticks"}`` with an
+        optional ``"stride"`` to sample every k-th tick) or replays a list of
+        tick actions (``{"actions": [...]}``) in order, so the codec cost is paid
+        once per batch instead of once per tick.
+        """
+
+        action = self._decode_action(action_payload, BATCH_ACTION_SCHEMA)
+        if "actions" in action:
+            items = action["actions"]
+            if not isinstance(items, list) or len(items) > MAX_BATCH_TICKS:
+                raise ValueError(f"Batch actions must be a list of at most {MAX_BATCH_TICKS} items")
+            deltas = []
+            for item in items:
+                if not isinstance(item, dict) or item.get("schema", ACTION_SCHEMA) != ACTION_SCHEMA:
+                    raise ValueError("Unsupported action schema")
+                deltas.append(self._tick(item))
+        elif "session" in action:
+            ticks = int(action.get("ticks", 1))
+            if not 0 < ticks <= MAX_BATCH_TICKS:
+                raise ValueError(f"Batch ticks must be between 1 and {MAX_BATCH_TICKS}")
+            stride = action.get("stride")
+            session = self.session(str(action["session"]))
+            with session.lock:
+                deltas = run(
+                    session.state,
+                    session.couplings,
+                    session.heat_diffusion,
+                    ticks,
+                    session.config,
+                    stride=int(stride) if stride is not None else 1,
+                    plan=session.plan,
+                )
+                self.runtime.level_tick = session.state.tick
+        else:
+            raise ValueError("Batch action needs either actions or a session")
+        return encode_payload(_delta_series_payload(deltas))
 
-    def complete_level(self, won: bool) -> str:
-        self.runtime.progress = advance_campaign(self.runtime.progress, won)
+    def complete_level(self, won: bool, session_id: str | None = None) -> str:
+        with self._lock:
+            if session_id is not None:
+                self.close_session(session_id)
+            progress = self.runtime.progress = advance_campaign(self.runtime.progress, won)
         return encode_payload(
             {
                 "schema": "campaign_progress_v1",
-                "current_level": self.runtime.progress.current_level,
-                "completed_levels": list(self.runtime.progress.completed_levels),
+                "current_level": progress.current_level,
+                "completed_levels": list(progress.completed_levels),
             }
         )
 
     def next_infinite_wave(self, seed: int, wave_index: int, entropy: float = 0.2) -> str:
-        mode = InfiniteMode(seed=seed, wave_index=wave_index, entropy=entropy)
-        strength = mode.next_wave_strength()
+        log_strength = wave_log_strength(seed, wave_index, entropy)
+        strength = wave_strength(seed, wave_index, entropy)
         return encode_payload(
             {
                 "schema": "infinite_wave_v1",
                 "seed": seed,
                 "wave_index": wave_index,
-                "difficulty": strength,
+                # Deep waves exceed float range; clients then rely on log_difficulty.
+                "difficulty": strength if math.isfinite(strength) else None,
+                "log_difficulty": log_strength,
             }
         )
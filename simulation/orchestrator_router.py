@@ -0,0 +1,444 @@
+"""Shard ``WasmutableOrchestrator`` sessions across worker processes.
+
+``ShardedOrchestrator`` runs one orchestrator per worker process and pins each
+session to a worker by rendezvous hashing of the session id over the live
+workers; session-less calls hash their ``key`` (e.g. the infinite-mode seed).
+Requests to one worker travel over a single pipe and are executed in order, so
+a session sees its requests in submission order.
+
+Tick and batch calls without ``session=`` are routed by the session their
+action token names, so they reach the session's worker as in one process.
+
+The router owns session lifetime (idle and LRU eviction) and keeps a
+run-length encoded log of every request a worker has answered for a session.
+Every ``checkpoint_interval`` logged requests the worker exports the session as
+a BZCK checkpoint and the log is truncated behind it, so the log stays bounded.
+When a worker dies, its sessions move to their next rendezvous owner, where
+each is reopened, restored from its checkpoint and replayed from the log, and
+in-flight requests are resubmitted behind the replay. The simulation is
+deterministic, so a moved session continues bit for bit. Campaign progress is
+held by the router, so ``start_level`` without a level and ``complete_level``
+behave as on a single ``WasmutableOrchestrator`` regardless of sharding.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import math
+import multiprocessing
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from typing import Callable
+
+from burzen_td import CampaignProgress, advance_campaign
+from codex_eigenstate import decode_payload, encode_payload
+from orchestrator import (
+    ACTION_SCHEMA,
+    DEFAULT_MAX_SESSIONS,
+    DEFAULT_SESSION_IDLE_SECONDS,
+    WasmutableOrchestrator,
+    action_session,
+)
+
+DEFAULT_CHECKPOINT_INTERVAL = 256
+
+_WORKER_METHODS = frozenset(
+    {
+        "start_level",
+        "run_level_tick",
+        "run_level_batch",
+        "next_infinite_wave",
+        "close_session",
+        "export_session",
+        "restore_session",
+    }
+)
+_ACTION_METHODS = frozenset({"run_level_tick", "run_level_batch"})
+
+
+class WorkerDied(RuntimeError):
+    """Raised for requests that cannot be placed because no worker is alive."""
+
+
+def _worker_main(conn: Connection) -> None:
+    # The router evicts sessions itself, so the worker never drops one on its own.
+    orchestrator = WasmutableOrchestrator(max_sessions=sys.maxsize, session_idle_seconds=math.inf)
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        request_id, method, args = message
+        started = time.perf_counter()
+        try:
+            if method not in _WORKER_METHODS:
+                raise ValueError(f"Unknown method: {method}")
+            ok, value = True, getattr(orchestrator, method)(*args)
+        except Exception as exc:  # returned to the caller as a ValueError
+            ok, value = False, str(exc)
+        conn.send((request_id, ok, value, time.perf_counter() - started))
+    conn.close()
+
+
+@dataclass
+class _Pending:
+    method: str
+    args: tuple
+    session: str | None
+    key: object
+    future: Future | None  # None for replay traffic
+
+
+@dataclass
+class WorkerLoad:
+    index: int
+    pid: int | None
+    alive: bool
+    sessions: int
+    in_flight: int
+    completed: int
+    busy_seconds: float
+    sessions_moved_in: int
+
+
+@dataclass
+class _Worker:
+    index: int
+    process: multiprocessing.process.BaseProcess
+    conn: Connection
+    alive: bool = True
+    pending: dict[int, _Pending] = field(default_factory=dict)
+    completed: int = 0
+    busy_seconds: float = 0.0
+    sessions_moved_in: int = 0
+    receiver: threading.Thread | None = None
+
+
+@dataclass
+class _Route:
+    owner: int
+    start: tuple | None = None  # start_level args, set once the worker accepted them
+    checkpoint: bytes | None = None
+    log: list[list] = field(default_factory=list)  # requests answered since ``checkpoint``
+    logged: int = 0
+    exporting: bool = False
+    last_used: float = 0.0
+
+    def replay(self, session_id: str) -> list[tuple[str, tuple]]:
+        if self.start is None:
+            return []  # start_level is still in flight and is resubmitted itself
+        calls = [("start_level", self.start)]
+        if self.checkpoint is not None:
+            calls.append(("restore_session", (session_id, self.checkpoint)))
+        calls.extend((method, args) for method, args, count in self.log for _ in range(count))
+        return calls
+
+
+def _weight(key: object, index: int) -> bytes:
+    return hashlib.blake2b(f"{key}|{index}".encode("utf-8"), digest_size=8).digest()
+
+
+def _decode_action(token: object) -> dict[str, object] | None:
+    # Malformed tokens are passed through; the worker reports the error.
+    try:
+        action = decode_payload(str(token))
+    except ValueError:
+        return None
+    return action if isinstance(action, dict) else None
+
+
+class ShardedOrchestrator:
+    """Front router over ``workers`` orchestrator processes."""
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        *,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        session_idle_seconds: float = DEFAULT_SESSION_IDLE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        start_method: str | None = None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    ) -> None:
+        count = workers or multiprocessing.cpu_count()
+        if count < 1:
+            raise ValueError("workers must be at least 1")
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be at least 1")
+        self.max_sessions = max_sessions
+        self.session_idle_seconds = session_idle_seconds
+        self.checkpoint_interval = checkpoint_interval
+        self.progress = CampaignProgress()
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._request_ids = itertools.count(1)
+        self._session_ids = itertools.count(1)
+        self._routes: OrderedDict[str, _Route] = OrderedDict()
+
+        context = multiprocessing.get_context(start_method)
+        self.workers: list[_Worker] = []
+        for index in range(count):
+            parent, child = context.Pipe()
+            process = context.Process(target=_worker_main, args=(child,), name=f"burzen-shard-{index}", daemon=True)
+            process.start()
+            child.close()
+            self.workers.append(_Worker(index=index, process=process, conn=parent))
+        # Receivers start only after every fork so no child inherits a running thread.
+        for worker in self.workers:
+            worker.receiver = threading.Thread(target=self._receive, args=(worker,), daemon=True)
+            worker.receiver.start()
+
+    def __enter__(self) -> "ShardedOrchestrator":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            workers = [w for w in self.workers if w.alive]
+            for worker in workers:
+                worker.alive = False
+                try:
+                    worker.conn.send(None)
+                except OSError:
+                    pass
+        for worker in self.workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.kill()
+            worker.conn.close()
+
+    # Routing -------------------------------------------------------------
+
+    def _owner_for(self, key: object) -> _Worker:
+        live = [w for w in self.workers if w.alive]
+        if not live:
+            raise WorkerDied("All orchestrator workers have died")
+        return max(live, key=lambda w: _weight(key, w.index))
+
+    def _target(self, pending: _Pending) -> _Worker:
+        if pending.session is not None and pending.session in self._routes:
+            return self.workers[self._routes[pending.session].owner]
+        return self._owner_for(pending.key)
+
+    def _send(self, worker: _Worker, pending: _Pending) -> None:
+        request_id = next(self._request_ids)
+        worker.pending[request_id] = pending
+        try:
+            worker.conn.send((request_id, pending.method, pending.args))
+        except OSError:
+            # Left pending: the receiver sees the broken pipe and resubmits it.
+            pass
+
+    def evict_idle_sessions(self) -> list[str]:
+        with self._lock:
+            cutoff = self._clock() - self.session_idle_seconds
+            evicted: list[str] = []
+            while self._routes:
+                session_id, route = next(iter(self._routes.items()))
+                if route.last_used > cutoff and len(self._routes) <= self.max_sessions:
+                    break
+                del self._routes[session_id]
+                evicted.append(session_id)
+                worker = self.workers[route.owner]
+                if worker.alive:
+                    self._send(worker, _Pending("close_session", (session_id,), None, session_id, None))
+            return evicted
+
+    def submit(self, method: str, *args: object, session: str | None = None, key: object = None) -> Future:
+        """Queue ``method(*args)`` on the owning worker and return its future.
+
+        ``session`` pins the call to that session's worker; ``start_level``
+        without one opens a new session id, and tick or batch actions default
+        to the session their token names. Other calls are placed by ``key``,
+        or by the action token for session-less ticks. ``complete_level`` is
+        answered by the router, which holds the campaign progress.
+        """
+
+        future: Future = Future()
+        with self._lock:
+            if method == "complete_level":
+                future.set_result(self._complete_level(*args))
+                return future
+            if method == "start_level":
+                if session is None:
+                    session = f"s{next(self._session_ids):06d}"
+                if session in self._routes:
+                    raise ValueError(f"Session already open: {session}")
+                self._routes[session] = _Route(owner=self._owner_for(session).index)
+                args = (self._with_current_level(args[0]), *args[1:], session)
+            elif method in _ACTION_METHODS:
+                action = _decode_action(args[0]) if args else None
+                named = action_session(action) if action is not None else None
+                if session is None:
+                    session = named
+                elif named is not None and named != session:
+                    raise ValueError(f"Action names session {named} but was routed to {session}")
+                if session is None and key is None and args:
+                    key = args[0]
+            if session is not None:
+                if session not in self._routes:
+                    raise ValueError(f"Unknown or expired session: {session}")
+                route = self._routes[session]
+                route.last_used = self._clock()
+                self._routes.move_to_end(session)
+            pending = _Pending(method, args, session, key if key is not None else session, future)
+            self._send(self._target(pending), pending)
+            self.evict_idle_sessions()
+        return future
+
+    # Synchronous API mirroring WasmutableOrchestrator --------------------------
+
+    def start_level(self, action_payload: str) -> str:
+        return self.submit("start_level", action_payload).result()
+
+    def run_level_tick(self, action_payload: str, session: str | None = None) -> str:
+        return self.submit("run_level_tick", action_payload, session=session).result()
+
+    def run_level_batch(self, action_payload: str, session: str | None = None) -> str:
+        return self.submit("run_level_batch", action_payload, session=session).result()
+
+    def complete_level(self, won: bool, session_id: str | None = None) -> str:
+        return self.submit("complete_level", won, session_id).result()
+
+    def next_infinite_wave(self, seed: int, wave_index: int, entropy: float = 0.2) -> str:
+        return self.submit("next_infinite_wave", seed, wave_index, entropy, key=seed).result()
+
+    @property
+    def session_count(self) -> int:
+        return len(self._routes)
+
+    def worker_loads(self) -> list[WorkerLoad]:
+        with self._lock:
+            pinned = [0] * len(self.workers)
+            for route in self._routes.values():
+                pinned[route.owner] += 1
+            return [
+                WorkerLoad(
+                    index=w.index,
+                    pid=w.process.pid,
+                    alive=w.alive,
+                    sessions=pinned[w.index],
+                    in_flight=len(w.pending),
+                    completed=w.completed,
+                    busy_seconds=w.busy_seconds,
+                    sessions_moved_in=w.sessions_moved_in,
+                )
+                for w in self.workers
+            ]
+
+    # Campaign progress ------------------------------------------------------
+
+    def _with_current_level(self, action_payload: object) -> object:
+        action = _decode_action(action_payload)
+        if action is None or action.get("schema") != ACTION_SCHEMA or "level" in action:
+            return action_payload
+        return encode_payload({**action, "level": self.progress.current_level})
+
+    def _complete_level(self, won: bool, session_id: str | None = None) -> str:
+        route = self._routes.pop(session_id, None) if session_id is not None else None
+        if route is not None and self.workers[route.owner].alive:
+            self._send(self.workers[route.owner], _Pending("close_session", (session_id,), None, session_id, None))
+        self.progress = advance_campaign(self.progress, won)
+        return encode_payload(
+            {
+                "schema": "campaign_progress_v1",
+                "current_level": self.progress.current_level,
+                "completed_levels": list(self.progress.completed_levels),
+            }
+        )
+
+    # Responses and failover ------------------------------------------------
+
+    def _receive(self, worker: _Worker) -> None:
+        while True:
+            try:
+                request_id, ok, value, elapsed = worker.conn.recv()
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                pending = worker.pending.pop(request_id, None)
+                worker.completed += 1
+                worker.busy_seconds += elapsed
+                if pending is not None and pending.method == "export_session":
+                    self._checkpointed(worker, pending.session, ok, value)
+                if pending is None or pending.future is None:
+                    continue
+                self._record(pending, ok)
+            if ok:
+                pending.future.set_result(value)
+            else:
+                pending.future.set_exception(ValueError(value))
+        self._worker_lost(worker)
+
+    def _record(self, pending: _Pending, ok: bool) -> None:
+        route = self._routes.get(pending.session) if pending.session is not None else None
+        if route is None:
+            return
+        if pending.method == "start_level":
+            if ok:
+                route.start = pending.args
+            else:
+                del self._routes[pending.session]
+            return
+        # Failed requests are logged too: replay must fail the same way to
+        # reproduce any partial effect (e.g. a batch rejected mid-list).
+        entry = [pending.method, pending.args]
+        if route.log and route.log[-1][:2] == entry:
+            route.log[-1][2] += 1
+        else:
+            route.log.append([*entry, 1])
+        route.logged += 1
+        if route.logged >= self.checkpoint_interval and not route.exporting:
+            # The worker answers in order, so the checkpoint covers exactly the
+            # requests sent before it, which are the ones logged when it arrives.
+            route.exporting = True
+            request = _Pending("export_session", (pending.session,), pending.session, pending.session, None)
+            self._send(self.workers[route.owner], request)
+
+    def _checkpointed(self, worker: _Worker, session_id: str | None, ok: bool, checkpoint: object) -> None:
+        route = self._routes.get(session_id) if session_id is not None else None
+        if route is None or route.owner != worker.index:
+            return
+        route.exporting = False
+        if ok:
+            route.checkpoint = checkpoint
+            route.log.clear()
+            route.logged = 0
+
+    def _worker_lost(self, worker: _Worker) -> None:
+        with self._lock:
+            was_alive = worker.alive
+            worker.alive = False
+            orphaned = list(worker.pending.values())
+            worker.pending.clear()
+            if not was_alive and not orphaned:
+                return
+            live = [w for w in self.workers if w.alive]
+            if not live:
+                for pending in orphaned:
+                    if pending.future is not None:
+                        pending.future.set_exception(WorkerDied("All orchestrator workers have died"))
+                return
+
+            for session_id, route in self._routes.items():
+                if route.owner != worker.index:
+                    continue
+                owner = self._owner_for(session_id)
+                route.owner = owner.index
+                route.exporting = False
+                owner.sessions_moved_in += 1
+                for method, args in route.replay(session_id):
+                    self._send(owner, _Pending(method, args, session_id, session_id, None))
+            for pending in orphaned:
+                if pending.future is not None and pending.method != "close_session":
+                    self._send(self._target(pending), pending)
@@ -0,0 +1,339 @@
+"""Asyncio JSON-lines service hosting ``WasmutableOrchestrator`` sessions.
+
+Each request is one JSON object per line::
+
+    {"id": 7, "method": "run_level_tick", "session": "s000001", "token": "XDX1...."}
+
+and is answered with ``{"id": 7, "ok": true, "result": "<token>"}`` or
+``{"id": 7, "ok": false, "error": "..."}``. Responses may arrive out of order
+across sessions; ``id`` correlates them.
+
+Requests are routed into lanes: one per session, or one per connection for
+requests without a session (``start_level`` and friends). The session is the
+one the request's action token (or ``complete_level`` params) names; a
+``session`` field that disagrees with it is rejected. Tick and
+batch tokens are decoded for routing on the executor while the connection
+keeps being read; a per-connection router task then hands requests to their
+lanes in arrival order. Every lane runs its requests strictly in arrival order
+through a bounded queue; when a lane is full the router and then the
+connection stop until it drains, which pushes back on the client through the
+socket. Orchestrator calls run on an executor so the event
+loop keeps serving other connections while a batch is being simulated; the
+orchestrator locks each session separately, so lanes for different sessions
+run concurrently.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Sequence
+
+from codex_eigenstate import decode_payload
+from orchestrator import WasmutableOrchestrator, action_session
+
+DEFAULT_QUEUE_SIZE = 64
+MAX_LINE_BYTES = 1 << 20
+
+_TOKEN_METHODS = ("start_level", "run_level_tick", "run_level_batch")
+_SESSION_TOKEN_METHODS = ("run_level_tick", "run_level_batch")
+
+
+@dataclass
+class _Lane:
+    queue: asyncio.Queue
+    task: asyncio.Task | None = None
+
+
+@dataclass
+class _Request:
+    request_id: object
+    call: Callable[[], object]
+    respond: Callable[[dict[str, object]], Awaitable[None]]
+
+
+@dataclass
+class ServerStats:
+    requests: int = 0
+    errors: int = 0
+    connections: int = 0
+    peak_lanes: int = 0
+    lane_waits: int = 0
+
+
+class OrchestratorServer:
+    """Serve one orchestrator to many concurrent JSON-lines connections."""
+
+    def __init__(
+        self,
+        orchestrator: WasmutableOrchestrator | None = None,
+        *,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        executor: Executor | None = None,
+    ) -> None:
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        self.orchestrator = orchestrator or WasmutableOrchestrator()
+        self.queue_size = queue_size
+        self.stats = ServerStats()
+        self._executor = executor or ThreadPoolExecutor(max_workers=4, thread_name_prefix="burzen-orchestrator")
+        self._owns_executor = executor is None
+        self._lanes: dict[object, _Lane] = {}
+        self._routers: set[asyncio.Task] = set()
+        self._servers: list[asyncio.AbstractServer] = []
+        self._connection_ids = itertools.count(1)
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        server = await asyncio.start_unix_server(self._serve_connection, path=path, limit=MAX_LINE_BYTES)
+        self._servers.append(server)
+        return server
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        server = await asyncio.start_server(self._serve_connection, host, port, limit=MAX_LINE_BYTES)
+        self._servers.append(server)
+        return server
+
+    async def close(self) -> None:
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+        for router in list(self._routers):
+            router.cancel()
+        for lane in list(self._lanes.values()):
+            if lane.task is not None:
+                lane.task.cancel()
+        self._lanes.clear()
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    def _bind(self, message: dict[str, object]) -> Callable[[], object]:
+        method = message.get("method")
+        orchestrator = self.orchestrator
+        if method in _TOKEN_METHODS:
+            token = message.get("token")
+            if not isinstance(token, str):
+                raise ValueError(f"{method} requires a token")
+            return lambda: getattr(orchestrator, method)(token)
+        params = message.get("params") or {}
+        if not isinstance(params, dict):
+            raise ValueError("params must be an object")
+        if method == "complete_level":
+            won = params.get("won")
+            if not isinstance(won, bool):
+                raise ValueError("Invalid params: complete_level requires a boolean 'won'")
+            return lambda: orchestrator.complete_level(won, params.get("session"))
+        if method == "next_infinite_wave":
+            return lambda: orchestrator.next_infinite_wave(
+                int(params["seed"]), int(params["wave_index"]), float(params.get("entropy", 0.2))
+            )
+        raise ValueError(f"Unknown method: {method}")
+
+    def _decode_action(self, message: dict[str, object]) -> asyncio.Future | None:
+        """Start decoding a tick/batch token on the executor, off the event loop."""
+
+        if message.get("method") not in _SESSION_TOKEN_METHODS:
+            return None
+        return asyncio.get_running_loop().run_in_executor(self._executor, decode_payload, message["token"])
+
+    def _lane_session(self, message: dict[str, object], action: object = None) -> object:
+        """Return the session a request acts on, as named by its decoded token or params."""
+
+        method = message.get("method")
+        declared = message.get("session")
+        named: str | None = None
+        if method in _SESSION_TOKEN_METHODS:
+            named = action_session(action) if isinstance(action, dict) else None
+        elif method == "complete_level":
+            session = (message.get("params") or {}).get("session")
+            named = None if session is None else str(session)
+        if named is None:
+            return declared
+        if declared is not None and str(declared) != named:
+            raise ValueError(f"Request session {declared} does not match the session {named} its action names")
+        return named
+
+    async def _run_lane(self, key: object, lane: _Lane) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            request: _Request = await lane.queue.get()
+            try:
+                result = await loop.run_in_executor(self._executor, request.call)
+                response = {"id": request.request_id, "ok": True, "result": result}
+            except Exception as exc:  # reported to the client, the lane keeps going
+                self.stats.errors += 1
+                response = {"id": request.request_id, "ok": False, "error": str(exc)}
+            await request.respond(response)
+            if lane.queue.empty():
+                # Nothing can be enqueued between this check and the removal,
+                # so an idle lane is dropped instead of parking a task per session.
+                del self._lanes[key]
+                return
+
+    async def _route(
+        self,
+        routes: asyncio.Queue,
+        connection: int,
+        respond: Callable[[dict[str, object]], Awaitable[None]],
+    ) -> None:
+        while (item := await routes.get()) is not None:
+            message, call, decoding = item
+            try:
+                session = self._lane_session(message, None if decoding is None else await decoding)
+            except (ValueError, KeyError, TypeError) as exc:
+                self.stats.errors += 1
+                await respond({"id": message.get("id"), "ok": False, "error": str(exc)})
+                continue
+            key = ("session", session) if session is not None else ("connection", connection)
+            await self._enqueue(key, _Request(message.get("id"), call, respond))
+
+    async def _enqueue(self, key: object, request: _Request) -> None:
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = _Lane(queue=asyncio.Queue(maxsize=self.queue_size))
+            self._lanes[key] = lane
+            self.stats.peak_lanes = max(self.stats.peak_lanes, len(self._lanes))
+            lane.task = asyncio.create_task(self._run_lane(key, lane))
+        if lane.queue.full():
+            self.stats.lane_waits += 1
+        await lane.queue.put(request)
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = next(self._connection_ids)
+        self.stats.connections += 1
+        write_lock = asyncio.Lock()
+
+        async def respond(payload: dict[str, object]) -> None:
+            async with write_lock:
+                if writer.is_closing():
+                    return
+                writer.write(json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n")
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    pass
+
+        routes: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        router = asyncio.create_task(self._route(routes, connection, respond))
+        self._routers.add(router)
+        router.add_done_callback(self._routers.discard)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    await respond({"id": None, "ok": False, "error": "Request line too long"})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                self.stats.requests += 1
+                message: object = None
+                try:
+                    message = json.loads(line)
+                    if not isinstance(message, dict):
+                        raise ValueError("Request must be a JSON object")
+                    call = self._bind(message)
+                except (ValueError, KeyError, TypeError) as exc:
+                    self.stats.errors += 1
+                    request_id = message.get("id") if isinstance(message, dict) else None
+                    await respond({"id": request_id, "ok": False, "error": str(exc)})
+                    continue
+                await routes.put((message, call, self._decode_action(message)))
+        except ConnectionError:
+            pass
+        finally:
+            # Requests already read still run; the router drains before the socket closes.
+            if not router.done():
+                await routes.put(None)
+            await asyncio.gather(router, return_exceptions=True)
+            writer.close()
+
+
+class OrchestratorClient:
+    """Minimal asyncio client for ``OrchestratorServer``; pipelines requests by id."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future] = {}
+        self._receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect_unix(cls, path: str) -> "OrchestratorClient":
+        return cls(*await asyncio.open_unix_connection(path, limit=MAX_LINE_BYTES))
+
+    @classmethod
+    async def connect_tcp(cls, host: str, port: int) -> "OrchestratorClient":
+        return cls(*await asyncio.open_connection(host, port, limit=MAX_LINE_BYTES))
+
+    async def _receive(self) -> None:
+        try:
+            while line := await self._reader.readline():
+                response = json.loads(line)
+                future = self._pending.pop(response.get("id"), None)
+                if future is None or future.done():
+                    continue
+                if response.get("ok"):
+                    future.set_result(response["result"])
+                else:
+                    future.set_exception(ValueError(response.get("error", "request failed")))
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Orchestrator connection closed"))
+            self._pending.clear()
+
+    async def call(self, method: str, token: str | None = None, *, session: str | None = None, **params: object) -> object:
+        request_id = next(self._ids)
+        message: dict[str, object] = {"id": request_id, "method": method}
+        if token is not None:
+            message["token"] = token
+        if session is not None:
+            message["session"] = session
+        if params:
+            message["params"] = params
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n")
+        await self._writer.drain()
+        return await future
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self._receiver
+
+
+async def serve(unix_path: str | None, host: str, port: int, queue_size: int) -> None:
+    server = OrchestratorServer(queue_size=queue_size)
+    listener = await (server.start_unix(unix_path) if unix_path else server.start_tcp(host, port))
+    addresses = ", ".join(str(sock.getsockname()) for sock in listener.sockets)
+    print(f"BURZEN orchestrator listening on {addresses}")
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve WasmutableOrchestrator over JSON lines.")
+    parser.add_argument("--unix", default=None, help="Unix socket path (overrides --host/--port)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE)
+    args = parser.parse_args(argv)
+    asyncio.run(serve(args.unix, args.host, args.port, args.queue_size))
+
+
+if __name__ == "__main__":
+    main()
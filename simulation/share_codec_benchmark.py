@@ -0,0 +1,117 @@
+"""Size and decode-time benchmark for XDX1 versus dictionary-compressed XDZ1 tokens.
+
+The corpus is every level JSON under ``android/BurzenTD/levels`` plus
+deterministic random editor share levels (the compact ``s/p/w/h`` form built by
+``docs/core/codec.js``). ``XDZ1 no-dict`` shows what plain raw deflate would give
+without ``SHARE_DICTIONARY``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import random
+import statistics
+import time
+import zlib
+from pathlib import Path
+from typing import Sequence
+
+from codex_eigenstate import (
+    canonical_json_bytes,
+    decode_payload,
+    encode_payload,
+    encode_payload_compressed,
+)
+
+LEVEL_ROOT = Path(__file__).resolve().parent.parent / "android" / "BurzenTD" / "levels"
+
+
+def load_level_corpus(root: Path = LEVEL_ROOT) -> list[dict[str, object]]:
+    return [json.loads(path.read_text(encoding="utf-8")) for path in sorted(root.rglob("*.json"))]
+
+
+def synthetic_share_levels(count: int, seed: int = 0) -> list[dict[str, object]]:
+    """Editor-shaped levels: a self-avoiding path on an s x s grid plus waves."""
+
+    rng = random.Random(seed)
+    levels: list[dict[str, object]] = []
+    for _ in range(count):
+        size = rng.randint(6, 20)
+        path = [(0, rng.randrange(size))]
+        seen = set(path)
+        for _ in range(rng.randint(4, 120)):
+            x, y = path[-1]
+            steps = [(x + dx, y + dy) for dx, dy in ((1, 0), (0, 1), (0, -1), (-1, 0))]
+            steps = [p for p in steps if 0 <= p[0] < size and 0 <= p[1] < size and p not in seen]
+            if not steps:
+                break
+            # Favour moving right so paths look like maps rather than scribbles.
+            step = steps[0] if steps[0][0] > x and rng.random() < 0.5 else rng.choice(steps)
+            path.append(step)
+            seen.add(step)
+        waves = [[rng.randint(1, 9), rng.randint(1, 200)] for _ in range(rng.randint(1, 24))]
+        levels.append({"s": size, "p": [list(p) for p in path], "w": waves, "h": rng.randint(0, 500)})
+    return levels
+
+
+def _plain_deflate_length(payload: dict[str, object]) -> int:
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    body = compressor.compress(canonical_json_bytes(payload, js_numbers=True)) + compressor.flush()
+    return len("XDZ1.") + len(base64.urlsafe_b64encode(body).rstrip(b"=")) + 9
+
+
+def _decode_micros(tokens: Sequence[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for token in tokens:
+            decode_payload(token)
+        best = min(best, time.perf_counter() - started)
+    return best / max(len(tokens), 1) * 1e6
+
+
+def benchmark(payloads: Sequence[dict[str, object]], repeat: int = 5) -> dict[str, float]:
+    plain = [encode_payload(p) for p in payloads]
+    packed = [encode_payload_compressed(p) for p in payloads]
+    if any(decode_payload(t) != decode_payload(u) for t, u in zip(plain, packed)):
+        raise ValueError("XDZ1 round trip diverged from XDX1")
+    plain_sizes = [len(t) for t in plain]
+    packed_sizes = [len(t) for t in packed]
+    return {
+        "levels": len(payloads),
+        "xdx1_mean_chars": statistics.fmean(plain_sizes),
+        "xdz1_mean_chars": statistics.fmean(packed_sizes),
+        "xdz1_no_dict_mean_chars": statistics.fmean(_plain_deflate_length(p) for p in payloads),
+        "xdx1_max_chars": max(plain_sizes),
+        "xdz1_max_chars": max(packed_sizes),
+        "size_ratio": sum(packed_sizes) / sum(plain_sizes),
+        "xdx1_decode_us": _decode_micros(plain, repeat),
+        "xdz1_decode_us": _decode_micros(packed, repeat),
+    }
+
+
+def _report(name: str, result: dict[str, float]) -> None:
+    print(f"{name}: {result['levels']} levels")
+    print(
+        f"  mean chars  XDX1 {result['xdx1_mean_chars']:.0f}  XDZ1 {result['xdz1_mean_chars']:.0f}"
+        f"  XDZ1 no-dict {result['xdz1_no_dict_mean_chars']:.0f}  (ratio {result['size_ratio']:.2f})"
+    )
+    print(f"  max chars   XDX1 {result['xdx1_max_chars']}  XDZ1 {result['xdz1_max_chars']}")
+    print(f"  decode us   XDX1 {result['xdx1_decode_us']:.1f}  XDZ1 {result['xdz1_decode_us']:.1f}")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark XDX1 vs XDZ1 share tokens on the level corpus.")
+    parser.add_argument("--synthetic", type=int, default=200, help="number of random editor levels")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    _report("android level files", benchmark(load_level_corpus(), args.repeat))
+    _report("editor share levels", benchmark(synthetic_share_levels(args.synthetic, args.seed), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
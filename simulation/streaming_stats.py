@@ -0,0 +1,166 @@
+"""Constant-memory run statistics for long BURZEN TD simulations.
+
+``RunningMoments`` merges per-tick batches with the Chan/Welford update and
+``P2Quantile`` is the Jain & Chlamtac P² estimator (five markers, no history).
+``HeatRunAccumulator`` combines both to report heat mean/std/q95 over a whole
+level run without storing per-tick arrays.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Iterable
+
+
+@dataclass
+class RunningMoments:
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def add_many(self, values: Iterable[float]) -> None:
+        batch = list(values)
+        if not batch:
+            return
+        n_b = len(batch)
+        mean_b = math.fsum(batch) / n_b
+        m2_b = math.fsum((v - mean_b) ** 2 for v in batch)
+        total = self.count + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / total
+        self.m2 += m2_b + delta * delta * self.count * n_b / total
+        self.count = total
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+@dataclass
+class P2Quantile:
+    q: float
+    _heights: list[float] = field(default_factory=list)
+    _positions: list[float] = field(default_factory=lambda: [1.0, 2.0, 3.0, 4.0, 5.0])
+    _desired: list[float] = field(default_factory=list)
+    _increments: list[float] = field(default_factory=list)
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.q < 1.0:
+            raise ValueError("q must be in (0, 1)")
+        q = self.q
+        self._desired = [1.0, 1.0 + 2.0 * q, 1.0 + 4.0 * q, 3.0 + 2.0 * q, 5.0]
+        self._increments = [0.0, q / 2.0, q, (1.0 + q) / 2.0, 1.0]
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1.0
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1.0 and positions[i + 1] - positions[i] > 1.0) or (
+                offset <= -1.0 and positions[i - 1] - positions[i] < -1.0
+            ):
+                step = 1.0 if offset > 0 else -1.0
+                candidate = self._parabolic(i, step)
+                if not heights[i - 1] < candidate < heights[i + 1]:
+                    candidate = self._linear(i, step)
+                heights[i] = candidate
+                positions[i] += step
+
+    def add_many(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    @property
+    def value(self) -> float:
+        if self.count == 0:
+            return 0.0
+        if self.count <= 5:
+            idx = min(self.count - 1, max(0, int(math.ceil(self.q * self.count)) - 1))
+            return self._heights[idx]
+        return self._heights[2]
+
+    def _parabolic(self, i: int, step: float) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: float) -> float:
+        j = i + int(step)
+        h, n = self._heights, self._positions
+        return h[i] + step * (h[j] - h[i]) / (n[j] - n[i])
+
+
+@dataclass
+class HeatRunAccumulator:
+    """Whole-run heat mean/std/q95 over every tower sample fed via ``update``."""
+
+    quantile: float = 0.95
+    moments: RunningMoments = field(default_factory=RunningMoments)
+    estimator: P2Quantile = field(init=False)
+    ticks: int = 0
+
+    def __post_init__(self) -> None:
+        self.estimator = P2Quantile(self.quantile)
+
+    def update(self, heat_values: Iterable[float]) -> None:
+        batch = list(heat_values)
+        self.moments.add_many(batch)
+        self.estimator.add_many(batch)
+        self.ticks += 1
+
+    @property
+    def heat_mean(self) -> float:
+        return self.moments.mean
+
+    @property
+    def heat_std(self) -> float:
+        return self.moments.std
+
+    @property
+    def heat_q(self) -> float:
+        return self.estimator.value
+
+    def summary(self) -> dict[str, float | int]:
+        return {
+            "ticks": self.ticks,
+            "samples": self.moments.count,
+            "heat_mean": self.heat_mean,
+            "heat_std": self.heat_std,
+            "heat_q": self.heat_q,
+        }
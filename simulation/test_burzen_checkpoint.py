@@ -0,0 +1,53 @@
+import pytest
+
+from burzen_checkpoint import BurzenCheckpoint
+from burzen_td import BurzenTDState, TowerArchetype, TowerState, build_sparse_coupling, burzen_step, run
+
+
+def _mid_level_state() -> tuple[BurzenTDState, object]:
+    archetypes = list(TowerArchetype)
+    towers = [
+        TowerState(archetype=archetypes[i % 8], energy=20.0 + i, heat=4.0 * i, burst_spend=0.5 * (i % 3))
+        for i in range(10)
+    ]
+    coupling = build_sparse_coupling([(float(i % 5), float(i // 5)) for i in range(10)], cutoff=1.0, weight=0.07)
+    state = BurzenTDState(towers=towers)
+    run(state, coupling, coupling, 25)
+    return state, coupling
+
+
+def test_checkpoint_round_trips_binary_state():
+    state, _ = _mid_level_state()
+    checkpoint = BurzenCheckpoint.from_state(state)
+    blob = checkpoint.save()
+
+    assert len(blob) == checkpoint.nbytes == 24 + 10 * (1 + 8 * 4 + 8)
+    restored = BurzenCheckpoint.load(blob)
+    assert restored == checkpoint
+    assert restored.to_state() == state
+    assert BurzenCheckpoint.load(memoryview(blob)) == checkpoint
+
+
+def test_forks_branch_independently_from_snapshot():
+    state, coupling = _mid_level_state()
+    snapshot = BurzenCheckpoint.load(BurzenCheckpoint.from_state(state).save())
+
+    branch = snapshot.fork()
+    branch.energy[0] = 99.0
+    assert snapshot.energy[0] == state.towers[0].energy
+
+    continued = snapshot.fork().to_state()
+    expected = [burzen_step(state, coupling, coupling) for _ in range(5)]
+    assert [burzen_step(continued, coupling, coupling) for _ in range(5)] == expected
+
+
+def test_checkpoint_rejects_corruption():
+    state, _ = _mid_level_state()
+    blob = bytearray(BurzenCheckpoint.from_state(state).save())
+    blob[-1] ^= 0xFF
+    with pytest.raises(ValueError, match="checksum"):
+        BurzenCheckpoint.load(bytes(blob))
+    with pytest.raises(ValueError, match="truncated"):
+        BurzenCheckpoint.load(b"BZCK")
+    with pytest.raises(ValueError, match="Not a BURZEN"):
+        BurzenCheckpoint.load(b"XXXX" + bytes(blob[4:]))
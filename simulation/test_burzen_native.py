@@ -0,0 +1,148 @@
+import ctypes
+import math
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from burzen_native import NATIVE_ALPHA, NATIVE_PARITY_TOLERANCE, load_native_backend, run_parity
+from burzen_td import (
+    BASELINE_PARAMS,
+    BurzenTDState,
+    PythonBackend,
+    SimulationConfig,
+    TowerArchetype,
+    TowerState,
+    build_sparse_coupling,
+    burzen_step,
+    complete_coupling,
+    select_backend,
+)
+
+ENGINE_SOURCE = Path(__file__).parent / "c" / "burzen_engine.c"
+
+
+@pytest.fixture(scope="module")
+def engine_library(tmp_path_factory):
+    compiler = shutil.which("cc") or shutil.which("gcc")
+    if compiler is None:
+        pytest.skip("No C compiler available to build the native engine")
+    out = tmp_path_factory.mktemp("engine") / "libburzen_engine.so"
+    subprocess.run([compiler, "-O2", "-shared", "-fPIC", "-o", str(out), str(ENGINE_SOURCE), "-lm"], check=True)
+    return out
+
+
+def _board() -> BurzenTDState:
+    archetypes = [TowerArchetype.KINETIC, TowerArchetype.THERMAL, TowerArchetype.ENERGY, TowerArchetype.CONTROL]
+    return BurzenTDState(towers=[TowerState(archetype=a, energy=30.0 + i, heat=8.0 + 2 * i) for i, a in enumerate(archetypes)])
+
+
+def test_select_backend_falls_back_to_python(monkeypatch, tmp_path):
+    monkeypatch.setenv("BURZEN_ENGINE_LIB", str(tmp_path / "missing.so"))
+    assert isinstance(select_backend(), PythonBackend)
+    assert isinstance(select_backend("python"), PythonBackend)
+    with pytest.raises(RuntimeError):
+        select_backend("native")
+    with pytest.raises(ValueError):
+        select_backend("cuda")
+
+
+def test_select_backend_loads_native_engine(monkeypatch, engine_library):
+    monkeypatch.setenv("BURZEN_ENGINE_LIB", str(engine_library))
+    backend = select_backend()
+    assert backend.name == "native"
+
+    state = _board()
+    delta = backend.step(state, complete_coupling(4, 0.08), complete_coupling(4, 0.05), SimulationConfig(alpha=NATIVE_ALPHA))
+    assert backend.native_ticks == 1
+    assert delta.tick == state.tick == 1
+
+    coupling = build_sparse_coupling([(0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (3.0, 0.0)], cutoff=1.0, weight=0.1)
+    reference = _board()
+    fallback = _board()
+    assert backend.step(fallback, coupling, coupling) == burzen_step(reference, coupling, coupling)
+    assert backend.fallback_ticks == 1
+
+
+def _mixed_board() -> BurzenTDState:
+    archetypes = [a for a in TowerArchetype if a != TowerArchetype.PULSE]
+    return BurzenTDState(
+        towers=[
+            TowerState(archetype=a, energy=20.0 + 7 * i, heat=10.0 + 6 * i, activity=0.4 + 0.08 * i)
+            for i, a in enumerate(archetypes)
+        ]
+    )
+
+
+def test_parity_harness_reports_per_tick_divergence(engine_library):
+    backend = load_native_backend(engine_library)
+    report = run_parity(_board(), 20, backend=backend)
+
+    assert [entry.tick for entry in report] == list(range(1, 21))
+    assert backend.native_ticks == 20
+    assert set(report[0].delta_diffs) == {"energy_lambda2", "energy_lambda3", "heat_mean", "heat_std", "heat_q95"}
+
+
+def test_native_engine_matches_python_on_supported_states(engine_library):
+    backend = load_native_backend(engine_library)
+    boards = [_board(), _mixed_board(), BurzenTDState(towers=[TowerState(archetype=TowerArchetype.KINETIC, energy=10.0 * i) for i in range(6)])]
+    for state in boards:
+        assert backend.supports(state, complete_coupling(len(state.towers), 0.08), complete_coupling(len(state.towers), 0.05), SimulationConfig())
+        report = run_parity(state, 40, backend=backend)
+        assert max(entry.worst for entry in report) <= NATIVE_PARITY_TOLERANCE
+
+
+def test_native_backend_defers_unmodelled_terms_to_python(engine_library):
+    backend = load_native_backend(engine_library)
+    couplings, heat_diffusion = complete_coupling(4, 0.08), complete_coupling(4, 0.05)
+    pulse = _board()
+    pulse.towers[0].archetype = TowerArchetype.PULSE
+    burst = _board()
+    burst.towers[1].burst_spend = 1.5
+    for state in (pulse, burst):
+        assert not backend.supports(state, couplings, heat_diffusion, SimulationConfig())
+        report = run_parity(state, 10, backend=backend)
+        assert max(entry.worst for entry in report) == 0.0
+    assert backend.native_ticks == 0
+
+
+def test_wasm_step_symbol_keeps_in_place_semantics(engine_library):
+    from burzen_native import NativeBoard, load_library
+
+    lib = load_library(engine_library)
+    state = _mixed_board()
+    board = NativeBoard(lib, len(state.towers))
+    board.load(state)
+    lib.burzen_step(ctypes.byref(board.soa), 0.1)
+
+    energy = board.energies()
+    expected = [t.energy for t in state.towers]
+    heat = [t.heat for t in state.towers]
+    for i, tower in enumerate(state.towers):
+        params = BASELINE_PARAMS[tower.archetype]
+        overflow = max(0.0, (heat[i] - params.theta) / params.theta)
+        p_use = tower.activity * params.c
+        p_gen = tower.activity * params.g * params.eta * math.exp(-0.9 * overflow)
+        pull = sum(0.08 * (expected[j] - expected[i]) for j in range(len(expected)) if j != i)
+        heat_pull = sum(0.05 * (heat[j] - heat[i]) for j in range(len(heat)) if j != i)
+        expected[i] = min(100.0, max(0.0, expected[i] + 0.1 * (p_gen - p_use + pull)))
+        heat[i] = min(100.0, max(0.0, heat[i] + 0.1 * (params.gamma * p_use + heat_pull - params.rho * heat[i])))
+    assert max(abs(a - b) for a, b in zip(energy, expected)) < 1e-3
+    assert max(abs(a - b) for a, b in zip(board.heats(), heat)) < 1e-3
+
+
+def test_native_graph_check_runs_once_per_coupling(monkeypatch, engine_library):
+    import burzen_native
+
+    calls = []
+    from_dense = burzen_native.SparseCoupling.from_dense
+    monkeypatch.setattr(burzen_native.SparseCoupling, "from_dense", lambda matrix: calls.append(1) or from_dense(matrix))
+    backend = load_native_backend(engine_library)
+    state = _board()
+    couplings = [[0.0 if i == j else 0.08 for j in range(4)] for i in range(4)]
+    heat_diffusion = [[0.0 if i == j else 0.05 for j in range(4)] for i in range(4)]
+    for _ in range(5):
+        backend.step(state, couplings, heat_diffusion, SimulationConfig(alpha=NATIVE_ALPHA))
+    assert backend.native_ticks == 5
+    assert len(calls) == 2
@@ -0,0 +1,249 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from burzen_checkpoint import BurzenCheckpoint
+from burzen_soa import (
+    SOA_PARITY_TOLERANCE,
+    BurzenEnsembleState,
+    BurzenSoAState,
+    CSRArrays,
+    EnsembleConfig,
+    LaplacianSpectrum,
+    burzen_step_ensemble,
+    burzen_step_soa,
+    run_soa,
+    summarize_soa,
+    wave_log_strengths,
+)
+from burzen_td import (
+    BurzenTDState,
+    SimulationConfig,
+    SparseCoupling,
+    TowerArchetype,
+    TowerState,
+    build_sparse_coupling,
+    burzen_step,
+    log_waves,
+    run,
+    summarize_delta,
+)
+
+
+def _random_board(seed: int, n: int) -> tuple[BurzenTDState, list[list[float]], list[list[float]]]:
+    rng = random.Random(seed)
+    archetypes = list(TowerArchetype)
+    towers = [
+        TowerState(
+            archetype=rng.choice(archetypes),
+            energy=rng.uniform(10.0, 60.0),
+            heat=rng.uniform(0.0, 60.0),
+            activity=rng.uniform(0.2, 1.0),
+            burst_spend=rng.choice([0.0, 0.0, 1.5]),
+        )
+        for _ in range(n)
+    ]
+    couplings = [[0.0] * n for _ in range(n)]
+    heat_diff = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            if rng.random() < 0.3:
+                couplings[i][j] = couplings[j][i] = rng.uniform(0.0, 0.02)
+                heat_diff[i][j] = heat_diff[j][i] = rng.uniform(0.0, 0.01)
+    return BurzenTDState(towers=towers, tick=0), couplings, heat_diff
+
+
+def _assert_delta_close(left, right) -> None:
+    assert left.tick == right.tick
+    assert left.instability_count == right.instability_count
+    for name in ("energy_lambda2", "energy_lambda3", "fiedler_sign_balance", "heat_mean", "heat_std", "heat_q95"):
+        assert abs(getattr(left, name) - getattr(right, name)) <= SOA_PARITY_TOLERANCE, name
+
+
+def test_summary_low_order_statistics_match_reference():
+    rng = random.Random(5)
+    for n in (1, 2, 3, 4, 9, 40):
+        for _ in range(20):
+            energy = [rng.choice((0.0, 1.0, 2.0, rng.random())) for _ in range(n)]
+            heat = [rng.random() for _ in range(n)]
+            expected = summarize_delta(3, energy, heat, 0)
+            got = summarize_soa(3, np.array(energy), np.array(heat), 0)
+            assert (got.energy_lambda2, got.energy_lambda3) == (expected.energy_lambda2, expected.energy_lambda3)
+
+
+def test_soa_round_trip_preserves_tower_state():
+    state, _, _ = _random_board(3, 12)
+    state.tick = 7
+    restored = BurzenSoAState.from_state(state).to_state()
+    assert restored == state
+
+
+def test_soa_step_matches_reference_path():
+    config = SimulationConfig(alpha=1.1, beta=2.5)
+    reference, couplings, heat_diff = _random_board(11, 48)
+    soa = BurzenSoAState.from_state(reference)
+
+    for _ in range(40):
+        expected = burzen_step(reference, couplings, heat_diff, config)
+        actual = burzen_step_soa(soa, couplings, heat_diff, config)
+        _assert_delta_close(actual, expected)
+
+    final = soa.to_state()
+    for left, right in zip(final.towers, reference.towers):
+        assert abs(left.energy - right.energy) <= SOA_PARITY_TOLERANCE
+        assert abs(left.heat - right.heat) <= SOA_PARITY_TOLERANCE
+        assert left.instability_ticks == right.instability_ticks
+
+
+def test_soa_step_small_boards_match_reference():
+    for n in (0, 1, 2, 3):
+        reference, couplings, heat_diff = _random_board(n, n)
+        soa = BurzenSoAState.from_state(reference)
+        _assert_delta_close(burzen_step_soa(soa, couplings, heat_diff), burzen_step(reference, couplings, heat_diff))
+
+
+def test_soa_step_accepts_sparse_coupling():
+    reference, couplings, heat_diff = _random_board(5, 64)
+    sparse_c = SparseCoupling.from_dense(couplings)
+    sparse_h = CSRArrays.from_sparse(SparseCoupling.from_dense(heat_diff))
+    soa = BurzenSoAState.from_state(reference)
+
+    for _ in range(20):
+        expected = burzen_step(reference, sparse_c, SparseCoupling.from_dense(heat_diff))
+        _assert_delta_close(burzen_step_soa(soa, sparse_c, sparse_h), expected)
+
+
+def test_sparse_exchange_handles_isolated_towers():
+    # Interior and trailing towers without neighbours leave empty CSR rows.
+    positions = [(0.0, 0.0), (1.0, 0.0), (9.0, 9.0), (2.0, 0.0), (20.0, 0.0), (30.0, 5.0)]
+    couplings = [
+        SparseCoupling.from_neighbors([[(1, 0.1), (2, 0.2)], [], []]),
+        build_sparse_coupling(positions, 1.5, 0.02),
+    ]
+    for coupling in couplings:
+        n = coupling.size
+        reference, _, _ = _random_board(n, n)
+        heat_diff = build_sparse_coupling(positions[:n], 1.5, 0.01) if n == len(positions) else coupling
+        soa = BurzenSoAState.from_state(reference)
+        ensemble = BurzenEnsembleState.from_states([BurzenSoAState.from_state(reference).to_state()] * 2)
+        for _ in range(5):
+            expected = burzen_step(reference, coupling, heat_diff)
+            _assert_delta_close(burzen_step_soa(soa, coupling, heat_diff), expected)
+            batch = burzen_step_ensemble(ensemble, coupling, heat_diff, EnsembleConfig.from_configs([SimulationConfig()] * 2))
+            _assert_delta_close(batch.member(1), expected)
+        for state in (soa.to_state(), ensemble.to_states()[0]):
+            for left, right in zip(state.towers, reference.towers):
+                assert abs(left.energy - right.energy) <= SOA_PARITY_TOLERANCE
+
+
+def test_ensemble_step_matches_independent_runs():
+    configs = [SimulationConfig(alpha=0.6), SimulationConfig(alpha=0.9, beta=2.0), SimulationConfig(alpha=1.3, dt=0.5)]
+    members = [_random_board(seed, 24) for seed in (21, 22, 23)]
+    _, couplings, heat_diff = members[0]
+    references = [board for board, _, _ in members]
+    references[2].tick = 5
+
+    ensemble = BurzenEnsembleState.from_states(references)
+    batch_configs = EnsembleConfig.from_configs(configs)
+    sparse_c = SparseCoupling.from_dense(couplings)
+
+    for _ in range(15):
+        batch = burzen_step_ensemble(ensemble, sparse_c, heat_diff, batch_configs)
+        assert len(batch) == 3
+        for k, (reference, config) in enumerate(zip(references, configs)):
+            _assert_delta_close(batch.member(k), burzen_step(reference, couplings, heat_diff, config))
+
+    for left, right in zip(ensemble.to_states(), references):
+        assert left.tick == right.tick
+        for a, b in zip(left.towers, right.towers):
+            assert abs(a.energy - b.energy) <= SOA_PARITY_TOLERANCE
+
+
+def test_ensemble_rejects_mismatched_members():
+    a, _, _ = _random_board(1, 4)
+    b, _, _ = _random_board(2, 5)
+    with pytest.raises(ValueError):
+        BurzenEnsembleState.from_states([a, b])
+
+
+def test_run_soa_matches_reference_run():
+    reference, couplings, heat_diff = _random_board(9, 30)
+    soa = BurzenSoAState.from_state(reference)
+
+    expected = run(reference, couplings, heat_diff, 50, stride=20)
+    actual = run_soa(soa, couplings, SparseCoupling.from_dense(heat_diff), 50, stride=20)
+    assert [d.tick for d in actual] == [20, 40, 50]
+    for left, right in zip(actual, expected):
+        _assert_delta_close(left, right)
+
+
+def _dense_laplacian_eigenvalues(coupling: SparseCoupling) -> np.ndarray:
+    weights = np.zeros((coupling.size, coupling.size))
+    for i in range(coupling.size):
+        for j, w in coupling.row(i):
+            weights[i, j] = w
+    sym = 0.5 * (weights + weights.T)
+    return np.linalg.eigvalsh(np.diag(sym.sum(axis=1)) - sym)
+
+
+def test_laplacian_spectrum_matches_dense_eigensolve():
+    positions = [(float(i % 12), float(i // 12)) for i in range(120)]
+    coupling = build_sparse_coupling(positions, cutoff=1.0, weight=0.08)
+    spectrum = LaplacianSpectrum(tolerance=1e-8)
+
+    lambda2, lambda3, balance = spectrum.update(coupling)
+    exact = _dense_laplacian_eigenvalues(coupling)
+    assert abs(lambda2 - exact[1]) < 1e-9
+    assert abs(lambda3 - exact[2]) < 1e-9
+    # The Fiedler vector of a 12x10 grid splits it into two equal halves.
+    assert balance == 0.5
+
+
+def test_laplacian_spectrum_caches_and_warm_starts():
+    positions = [(float(i % 15), float(i // 15)) for i in range(225)]
+    coupling = build_sparse_coupling(positions, cutoff=1.5, weight=0.05)
+    spectrum = LaplacianSpectrum()
+    spectrum.update(coupling)
+    cold_iterations = spectrum.iterations
+
+    spectrum.update(coupling)
+    spectrum.update(SparseCoupling(coupling.indptr, coupling.indices, coupling.weights))
+    assert spectrum.solves == 1
+
+    reweighted = SparseCoupling(
+        coupling.indptr,
+        coupling.indices,
+        tuple(w * (1.02 if k % 5 else 0.95) for k, w in enumerate(coupling.weights)),
+    )
+    lambda2, _, _ = spectrum.update(reweighted)
+    assert spectrum.solves == 2
+    assert spectrum.iterations - cold_iterations < cold_iterations / 2
+    assert abs(lambda2 - _dense_laplacian_eigenvalues(reweighted)[1]) < 1e-6
+
+
+def test_step_soa_reports_spectrum_when_enabled():
+    reference, couplings, heat_diff = _random_board(13, 20)
+    plain = burzen_step_soa(BurzenSoAState.from_state(reference), couplings, heat_diff)
+    spectral = burzen_step_soa(BurzenSoAState.from_state(reference), couplings, heat_diff, spectrum=LaplacianSpectrum())
+
+    exact = _dense_laplacian_eigenvalues(SparseCoupling.from_dense(couplings))
+    assert abs(spectral.energy_lambda2 - exact[1]) < 1e-9
+    assert abs(spectral.energy_lambda3 - exact[2]) < 1e-9
+    assert spectral.heat_q95 == plain.heat_q95
+
+
+def test_soa_state_converts_to_and_from_checkpoint():
+    reference, _, _ = _random_board(31, 16)
+    soa = BurzenSoAState.from_state(reference)
+    checkpoint = soa.to_checkpoint()
+
+    assert checkpoint == BurzenCheckpoint.from_state(reference)
+    restored = BurzenSoAState.from_checkpoint(BurzenCheckpoint.load(checkpoint.save()))
+    assert restored.to_state() == reference
+
+
+def test_vectorized_wave_schedule_matches_scalar():
+    for seed, start in ((0, 1), (-5, 1), (2**70 + 3, 10**9)):
+        assert wave_log_strengths(seed, start, 500).tolist() == log_waves(seed, start, 500)
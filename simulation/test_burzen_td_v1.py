@@ -1,13 +1,28 @@
+import math
+import random
+
+import pytest
+
 from codex_eigenstate import decode_payload, encode_payload
 from burzen_td import (
+    WAVE_GROWTH,
     BurzenTDState,
     CampaignProgress,
+    InfiniteMode,
     SimulationConfig,
+    SparseCoupling,
     TowerArchetype,
     TowerState,
     advance_campaign,
+    build_sparse_coupling,
     burzen_step,
+    compile_tick_plan,
+    log_waves,
+    run,
     validate_loadout,
+    wave_log_strength,
+    wave_strength,
+    waves,
 )
 from orchestrator import WasmutableOrchestrator
 
@@ -38,6 +53,120 @@ def test_energy_heat_updates_deterministic():
     assert delta_a == delta_b
 
 
+def _ring_towers(n):
+    archetypes = list(TowerArchetype)
+    return [
+        TowerState(archetype=archetypes[i % len(archetypes)], energy=20.0 + i % 7, heat=5.0 + (i * 3) % 11)
+        for i in range(n)
+    ]
+
+
+def test_sparse_coupling_matches_dense_step():
+    n = 12
+    positions = [(float(i % 4), float(i // 4)) for i in range(n)]
+    couplings = build_sparse_coupling(positions, cutoff=1.0, weight=0.09)
+    heat_diff = build_sparse_coupling(positions, cutoff=1.5, weight=0.04)
+
+    dense_state = BurzenTDState(towers=_ring_towers(n))
+    sparse_state = BurzenTDState(towers=_ring_towers(n))
+    dense_c = [[0.0] * n for _ in range(n)]
+    dense_h = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j, w in couplings.row(i):
+            dense_c[i][j] = w
+        for j, w in heat_diff.row(i):
+            dense_h[i][j] = w
+
+    for _ in range(10):
+        assert burzen_step(sparse_state, couplings, heat_diff) == burzen_step(dense_state, dense_c, dense_h)
+    assert sparse_state == dense_state
+
+
+def test_build_sparse_coupling_uses_cutoff_radius():
+    positions = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (5.0, 5.0)]
+    coupling = build_sparse_coupling(positions, cutoff=1.0, weight=0.5)
+    assert coupling.size == 4
+    assert list(coupling.row(0)) == [(1, 0.5)]
+    assert list(coupling.row(1)) == [(0, 0.5), (2, 0.5)]
+    assert list(coupling.row(3)) == []
+    assert coupling == SparseCoupling.from_dense(
+        [[0.0, 0.5, 0.0, 0.0], [0.5, 0.0, 0.5, 0.0], [0.0, 0.5, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0]]
+    )
+
+
+def test_run_samples_every_stride_and_final_tick():
+    positions = [(float(i % 3), float(i // 3)) for i in range(9)]
+    couplings = build_sparse_coupling(positions, cutoff=1.0, weight=0.09)
+    heat_diff = build_sparse_coupling(positions, cutoff=1.0, weight=0.04)
+
+    stepped_state = BurzenTDState(towers=_ring_towers(9))
+    stepped = [burzen_step(stepped_state, couplings, heat_diff) for _ in range(35)]
+
+    run_state = BurzenTDState(towers=_ring_towers(9))
+    samples = run(run_state, couplings, heat_diff, 35, stride=10)
+    assert [d.tick for d in samples] == [10, 20, 30, 35]
+    assert samples == [stepped[9], stepped[19], stepped[29], stepped[34]]
+    assert run_state == stepped_state
+
+    final_only = run(BurzenTDState(towers=_ring_towers(9)), couplings, heat_diff, 35)
+    assert final_only == [stepped[34]]
+
+
+def test_run_stops_when_predicate_matches():
+    positions = [(float(i), 0.0) for i in range(6)]
+    couplings = build_sparse_coupling(positions, cutoff=1.0, weight=0.09)
+    state = BurzenTDState(towers=_ring_towers(6))
+
+    samples = run(state, couplings, couplings, 1000, stride=5, until=lambda d: d.tick >= 15)
+    assert [d.tick for d in samples] == [5, 10, 15]
+    assert state.tick == 15
+
+
+def test_delta_statistics_match_full_sort():
+    rng = random.Random(17)
+    archetypes = list(TowerArchetype)
+    towers = [
+        TowerState(archetype=rng.choice(archetypes), energy=rng.uniform(0.0, 90.0), heat=rng.uniform(0.0, 90.0))
+        for _ in range(1500)
+    ]
+    state = BurzenTDState(towers=towers)
+    empty = SparseCoupling.from_neighbors([[] for _ in towers])
+    delta = burzen_step(state, empty, empty)
+
+    energies = sorted(t.energy for t in towers)
+    heats = sorted(t.heat for t in towers)
+    assert delta.energy_lambda2 == energies[1]
+    assert delta.energy_lambda3 == energies[2]
+    assert delta.heat_q95 == heats[math.ceil(0.95 * len(heats)) - 1]
+
+
+def test_tick_plan_matches_unplanned_step():
+    n = 16
+    couplings = [[0.0 if i == j else 0.01 * ((i + j) % 5) for j in range(n)] for i in range(n)]
+    heat_diff = build_sparse_coupling([(float(i % 4), float(i // 4)) for i in range(n)], cutoff=1.5, weight=0.03)
+    planned_state = BurzenTDState(towers=_ring_towers(n))
+    plain_state = BurzenTDState(towers=_ring_towers(n))
+    plan = compile_tick_plan(planned_state, couplings, heat_diff)
+
+    for _ in range(12):
+        assert burzen_step(planned_state, couplings, heat_diff, plan=plan) == burzen_step(plain_state, couplings, heat_diff)
+    assert planned_state == plain_state
+
+
+def test_tick_plan_rejects_changed_tower_set():
+    couplings = [[0.0, 0.1], [0.1, 0.0]]
+    state = BurzenTDState(towers=_ring_towers(2))
+    plan = compile_tick_plan(state, couplings, couplings)
+    state.towers.append(TowerState(archetype=TowerArchetype.KINETIC))
+
+    try:
+        burzen_step(state, couplings, couplings, plan=plan)
+    except ValueError as exc:
+        assert "stale" in str(exc)
+    else:
+        raise AssertionError("Expected stale tick plan failure")
+
+
 def test_loadout_rule_requires_exactly_4_slots():
     validate_loadout(
         (
@@ -88,3 +217,46 @@ def test_advance_campaign_caps_at_level_10():
     p = CampaignProgress(current_level=10, completed_levels=(1, 2, 3))
     next_p = advance_campaign(p, won=True)
     assert next_p.current_level == 10
+
+
+def test_wave_schedule_seeks_without_replay():
+    mode = InfiniteMode(seed=42)
+    sequential = [mode.next_wave_strength() for _ in range(30)]
+    assert sequential == [wave_strength(42, k) for k in range(1, 31)]
+    assert InfiniteMode(seed=42, wave_index=17).next_wave_strength() == sequential[16]
+    assert log_waves(42, 10, 5) == [wave_log_strength(42, k) for k in range(10, 15)]
+    assert waves(42, 1, 30) == sequential
+
+    for k, strength in enumerate(sequential, start=1):
+        base = WAVE_GROWTH ** (k - 1)
+        assert 0.8 * base <= strength <= 1.2 * base
+    assert wave_strength(43, 1) != sequential[0]
+
+
+def test_wave_schedule_is_pinned_to_the_counter_hash():
+    # splitmix64(splitmix64(seed) ^ wave_index); changing the hash changes every saved run.
+    assert waves(42, 1, 5) == [
+        1.1801752362911704,
+        1.154789476407716,
+        1.658502558593551,
+        1.5016534518561164,
+        2.2596089707335305,
+    ]
+    assert log_waves(42, 1, 2) == [0.16566293278324856, 0.14391805585181572]
+
+
+def test_infinite_mode_rng_is_deprecated():
+    mode = InfiniteMode(seed=9)
+    with pytest.warns(DeprecationWarning):
+        rng = mode.rng
+    with pytest.warns(DeprecationWarning):
+        assert mode.rng is rng
+    assert rng.random() == random.Random(9).random()
+    assert mode.next_wave_strength() == wave_strength(9, 1)
+
+
+def test_deep_waves_stay_finite_in_log_space():
+    log_strength = wave_log_strength(7, 10**7)
+    assert math.isfinite(log_strength)
+    assert abs(log_strength - (10**7 - 1) * math.log(WAVE_GROWTH)) <= 0.25
+    assert wave_strength(7, 10**7) == math.inf
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from campaign_sweep import (
+    RESULT_COLUMNS,
+    completed_keys,
+    config_grid,
+    enumerate_jobs,
+    evaluate_job,
+    run_sweep,
+    write_columnar,
+)
+
+
+def test_enumerate_jobs_covers_unlocked_loadouts():
+    jobs = enumerate_jobs(config_grid([0.8, 1.0], [1.4]))
+    per_level = {}
+    for job in jobs:
+        per_level[job.level] = per_level.get(job.level, 0) + 1
+    assert per_level[1] == 1 * 2
+    assert per_level[10] == 70 * 2
+    assert len({job.key for job in jobs}) == len(jobs)
+
+
+def test_sweep_streams_resumes_and_writes_columns(tmp_path):
+    jobs = enumerate_jobs(levels=[1, 2, 3])
+    log = tmp_path / "sweep.jsonl"
+
+    first = list(run_sweep(jobs[:3], 30, log, workers=2, chunk_size=2))
+    assert len(first) == 3
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write('{"key": "torn')
+
+    rest = list(run_sweep(jobs, 30, log, workers=2, chunk_size=2))
+    assert len(rest) == len(jobs) - 3
+    assert completed_keys(log) == {job.result_key(30) for job in jobs}
+
+    serial = {job.result_key(30): evaluate_job(job, 30) for job in jobs}
+    for row in first + rest:
+        assert row == serial[row["key"]]
+
+    table = write_columnar(log, tmp_path / "sweep.columns.json")
+    assert tuple(table) == RESULT_COLUMNS
+    assert table["key"] == sorted(serial)
+    assert json.loads((tmp_path / "sweep.columns.json").read_text()) == table
+
+    longer = list(run_sweep(jobs[:2], 31, log, workers=1))
+    assert [row["key"] for row in longer] == [job.result_key(31) for job in jobs[:2]]
+
+
+def test_sweep_rejects_runs_without_ticks(tmp_path):
+    job = enumerate_jobs(levels=[1])[0]
+    with pytest.raises(ValueError, match="ticks"):
+        evaluate_job(job, 0)
+    with pytest.raises(ValueError, match="ticks"):
+        next(run_sweep([job], 0, tmp_path / "sweep.jsonl", workers=1))
+    assert not (tmp_path / "sweep.jsonl").exists()
+
+
+def test_config_labels_stay_distinct():
+    grid = config_grid([0.801, 0.804, 0.8], [1.4, 1.4000001])
+    assert len(grid) == 6
+    assert {(c.alpha, c.beta) for c in grid.values()} == {(a, b) for a in (0.801, 0.804, 0.8) for b in (1.4, 1.4000001)}
+
+
+def test_passed_requires_the_level_generation(monkeypatch):
+    import campaign_sweep
+
+    job = enumerate_jobs(levels=[1])[0]
+    assert evaluate_job(job, 30)["passed"] is True
+    levels = [dict(level, required_generation=1000.0) for level in campaign_sweep.build_campaign_levels()]
+    monkeypatch.setattr(campaign_sweep, "build_campaign_levels", lambda: levels)
+    row = evaluate_job(job, 30)
+    assert row["required_generation"] == 1000.0
+    assert row["energy_mean"] < 1000.0
+    assert row["passed"] is False
@@ -1,11 +1,26 @@
+import io
+
 from codex_eigenstate import (
+    BINARY_VERSION,
+    COMPRESSED_VERSION,
+    ENVELOPE_VERSION,
     Eigenstate,
+    EnvelopeReader,
     RejectionType,
+    _checksum8,
+    _from_b64url,
+    _to_b64url,
     decode_eigenstate,
+    decode_envelope,
     decode_payload,
+    decode_payload_stream,
     decode_payload_with_rejection,
     encode_eigenstate,
+    encode_envelope,
     encode_payload,
+    encode_payload_binary,
+    encode_payload_compressed,
+    encode_payload_stream,
 )
 
 
@@ -36,6 +51,19 @@ def test_payload_checksum_uses_canonical_json_bytes():
     assert decoded == {"a": 1, "b": 2, "schema": "x"}
 
 
+def test_xdx1_canonical_bytes_are_stable():
+    payload = {"schema": "x", "energy_setpoint": 1.0, "small": 1.5e-07, "large": 1e21, "count": 3}
+    token = encode_payload(payload)
+    assert token == (
+        "XDX1.eyJjb3VudCI6MywiZW5lcmd5X3NldHBvaW50IjoxLjAsImxhcmdlIjoxZSsyMSwic2NoZW1hIjoieCIsInNtYWxsIjoxLjVlLTA3fQ.03d29d03"
+    )
+    assert _from_b64url(token.split(".")[1]) == b'{"count":3,"energy_setpoint":1.0,"large":1e+21,"schema":"x","small":1.5e-07}'
+    assert type(decode_payload(token)["energy_setpoint"]) is float
+    stream = io.BytesIO()
+    encode_payload_stream(payload, stream)
+    assert stream.getvalue().decode("ascii") == token
+
+
 def test_rejections():
     invalid = decode_payload_with_rejection("BAD")
     assert invalid["valid"] is False
@@ -52,3 +80,191 @@ def test_rejections():
 
     reject_order = decode_payload_with_rejection(token, last_version_id=3)
     assert reject_order["rejection"] == RejectionType.ORDER_VIOLATION.value
+
+
+def _delta_payload(**extra):
+    return {
+        "schema": "eigenstate_delta_v1",
+        "tick": 12,
+        "energy": {"lambda2": 1.5, "lambda3": 2.25, "fiedler_sign_balance": 0.5},
+        "heat": {"mean": 14.125, "std": 3.0e-7, "q95": 21.0, "instability_count": 2},
+        **extra,
+    }
+
+
+def test_binary_tokens_decode_to_the_same_payload():
+    eigen = Eigenstate(0.8, 0.42, 0.73, 0.65, -0.1, 0.5)
+    binary = encode_eigenstate(eigen, binary=True)
+    assert binary.startswith(f"{BINARY_VERSION}.")
+    assert decode_eigenstate(binary) == eigen
+    assert len(binary) * 3 < len(encode_eigenstate(eigen))
+
+    for payload in (_delta_payload(), _delta_payload(version_id=7), {**_delta_payload(), "tick": -3}):
+        token = encode_payload_binary(payload)
+        assert decode_payload(token) == decode_payload(encode_payload(payload)) == payload
+
+
+def test_binary_encoding_rejects_unknown_layouts():
+    for payload in (
+        {"schema": "x", "a": 1},
+        _delta_payload(extra=1),
+        {**_delta_payload(), "heat": {"mean": 1.0}},
+        {**_delta_payload(), "heat": 5},
+        {**_delta_payload(), "tick": {"value": 12}},
+        {**_delta_payload(), "tick": [12]},
+        _delta_payload(version_id=None),
+        {**_delta_payload(), "tick": 1.7},
+        {**_delta_payload(), "tick": 12.0},
+        {**_delta_payload(), "tick": "3"},
+        {**_delta_payload(), "tick": True},
+        _delta_payload(version_id=True),
+        _delta_payload(version_id="7"),
+        {**_delta_payload(), "heat": {**_delta_payload()["heat"], "mean": "14.125"}},
+        {**_delta_payload(), "heat": {**_delta_payload()["heat"], "q95": False}},
+    ):
+        try:
+            encode_payload_binary(payload)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expected ValueError for {payload}")
+
+    widened = {**_delta_payload(), "heat": {**_delta_payload()["heat"], "q95": 21}}
+    assert decode_payload(encode_payload_binary(widened))["heat"]["q95"] == 21.0
+
+
+def test_binary_rejections_match_json_semantics():
+    token = encode_payload_binary(_delta_payload(version_id=3))
+    assert decode_payload_with_rejection(token, last_version_id=2)["payload"] == _delta_payload(version_id=3)
+    assert decode_payload_with_rejection(token, last_version_id=3)["rejection"] == RejectionType.ORDER_VIOLATION.value
+
+    checksum_bad = token[:-1] + ("0" if token[-1] != "0" else "1")
+    assert decode_payload_with_rejection(checksum_bad)["rejection"] == RejectionType.CHECKSUM_MISMATCH.value
+
+    truncated_raw = _from_b64url(token.split(".")[1])[:-4]
+    truncated = f"{BINARY_VERSION}.{_to_b64url(truncated_raw)}.{_checksum8(truncated_raw)}"
+    assert decode_payload_with_rejection(truncated)["rejection"] == RejectionType.SCHEMA.value
+
+
+SHARE_LEVEL = {"h": 40, "p": [[0, 0], [1, 0], [2, 0], [3, 0], [3, 1], [3, 2], [4, 2]], "s": 12, "w": [[1, 10], [2, 12]]}
+
+
+def test_compressed_tokens_round_trip_with_rejection():
+    payload = {**SHARE_LEVEL, "version_id": 4}
+    token = encode_payload_compressed(payload)
+    assert token.startswith(f"{COMPRESSED_VERSION}.")
+    assert len(token) * 2 < len(encode_payload(payload))
+    assert decode_payload(token) == payload
+    assert decode_payload_with_rejection(token, last_version_id=3) == {"valid": True, "payload": payload, "version_id": 4}
+    assert decode_payload_with_rejection(token, last_version_id=4)["rejection"] == RejectionType.ORDER_VIOLATION.value
+    # Same checksum as XDX1: both cover the canonical JSON bytes.
+    assert token.split(".")[2] == encode_payload(payload).split(".")[2]
+
+
+def test_compressed_token_corruption_is_rejected():
+    token = encode_payload_compressed(SHARE_LEVEL)
+    version, body, checksum = token.split(".")
+
+    other = encode_payload_compressed({**SHARE_LEVEL, "h": 41})
+    swapped = f"{version}.{other.split('.')[1]}.{checksum}"
+    assert decode_payload_with_rejection(swapped)["rejection"] == RejectionType.CHECKSUM_MISMATCH.value
+
+    truncated = f"{version}.{body[:-3]}.{checksum}"
+    assert decode_payload_with_rejection(truncated)["rejection"] == RejectionType.SCHEMA.value
+    try:
+        decode_payload(truncated)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected truncated deflate stream to fail")
+
+
+ENVELOPE_MEMBERS = [
+    {"schema": "burzen_action_v1", "level": 3, "loadout": ["kinetic", "thermal"]},
+    {"schema": "burzen_action_v1", "custom": {"alpha": 1.1, "beta": -2.5e-300, "allowed_towers": []}},
+    {"schema": "note_v1", "text": "héat ≥ 0", "flags": [True, False, None], "big": -(1 << 62)},
+]
+
+
+def test_envelope_round_trips_members_in_order():
+    token = encode_envelope(ENVELOPE_MEMBERS)
+    assert token.startswith(f"{ENVELOPE_VERSION}.")
+    decoded = decode_envelope(token)
+    assert decoded == ENVELOPE_MEMBERS
+    assert decoded[2]["flags"][0] is True
+    assert decode_envelope(encode_envelope([])) == []
+
+
+def test_envelope_reader_decodes_single_members():
+    reader = EnvelopeReader(encode_envelope(ENVELOPE_MEMBERS))
+    assert len(reader) == 3
+    assert reader[1] == ENVELOPE_MEMBERS[1]
+    assert reader[-1] == ENVELOPE_MEMBERS[2]
+    try:
+        reader[3]
+    except IndexError:
+        pass
+    else:
+        raise AssertionError("Expected out-of-range member to fail")
+
+
+def test_envelope_is_smaller_than_separate_tokens():
+    members = [dict(ENVELOPE_MEMBERS[0], tick=tick) for tick in range(8)]
+    assert len(encode_envelope(members)) < sum(len(encode_payload(m)) for m in members)
+
+
+def test_envelope_rejects_tampering_and_bad_members():
+    version, body, checksum = encode_envelope(ENVELOPE_MEMBERS).split(".")
+    raw = bytearray(_from_b64url(body))
+    raw[-1] ^= 1
+    for bad, call in (
+        ("Checksum mismatch", lambda: EnvelopeReader(f"{version}.{_to_b64url(bytes(raw))}.{checksum}")),
+        ("Unsupported envelope version", lambda: EnvelopeReader(f"XDX1.{body}.{checksum}")),
+        ("Unsupported envelope value type", lambda: encode_envelope([{"bad": object()}])),
+    ):
+        try:
+            call()
+        except ValueError as exc:
+            assert bad in str(exc)
+        else:
+            raise AssertionError(f"Expected {bad}")
+
+
+def test_stream_encoding_matches_one_shot_tokens():
+    payload = {"history": [i * -0.25 for i in range(10_000)], "towers": [{"id": i, "pos": (i, 0)} for i in range(50)], "tag": "ü"}
+    for chunk_size in (3, 100, 1 << 16):
+        out = io.BytesIO()
+        checksum = encode_payload_stream(payload, out, chunk_size=chunk_size)
+        assert out.getvalue().decode("ascii") == encode_payload(payload)
+        assert out.getvalue().endswith(checksum.encode("ascii"))
+
+
+def test_stream_decoding_reads_every_token_version():
+    tokens = [
+        encode_payload({"history": list(range(5_000)), "note": "héat"}),
+        encode_payload_compressed(SHARE_LEVEL),
+        encode_eigenstate(Eigenstate(0.8, 0.42, 0.73, 0.65, -0.1, 0.5), binary=True),
+    ]
+    for token in tokens:
+        expected = decode_payload(token)
+        for chunk_size in (1, 7, 4096):
+            assert decode_payload_stream(token, chunk_size=chunk_size) == expected
+        assert decode_payload_stream(io.BytesIO(token.encode("ascii")), chunk_size=5) == expected
+        assert decode_payload_stream(memoryview(token.encode("ascii"))) == expected
+
+
+def test_stream_decoding_rejects_damaged_tokens():
+    token = encode_payload({"history": list(range(1_000))})
+    version, body, checksum = token.split(".")
+    cases = (
+        ("Checksum mismatch", f"{version}.{body}.00000000"),
+        ("Unsupported token version", f"XDQ9.{body}.{checksum}"),
+        ("Malformed token", f"{version}.{body}"),
+        ("size limit", token),
+    )
+    for message, bad in cases:
+        try:
+            decode_payload_stream(bad, chunk_size=64, max_bytes=1_000 if message == "size limit" else None)
+        except ValueError as exc:
+            assert message in str(exc)
+        else:
+            raise AssertionError(f"Expected {message}")
@@ -1,7 +1,10 @@
 """Regression tests for deterministic folding engine scaffolding."""
 
+import io
 import unittest
 
+from simulation.codex_eigenstate import decode_payload, decode_payload_stream, encode_payload, encode_payload_stream
+
 from simulation.folding_engine import (
     AffinityEngine,
     EducationalOverlay,
@@ -60,6 +63,23 @@ class FoldingEngineTests(unittest.TestCase):
         self.assertEqual(len(record.bonds), len(tick.bonds))
         self.assertEqual(record.global_energy, tick.global_energy)
 
+    def test_fold_record_streams_through_codec(self) -> None:
+        nodes = [TowerResidueNode(id=i, residue_class="charged+" if i % 2 else "charged-", pos=(i, 0)) for i in range(40)]
+        tick = FoldingSolver().tick(nodes, EnvironmentState(thermal_state=0.3))
+        history = [tick.global_energy - i * 1e-3 for i in range(20_000)]
+        record = FoldRecordV1.from_state(9, [(0, 0), (1, 0)], nodes, tick, history)
+
+        out = io.BytesIO()
+        checksum = encode_payload_stream(record.to_payload(), out, chunk_size=4096)
+        token = out.getvalue().decode("ascii")
+        self.assertEqual(token, encode_payload(record.to_payload()))
+        self.assertTrue(token.endswith(checksum))
+
+        expected = decode_payload(token)
+        self.assertEqual(expected["conformation_history"], history)
+        for source in (token, memoryview(out.getvalue()), io.BytesIO(out.getvalue())):
+            self.assertEqual(decode_payload_stream(source, chunk_size=1000), expected)
+
     def test_educational_overlay_contains_motif_hint(self) -> None:
         nodes = [
             TowerResidueNode(id=1, residue_class="polar", pos=(0, 0)),
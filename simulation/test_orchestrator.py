@@ -0,0 +1,181 @@
+import copy
+import math
+
+import pytest
+
+import burzen_td
+from burzen_td import BurzenTDState, SimulationConfig, TowerArchetype, TowerState, burzen_step, complete_coupling
+from codex_eigenstate import decode_payload, encode_payload
+from orchestrator import WasmutableOrchestrator
+
+LOADOUT = ["kinetic", "thermal", "energy", "reaction"]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _start(orchestrator: WasmutableOrchestrator, **extra) -> str:
+    action = {"schema": "burzen_action_v1", "level": 1, "loadout": LOADOUT, **extra}
+    return decode_payload(orchestrator.start_level(encode_payload(action)))["session"]
+
+
+def _tick(orchestrator: WasmutableOrchestrator, session_id: str) -> dict[str, object]:
+    return decode_payload(orchestrator.run_level_tick(encode_payload({"schema": "burzen_action_v1", "session": session_id})))
+
+
+def test_session_ticks_carry_state_between_calls():
+    orchestrator = WasmutableOrchestrator()
+    session_id = _start(orchestrator, custom={"alpha": 1.2})
+
+    state = BurzenTDState(towers=[TowerState(archetype=TowerArchetype(t)) for t in LOADOUT])
+    couplings, heat_diff = complete_coupling(4, 0.08), complete_coupling(4, 0.05)
+    config = SimulationConfig(alpha=1.2)
+    for tick in range(1, 6):
+        expected = burzen_step(state, couplings, heat_diff, config)
+        delta = _tick(orchestrator, session_id)
+        assert delta["tick"] == tick
+        assert delta["heat"]["q95"] == expected.heat_q95
+        assert delta["energy"]["lambda2"] == expected.energy_lambda2
+    assert orchestrator.runtime.level_tick == 5
+
+
+def test_sessions_are_independent():
+    orchestrator = WasmutableOrchestrator()
+    first = _start(orchestrator)
+    second = _start(orchestrator)
+    assert first != second
+
+    for _ in range(3):
+        _tick(orchestrator, first)
+    assert _tick(orchestrator, second)["tick"] == 1
+    assert orchestrator.session(first).state.tick == 3
+
+
+def test_idle_sessions_are_evicted():
+    clock = FakeClock()
+    orchestrator = WasmutableOrchestrator(session_idle_seconds=30.0, clock=clock)
+    stale = _start(orchestrator)
+    clock.now = 20.0
+    active = _start(orchestrator)
+    clock.now = 45.0
+
+    assert orchestrator.evict_idle_sessions() == [stale]
+    assert _tick(orchestrator, active)["tick"] == 1
+    with pytest.raises(ValueError, match="Unknown or expired session"):
+        _tick(orchestrator, stale)
+    assert orchestrator.session_count == 1
+
+
+def test_least_recently_used_session_is_dropped_at_capacity():
+    orchestrator = WasmutableOrchestrator(max_sessions=2)
+    first = _start(orchestrator)
+    second = _start(orchestrator)
+    _tick(orchestrator, first)
+    third = _start(orchestrator)
+
+    assert orchestrator.session_count == 2
+    with pytest.raises(ValueError):
+        orchestrator.session(second)
+    assert orchestrator.session(first).state.tick == 1
+    assert orchestrator.session(third).state.tick == 0
+
+
+def test_complete_level_closes_session():
+    orchestrator = WasmutableOrchestrator()
+    session_id = _start(orchestrator)
+    progress = decode_payload(orchestrator.complete_level(True, session_id))
+    assert progress["current_level"] == 2
+    assert orchestrator.session_count == 0
+
+
+def _batch(orchestrator: WasmutableOrchestrator, **body) -> dict[str, object]:
+    token = encode_payload({"schema": "burzen_batch_action_v1", **body})
+    return decode_payload(orchestrator.run_level_batch(token))
+
+
+def test_session_batch_matches_single_ticks():
+    batched = WasmutableOrchestrator()
+    single = WasmutableOrchestrator()
+    batch_session = _start(batched)
+    single_session = _start(single)
+
+    series = _batch(batched, session=batch_session, ticks=12)
+    expected = [_tick(single, single_session) for _ in range(12)]
+
+    assert series["schema"] == "eigenstate_delta_batch_v1"
+    assert series["count"] == 12
+    assert series["tick"] == [d["tick"] for d in expected]
+    assert series["heat"]["q95"] == [d["heat"]["q95"] for d in expected]
+    assert series["energy"]["lambda2"] == [d["energy"]["lambda2"] for d in expected]
+    assert batched.session(batch_session).state == single.session(single_session).state
+
+
+def test_session_batch_stride_samples_series():
+    orchestrator = WasmutableOrchestrator()
+    session_id = _start(orchestrator)
+    series = _batch(orchestrator, session=session_id, ticks=25, stride=10)
+    assert series["tick"] == [10, 20, 25]
+    assert _tick(orchestrator, session_id)["tick"] == 26
+
+
+def test_session_batch_reuses_the_session_plan(monkeypatch):
+    orchestrator = WasmutableOrchestrator()
+    session_id = _start(orchestrator)
+    compiled = []
+    monkeypatch.setattr(burzen_td, "compile_tick_plan", lambda *args: compiled.append(args))
+    _batch(orchestrator, session=session_id, ticks=5)
+    _batch(orchestrator, session=session_id, ticks=5, stride=2)
+    assert compiled == []
+    assert _tick(orchestrator, session_id)["tick"] == 11
+
+    session = orchestrator.session(session_id)
+    with pytest.raises(ValueError, match="stale"):
+        burzen_td.run(session.state, copy.copy(session.couplings), session.heat_diffusion, 1, plan=session.plan)
+
+
+def test_action_list_batch_replays_each_action():
+    orchestrator = WasmutableOrchestrator()
+    session_id = _start(orchestrator)
+    actions = [{"session": session_id}, {"tick": 7, "loadout": LOADOUT}, {"session": session_id}]
+    series = _batch(orchestrator, actions=actions)
+    assert series["tick"] == [1, 8, 2]
+
+
+def test_batch_rejects_bad_requests():
+    orchestrator = WasmutableOrchestrator()
+    session_id = _start(orchestrator)
+    with pytest.raises(ValueError):
+        _batch(orchestrator, session=session_id, ticks=0)
+    with pytest.raises(ValueError):
+        _batch(orchestrator, actions=[{"schema": "other", "session": session_id}])
+    with pytest.raises(ValueError):
+        _batch(orchestrator)
+    with pytest.raises(ValueError, match="Unsupported action schema"):
+        orchestrator.run_level_batch(encode_payload({"schema": "burzen_action_v1", "session": session_id}))
+
+
+def test_infinite_wave_reports_log_difficulty_for_deep_waves():
+    orchestrator = WasmutableOrchestrator()
+    shallow = decode_payload(orchestrator.next_infinite_wave(seed=9, wave_index=4))
+    assert shallow["difficulty"] == pytest.approx(math.exp(shallow["log_difficulty"]))
+
+    deep = decode_payload(orchestrator.next_infinite_wave(seed=9, wave_index=50_000))
+    assert deep["difficulty"] is None
+    assert deep["log_difficulty"] > 709.0
+
+
+def test_binary_delta_tokens_carry_the_same_payload():
+    json_orchestrator = WasmutableOrchestrator()
+    binary_orchestrator = WasmutableOrchestrator(binary_deltas=True)
+    json_session = _start(json_orchestrator)
+    binary_session = _start(binary_orchestrator)
+
+    for _ in range(3):
+        token = binary_orchestrator.run_level_tick(encode_payload({"schema": "burzen_action_v1", "session": binary_session}))
+        assert token.startswith("XDX2.")
+        assert decode_payload(token) == _tick(json_orchestrator, json_session)
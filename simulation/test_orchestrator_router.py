@@ -0,0 +1,148 @@
+import pytest
+
+from codex_eigenstate import decode_payload, encode_payload
+from orchestrator import WasmutableOrchestrator
+from orchestrator_router import ShardedOrchestrator
+
+LOADOUTS = [
+    ["kinetic", "thermal", "energy", "reaction"],
+    ["kinetic", "thermal", "energy", "pulse"],
+    ["thermal", "energy", "reaction", "pulse"],
+]
+
+
+def _action(**body) -> str:
+    return encode_payload({"schema": "burzen_action_v1", **body})
+
+
+def _start(orchestrator, loadout, **custom) -> str:
+    extra = {"custom": custom} if custom else {}
+    return decode_payload(orchestrator.start_level(_action(level=3, loadout=loadout, **extra)))["session"]
+
+
+@pytest.fixture
+def router():
+    with ShardedOrchestrator(workers=3) as sharded:
+        yield sharded
+
+
+def test_router_sessions_match_single_process_orchestrator(router):
+    reference = WasmutableOrchestrator()
+    pairs = []
+    for i in range(9):
+        loadout = LOADOUTS[i % 3]
+        pairs.append((_start(router, loadout, alpha=0.8 + 0.05 * i), _start(reference, loadout, alpha=0.8 + 0.05 * i)))
+
+    futures = [
+        [router.submit("run_level_tick", _action(session=sharded), session=sharded) for _ in range(10)]
+        for sharded, _ in pairs
+    ]
+    for (_, local), pending in zip(pairs, futures):
+        assert [f.result() for f in pending] == [reference.run_level_tick(_action(session=local)) for _ in range(10)]
+
+    loads = router.worker_loads()
+    assert sum(load.sessions for load in loads) == 9
+    assert sum(1 for load in loads if load.sessions) > 1
+    assert all(load.in_flight == 0 for load in loads)
+
+
+def test_router_moves_sessions_off_a_dead_worker(router):
+    reference = WasmutableOrchestrator()
+    pairs = [(_start(router, LOADOUTS[i % 3]), _start(reference, LOADOUTS[i % 3])) for i in range(12)]
+    for sharded, local in pairs:
+        for _ in range(4):
+            router.run_level_tick(_action(session=sharded), sharded)
+            reference.run_level_tick(_action(session=local))
+        batch = encode_payload({"schema": "burzen_batch_action_v1", "session": sharded, "ticks": 5})
+        router.run_level_batch(batch, sharded)
+        reference.run_level_batch(encode_payload({"schema": "burzen_batch_action_v1", "session": local, "ticks": 5}))
+
+    victim = max(router.worker_loads(), key=lambda load: load.sessions)
+    router.workers[victim.index].process.kill()
+
+    for sharded, local in pairs:
+        moved = decode_payload(router.run_level_tick(_action(session=sharded), sharded))
+        expected = decode_payload(reference.run_level_tick(_action(session=local)))
+        assert moved == expected
+        assert moved["tick"] == 10
+
+    loads = router.worker_loads()
+    assert not loads[victim.index].alive
+    assert loads[victim.index].sessions == 0
+    assert sum(load.sessions_moved_in for load in loads) == victim.sessions
+
+
+def test_router_errors_and_eviction():
+    now = [0.0]
+    with ShardedOrchestrator(workers=2, session_idle_seconds=10.0, clock=lambda: now[0]) as router:
+        with pytest.raises(ValueError, match="locked towers"):
+            router.start_level(_action(level=1, loadout=["field", "kinetic", "thermal", "energy"]))
+        assert router.session_count == 0
+
+        session = _start(router, LOADOUTS[0])
+        with pytest.raises(ValueError, match="Unknown or expired session"):
+            router.run_level_tick(_action(session="missing"), "missing")
+
+        wave = decode_payload(router.next_infinite_wave(seed=5, wave_index=3))
+        assert wave == decode_payload(WasmutableOrchestrator().next_infinite_wave(seed=5, wave_index=3))
+
+        now[0] = 30.0
+        assert router.evict_idle_sessions() == [session]
+        with pytest.raises(ValueError):
+            router.run_level_tick(_action(session=session), session)
+
+
+def test_router_campaign_progress_matches_single_process(router):
+    reference = WasmutableOrchestrator()
+    loadout = LOADOUTS[0]
+    for won in (True, True, False, True):
+        started = router.start_level(_action(loadout=loadout))
+        assert started == reference.start_level(_action(loadout=loadout))
+        session = decode_payload(started)["session"]
+        assert router.complete_level(won, session) == reference.complete_level(won, session)
+        assert router.session_count == 0
+    assert decode_payload(router.start_level(_action(loadout=loadout)))["level"] == 4
+
+
+def test_router_routes_sessionless_ticks_by_token(router):
+    reference = WasmutableOrchestrator()
+    pairs = [(_start(router, LOADOUTS[i % 3]), _start(reference, LOADOUTS[i % 3])) for i in range(6)]
+    for sharded, local in pairs:
+        for _ in range(3):
+            assert router.run_level_tick(_action(session=sharded)) == reference.run_level_tick(_action(session=local))
+
+    stateless = _action(loadout=LOADOUTS[1], tick=4)
+    assert router.run_level_tick(stateless) == reference.run_level_tick(stateless)
+
+    first, second = pairs[0][0], pairs[1][0]
+    with pytest.raises(ValueError, match="names session"):
+        router.run_level_tick(_action(session=first), second)
+    mixed = encode_payload(
+        {"schema": "burzen_batch_action_v1", "actions": [{"session": first}, {"session": second}]}
+    )
+    with pytest.raises(ValueError, match="same session"):
+        router.run_level_batch(mixed)
+
+
+def test_router_checkpoints_bound_the_replay_log():
+    reference = WasmutableOrchestrator()
+    with ShardedOrchestrator(workers=3, checkpoint_interval=4) as router:
+        pairs = [(_start(router, LOADOUTS[i % 3]), _start(reference, LOADOUTS[i % 3])) for i in range(6)]
+        for step in range(25):
+            for sharded, local in pairs:
+                if step % 6 == 5:
+                    batch = {"schema": "burzen_batch_action_v1", "ticks": 3}
+                    router.run_level_batch(encode_payload({**batch, "session": sharded}))
+                    reference.run_level_batch(encode_payload({**batch, "session": local}))
+                else:
+                    router.run_level_tick(_action(session=sharded))
+                    reference.run_level_tick(_action(session=local))
+        for sharded, _ in pairs:
+            route = router._routes[sharded]
+            assert route.checkpoint is not None
+            assert route.logged <= 4
+
+        victim = max(router.worker_loads(), key=lambda load: load.sessions)
+        router.workers[victim.index].process.kill()
+        for sharded, local in pairs:
+            assert router.run_level_tick(_action(session=sharded)) == reference.run_level_tick(_action(session=local))
@@ -0,0 +1,147 @@
+import asyncio
+import threading
+
+import pytest
+
+from codex_eigenstate import decode_payload, encode_payload
+from orchestrator import WasmutableOrchestrator
+from orchestrator_server import OrchestratorClient, OrchestratorServer
+
+LOADOUT = ["kinetic", "thermal", "energy", "reaction"]
+
+
+def _action(**body) -> str:
+    return encode_payload({"schema": "burzen_action_v1", **body})
+
+
+async def _play(client: OrchestratorClient, ticks: int) -> list[int]:
+    started = decode_payload(await client.call("start_level", _action(level=1, loadout=LOADOUT)))
+    session = started["session"]
+    # Pipeline every tick at once; the session lane must still run them in order.
+    replies = await asyncio.gather(
+        *(client.call("run_level_tick", _action(session=session), session=session) for _ in range(ticks))
+    )
+    return [decode_payload(reply)["tick"] for reply in replies]
+
+
+def test_server_orders_pipelined_ticks_per_session(tmp_path):
+    async def scenario():
+        server = OrchestratorServer(queue_size=4)
+        path = str(tmp_path / "orchestrator.sock")
+        await server.start_unix(path)
+        clients = [await OrchestratorClient.connect_unix(path) for _ in range(20)]
+        try:
+            results = await asyncio.gather(*(_play(client, 15) for client in clients))
+        finally:
+            for client in clients:
+                await client.close()
+            await server.close()
+        return server, results
+
+    server, results = asyncio.run(scenario())
+    assert all(ticks == list(range(1, 16)) for ticks in results)
+    assert server.orchestrator.session_count == 20
+    assert server.stats.requests == 20 * 16
+    assert server.stats.errors == 0
+    assert server.stats.lane_waits > 0
+
+
+def test_server_reports_errors_without_dropping_connection():
+    async def scenario():
+        server = OrchestratorServer()
+        listener = await server.start_tcp("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        client = await OrchestratorClient.connect_tcp("127.0.0.1", port)
+        try:
+            with pytest.raises(ValueError, match="Unknown method"):
+                await client.call("explode")
+            with pytest.raises(ValueError, match="Unknown or expired session"):
+                await client.call("run_level_tick", _action(session="nope"), session="nope")
+            wave = decode_payload(await client.call("next_infinite_wave", seed=3, wave_index=2))
+            batch_token = encode_payload({"schema": "burzen_batch_action_v1", "actions": [{"tick": 0, "loadout": LOADOUT}]})
+            batch = decode_payload(await client.call("run_level_batch", batch_token))
+        finally:
+            await client.close()
+            await server.close()
+        return server, wave, batch
+
+    server, wave, batch = asyncio.run(scenario())
+    assert wave["schema"] == "infinite_wave_v1"
+    assert batch["tick"] == [1]
+    assert server.stats.errors == 2
+
+
+class _RendezvousOrchestrator(WasmutableOrchestrator):
+    """Holds the first tick of each session until both sessions are ticking."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.entered = {"s000001": threading.Event(), "s000002": threading.Event()}
+        self.waits: list[bool] = []
+
+    def run_level_tick(self, action_payload: str) -> str:
+        session = decode_payload(action_payload).get("session")
+        entered = self.entered[session]
+        if not entered.is_set():
+            entered.set()
+            self.waits.append(all(event.wait(timeout=2.0) for event in self.entered.values()))
+        return super().run_level_tick(action_payload)
+
+
+def test_server_runs_sessions_concurrently_and_keys_lanes_by_token():
+    async def scenario():
+        server = OrchestratorServer(_RendezvousOrchestrator())
+        listener = await server.start_tcp("127.0.0.1", 0)
+        client = await OrchestratorClient.connect_tcp("127.0.0.1", listener.sockets[0].getsockname()[1])
+        try:
+            first, second = [
+                decode_payload(await client.call("start_level", _action(level=1, loadout=LOADOUT)))["session"]
+                for _ in range(2)
+            ]
+            # No session field: each tick's lane comes from the session in its token.
+            replies = await asyncio.gather(
+                *(client.call("run_level_tick", _action(session=first)) for _ in range(3)),
+                client.call("run_level_tick", _action(session=second)),
+            )
+            with pytest.raises(ValueError, match="does not match"):
+                await client.call("run_level_tick", _action(session=first), session=second)
+        finally:
+            await client.close()
+            await server.close()
+        return server, replies
+
+    server, replies = asyncio.run(scenario())
+    assert server.orchestrator.waits == [True, True]
+    assert [decode_payload(reply)["tick"] for reply in replies] == [1, 2, 3, 1]
+    assert server.orchestrator.session("s000001").state.tick == 3
+
+
+def test_server_decodes_lane_tokens_off_the_event_loop(monkeypatch):
+    import orchestrator_server
+
+    on_loop: list[bool] = []
+
+    def recording_decode(token):
+        on_loop.append(threading.current_thread() is threading.main_thread())
+        return decode_payload(token)
+
+    monkeypatch.setattr(orchestrator_server, "decode_payload", recording_decode)
+
+    async def scenario():
+        server = OrchestratorServer()
+        listener = await server.start_tcp("127.0.0.1", 0)
+        client = await OrchestratorClient.connect_tcp("127.0.0.1", listener.sockets[0].getsockname()[1])
+        try:
+            session = decode_payload(await client.call("start_level", _action(level=1, loadout=LOADOUT)))["session"]
+            await client.call("run_level_tick", _action(session=session))
+            for won in ("false", 0, None):
+                with pytest.raises(ValueError, match="Invalid params"):
+                    await client.call("complete_level", won=won)
+            return decode_payload(await client.call("complete_level", won=False))
+        finally:
+            await client.close()
+            await server.close()
+
+    progress = asyncio.run(scenario())
+    assert on_loop == [False]
+    assert progress["completed_levels"] == []
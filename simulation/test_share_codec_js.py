@@ -0,0 +1,81 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from codex_eigenstate import SHARE_DICTIONARY, canonical_json_bytes, decode_payload, encode_payload_compressed
+from share_codec_benchmark import benchmark, load_level_corpus, synthetic_share_levels
+
+CODEC_JS = Path(__file__).resolve().parent.parent / "docs" / "core" / "codec.js"
+
+SCRIPT = """
+import * as codec from "./codec.mjs";
+const [pythonTokens, payloads] = JSON.parse(process.argv[2]);
+const decoded = [];
+for (const token of pythonTokens) decoded.push(await codec.decodeCompressedPayload(token));
+const encoded = [];
+for (const payload of payloads) encoded.push(await codec.encodeCompressedPayload(payload));
+console.log(JSON.stringify({ dictionary: codec.SHARE_DICTIONARY, decoded, encoded }));
+"""
+
+
+def test_js_codec_interoperates_with_python_reference(tmp_path):
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("node is not available")
+    shutil.copy(CODEC_JS, tmp_path / "codec.mjs")
+    (tmp_path / "check.mjs").write_text(SCRIPT, encoding="utf-8")
+
+    payloads = synthetic_share_levels(25, seed=3) + load_level_corpus()[:5]
+    tokens = [encode_payload_compressed(p) for p in payloads]
+    result = subprocess.run(
+        [node, "check.mjs", json.dumps([tokens, payloads])], cwd=tmp_path, capture_output=True, text=True, check=True
+    )
+    output = json.loads(result.stdout)
+
+    assert output["dictionary"].encode("utf-8") == SHARE_DICTIONARY
+    assert output["decoded"] == payloads
+    for js_token, py_token, payload in zip(output["encoded"], tokens, payloads):
+        assert js_token.split(".")[2] == py_token.split(".")[2]
+        assert decode_payload(js_token) == payload
+
+NUMBER_SCRIPT = """
+import * as codec from "./codec.mjs";
+const payloads = JSON.parse(process.argv[2]);
+const canonical = payloads.map((payload) => codec.canonicalJson(payload));
+const encoded = [];
+for (const payload of payloads) encoded.push(await codec.encodeCompressedPayload(payload));
+console.log(JSON.stringify({ canonical, encoded }));
+"""
+
+
+def test_js_canonical_json_matches_python_numbers(tmp_path):
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("node is not available")
+    shutil.copy(CODEC_JS, tmp_path / "codec.mjs")
+    (tmp_path / "check.mjs").write_text(NUMBER_SCRIPT, encoding="utf-8")
+
+    payloads = [
+        {"schema": "eigenstate_v1", "energy_setpoint": 1.0, "epigenetic_profile": 0.25, "version_id": 3},
+        {"h": -0.0, "w": [[1.0, 10.0], [2.5, 1e16], [3, 1e22]], "s": 12.0},
+        {"small": [1e-4, 1e-6, 9.5e-7, 1.5e-7, -2e-10, 5e-324], "large": [1.5e15, 123456789.125, -1e21, 1.5e300]},
+    ]
+    result = subprocess.run(
+        [node, "check.mjs", json.dumps(payloads)], cwd=tmp_path, capture_output=True, text=True, check=True
+    )
+    output = json.loads(result.stdout)
+
+    js_canonical = [canonical_json_bytes(p, js_numbers=True) for p in payloads]
+    assert js_canonical[0] == b'{"energy_setpoint":1,"epigenetic_profile":0.25,"schema":"eigenstate_v1","version_id":3}'
+    assert [c.encode("utf-8") for c in output["canonical"]] == js_canonical
+    for js_token, payload in zip(output["encoded"], payloads):
+        assert js_token.split(".")[2] == encode_payload_compressed(payload).split(".")[2]
+        assert decode_payload(js_token) == payload
+
+def test_share_benchmark_reports_smaller_tokens():
+    result = benchmark(synthetic_share_levels(20, seed=1), repeat=1)
+    assert result["levels"] == 20
+    assert result["xdz1_mean_chars"] < result["xdz1_no_dict_mean_chars"] < result["xdx1_mean_chars"]
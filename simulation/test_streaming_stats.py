@@ -0,0 +1,53 @@
+import math
+import random
+import statistics
+
+from burzen_td import BurzenTDState, TowerArchetype, TowerState, build_sparse_coupling, run
+from streaming_stats import HeatRunAccumulator, P2Quantile, RunningMoments
+
+
+def test_running_moments_match_population_statistics():
+    rng = random.Random(4)
+    values = [rng.gauss(40.0, 9.0) for _ in range(5000)]
+    moments = RunningMoments()
+    for start in range(0, len(values), 333):
+        moments.add_many(values[start : start + 333])
+    single = RunningMoments()
+    for v in values:
+        single.add(v)
+
+    assert moments.count == single.count == len(values)
+    assert math.isclose(moments.mean, statistics.fmean(values), rel_tol=1e-12)
+    assert math.isclose(moments.std, statistics.pstdev(values), rel_tol=1e-9)
+    assert math.isclose(single.std, statistics.pstdev(values), rel_tol=1e-9)
+
+
+def test_p2_quantile_tracks_q95_without_history():
+    rng = random.Random(8)
+    values = [rng.uniform(0.0, 60.0) for _ in range(20000)]
+    estimator = P2Quantile(0.95)
+    estimator.add_many(values)
+    exact = sorted(values)[math.ceil(0.95 * len(values)) - 1]
+    assert abs(estimator.value - exact) < 0.5
+
+
+def test_p2_quantile_is_exact_for_first_samples():
+    estimator = P2Quantile(0.95)
+    estimator.add_many([3.0, 1.0, 2.0])
+    assert estimator.value == 3.0
+
+
+def test_heat_run_accumulator_covers_every_tick_of_run():
+    archetypes = list(TowerArchetype)
+    towers = [TowerState(archetype=archetypes[i % 8], heat=float(i % 13)) for i in range(40)]
+    state = BurzenTDState(towers=towers)
+    coupling = build_sparse_coupling([(float(i % 8), float(i // 8)) for i in range(40)], cutoff=1.0, weight=0.05)
+
+    stats = HeatRunAccumulator()
+    samples = run(state, coupling, coupling, 60, heat_stats=stats)
+
+    assert len(samples) == 1
+    assert stats.ticks == 60
+    assert stats.summary()["samples"] == 60 * 40
+    assert 0.0 < stats.heat_mean < stats.heat_q <= 100.0
+    assert stats.heat_std > 0.0
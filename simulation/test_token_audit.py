@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from codex_eigenstate import RejectionType, decode_payload_with_rejection, encode_payload, encode_payload_binary
+from token_audit import audit_tokens
+
+
+def _corpus(seed: int, count: int) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    next_version = {f"stream-{k}": 0 for k in range(7)}
+    items = []
+    for _ in range(count):
+        stream = rng.choice(sorted(next_version))
+        version_id = next_version[stream] + rng.choice([1, 1, 1, 0, -2])
+        next_version[stream] = max(next_version[stream], version_id)
+        token = encode_payload({"schema": "burzen_action_v1", "tick": version_id, "version_id": version_id})
+        roll = rng.random()
+        if roll < 0.05:
+            token = token[:-1] + ("0" if token[-1] != "0" else "1")
+        elif roll < 0.08:
+            token = "XDX9" + token[4:]
+        elif roll < 0.10:
+            token = token.replace(".", "", 1)
+        items.append((stream, token))
+    return items
+
+
+def _reference(items):
+    watermarks, counts, offending = {}, {}, {}
+    for index, (stream, token) in enumerate(items):
+        result = decode_payload_with_rejection(token, last_version_id=watermarks.get(stream, -1))
+        if result["valid"]:
+            watermarks[stream] = result["version_id"]
+        else:
+            counts[result["rejection"]] = counts.get(result["rejection"], 0) + 1
+            offending.setdefault(result["rejection"], []).append(index)
+    return watermarks, counts, offending
+
+
+@pytest.mark.parametrize("pool", ["inline", "thread", "process"])
+def test_audit_matches_sequential_rejection_checks(pool):
+    items = _corpus(5, 3000)
+    watermarks, counts, offending = _reference(items)
+
+    report = audit_tokens(iter(items), pool=pool, workers=2, chunk_size=97, max_pending=3)
+    assert report.total == len(items)
+    assert report.accepted == len(items) - sum(counts.values())
+    assert dict(report.rejections) == counts
+    assert report.offending == offending
+    assert report.watermarks == watermarks
+    assert set(counts) == {r.value for r in RejectionType}
+
+
+def test_audit_caps_offending_indices_and_reports_every_rejection():
+    token = encode_payload_binary(
+        {
+            "schema": "eigenstate_delta_v1",
+            "tick": 1,
+            "version_id": 5,
+            "energy": {"lambda2": 0.0, "lambda3": 0.0, "fiedler_sign_balance": 0.5},
+            "heat": {"mean": 0.0, "std": 0.0, "q95": 0.0, "instability_count": 0},
+        }
+    )
+    seen = []
+    report = audit_tokens(
+        (("replay", token) for _ in range(50)),
+        pool="inline",
+        max_offending=10,
+        last_version_ids={"replay": 2},
+        on_rejection=lambda index, stream, rejection: seen.append(index),
+    )
+    assert report.accepted == 1
+    assert report.rejections[RejectionType.ORDER_VIOLATION.value] == 49
+    assert report.offending[RejectionType.ORDER_VIOLATION.value] == list(range(1, 11))
+    assert report.offending_truncated
+    assert seen == list(range(1, 50))
+    assert report.watermarks == {"replay": 5}
+
+
+@pytest.mark.parametrize("pool", ["inline", "process"])
+def test_audit_rejects_non_numeric_version_ids_as_schema(pool):
+    items = [("s", encode_payload({"schema": "burzen_action_v1", "version_id": v})) for v in range(1, 40)]
+    items.insert(20, ("s", encode_payload({"schema": "burzen_action_v1", "version_id": "v21"})))
+    items.insert(30, ("s", encode_payload({"schema": "burzen_action_v1", "version_id": [3]})))
+
+    report = audit_tokens(iter(items), pool=pool, workers=2, chunk_size=7)
+    assert report.total == 41
+    assert report.accepted == 39
+    assert dict(report.rejections) == {RejectionType.SCHEMA.value: 2}
+    assert report.offending[RejectionType.SCHEMA.value] == [20, 30]
+    assert report.watermarks == {"s": 39}
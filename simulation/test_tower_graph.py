@@ -3,17 +3,33 @@
 from __future__ import annotations
 
 import json
+import math
 import unittest
 from random import Random
 
 from simulation.tower_graph import (
+    RESIDUE_CODES,
     AffinityTable,
+    Bond,
+    CellConflictWarning,
     TowerGraph,
     TowerNode,
+    TowerStore,
     normalize_tower_definitions,
 )
 
 
+RESIDUES = tuple(RESIDUE_CODES)
+
+
+class CountingAffinityTable(AffinityTable):
+    calls = 0
+
+    def evaluate_many(self, left_idx, right_idx, thermal, dx, dy, *, diagonal=False):
+        self.calls += len(left_idx)
+        return super().evaluate_many(left_idx, right_idx, thermal, dx, dy, diagonal=diagonal)
+
+
 class TowerGraphTests(unittest.TestCase):
     def test_normalize_tower_definitions_assigns_residue_class(self) -> None:
         defs = normalize_tower_definitions(["triangle", "water", "synthesis_hub", "unknown"])
@@ -103,6 +119,295 @@ class TowerGraphTests(unittest.TestCase):
                 self.assertAlmostEqual(tick_a.graph_stats.avg_stability, tick_b.graph_stats.avg_stability, places=12)
                 self.assertAlmostEqual(tick_a.graph_stats.misfold_risk, tick_b.graph_stats.misfold_risk, places=12)
 
+    def test_same_cell_placement_is_rejected(self) -> None:
+        graph = TowerGraph()
+        graph.place_tower(TowerNode(1, "triangle", "nonpolar", 0, 0, 0.0))
+        with self.assertRaises(ValueError):
+            graph.place_tower(TowerNode(2, "square", "nonpolar", 0, 0, 0.0), strict=True)
+        self.assertEqual(graph.tower_at(0, 0).id, 1)
+
+        payload = graph.serialize()
+        payload["towers"].append(dict(payload["towers"][0], id=2))
+        with self.assertRaises(ValueError):
+            TowerGraph.from_serialized(payload, strict=True)
+
+    def test_same_cell_conflicts_resolve_last_wins_with_a_warning(self) -> None:
+        graph = TowerGraph()
+        graph.place_tower(TowerNode(1, "triangle", "nonpolar", 0, 0, 0.0))
+        graph.place_tower(TowerNode(2, "square", "nonpolar", 1, 0, 0.0))
+        graph.tick()
+        payload = graph.serialize()
+        payload["towers"].append(dict(payload["towers"][0], id=3, tower_id="hexagon"))
+
+        with self.assertWarns(CellConflictWarning):
+            restored = TowerGraph.from_serialized(payload)
+        self.assertEqual(restored.tower_at(0, 0).id, 3)
+        self.assertEqual(sorted(restored.towers), [2, 3])
+        self.assertEqual(list(restored.bonds), [])
+        self.assertEqual([(b.from_id, b.to_id) for b in restored.tick().bonds], [(2, 3)])
+
+        with self.assertWarns(CellConflictWarning):
+            graph.place_tower(TowerNode(4, "water", "polar_uncharged", 1, 0, 0.0))
+        self.assertEqual(sorted(graph.towers), [1, 4])
+        self.assertEqual(graph.tower_at(1, 0).id, 4)
+
+    def test_moving_a_tower_updates_cell_index_and_bonds(self) -> None:
+        graph = TowerGraph()
+        graph.place_tower(TowerNode(1, "triangle", "nonpolar", 0, 0, 0.0))
+        graph.place_tower(TowerNode(2, "square", "nonpolar", 1, 0, 0.0))
+        self.assertEqual(set(graph.bonds), {(1, 2)})
+
+        graph.place_tower(TowerNode(2, "square", "nonpolar", 5, 5, 0.0))
+        self.assertIsNone(graph.tower_at(1, 0))
+        self.assertEqual(graph.tower_at(5, 5).id, 2)
+        self.assertEqual(graph.bonds, {})
+
+        graph.remove_tower(2)
+        self.assertIsNone(graph.tower_at(5, 5))
+        graph.place_tower(TowerNode(3, "hexagon", "nonpolar", 5, 5, 0.0))
+        self.assertEqual(graph.tower_at(5, 5).id, 3)
+
+    def test_indexed_neighbors_match_brute_force_scan(self) -> None:
+        rng = Random(7)
+        for diagonal in (False, True):
+            graph = TowerGraph(diagonal_connectivity=diagonal)
+            cells = rng.sample([(x, y) for x in range(30) for y in range(30)], 600)
+            for tower_id, (x, y) in enumerate(cells, start=1):
+                graph.place_tower(TowerNode(tower_id, "t", "nonpolar", x, y, 0.0))
+            graph.tick()
+
+            expected = set()
+            for (ax, ay), a in zip(cells, range(1, len(cells) + 1)):
+                for (bx, by), b in zip(cells, range(1, len(cells) + 1)):
+                    dx, dy = abs(ax - bx), abs(ay - by)
+                    if a < b and (dx + dy == 1 or (diagonal and dx == 1 and dy == 1)):
+                        expected.add((a, b))
+            self.assertEqual(set(graph.bonds), expected)
+
+    def test_tick_reevaluates_only_dirty_towers(self) -> None:
+        table = CountingAffinityTable(matrix=AffinityTable.defaults().matrix)
+        graph = TowerGraph(affinity_table=table)
+        for tower_id, x in enumerate(range(10), start=1):
+            graph.place_tower(TowerNode(tower_id, "triangle", "nonpolar", x, 0, 0.0))
+        graph.tick()
+        table.calls = 0
+        graph.tick()
+        self.assertEqual(table.calls, 0)
+
+        before = graph.bonds[(1, 2)].strength
+        graph.update_tower_thermal_state(1, 1.0)
+        self.assertEqual(graph.dirty_towers, {1})
+        self.assertEqual(graph.bonds[(1, 2)].strength, before)
+        graph.tick()
+        self.assertEqual(table.calls, 1)
+        self.assertLess(graph.bonds[(1, 2)].strength, before)
+
+        table.calls = 0
+        graph.tick(full=True)
+        self.assertEqual(table.calls, 9)
+
+    def test_verify_incremental_matches_full_recompute(self) -> None:
+        rng = Random(3)
+        graph = TowerGraph(verify_incremental=True)
+        cells = rng.sample([(x, y) for x in range(8) for y in range(8)], 30)
+        for tower_id, (x, y) in enumerate(cells, start=1):
+            graph.place_tower(TowerNode(tower_id, "t", rng.choice(list(RESIDUES)), x, y, 0.0))
+        for step in range(40):
+            tower_id = rng.choice(sorted(graph.towers))
+            if step % 7 == 0:
+                graph.remove_tower(tower_id)
+            else:
+                graph.update_tower_thermal_state(tower_id, round(rng.random() * 2.0, 3))
+            if step == 20:
+                graph.set_affinity_table(AffinityTable.from_serialized(AffinityTable.defaults().serialize()))
+            graph.tick()
+
+        # Direct assignment of a rule field takes effect on the next plain tick.
+        def diagonal_bonds() -> int:
+            return sum(graph.towers[a].pos_x != graph.towers[b].pos_x and graph.towers[a].pos_y != graph.towers[b].pos_y for a, b in graph.bonds)
+
+        graph.diagonal_connectivity = True
+        graph.tick()
+        self.assertGreater(diagonal_bonds(), 0)
+        graph.bond_threshold = 0.5
+        graph.tick()
+        self.assertTrue(all(abs(bond.strength) >= 0.5 for bond in graph.bonds.values()))
+        graph.diagonal_connectivity = False
+        graph.bond_threshold = 0.20
+        graph.tick()
+        self.assertEqual(diagonal_bonds(), 0)
+
+    def test_assigning_affinity_table_takes_effect_on_tick(self) -> None:
+        graph = TowerGraph()
+        graph.place_tower(TowerNode(1, "t", "nonpolar", 0, 0, 0.0))
+        graph.place_tower(TowerNode(2, "t", "nonpolar", 1, 0, 0.0))
+        graph.tick()
+        matrix = dict(AffinityTable.defaults().matrix)
+        matrix[("nonpolar", "nonpolar")] = 0.5
+        graph.affinity_table = AffinityTable(matrix=matrix)
+        graph.tick()
+        self.assertEqual(graph.bonds[(1, 2)].strength, graph.affinity_table.evaluate(graph.towers.node(0), graph.towers.node(1))[0])
+        self.assertLess(graph.bonds[(1, 2)].strength, 0.6)
+
+    def test_affinity_matrix_edits_cannot_go_stale(self) -> None:
+        graph = TowerGraph()
+        graph.place_tower(TowerNode(1, "t", "nonpolar", 0, 0, 0.0))
+        graph.place_tower(TowerNode(2, "t", "nonpolar", 1, 0, 0.0))
+        self.assertEqual(graph.tick().graph_stats.total_bonds, 1)
+        table = graph.affinity_table
+        with self.assertRaises(TypeError):
+            table.matrix[("nonpolar", "nonpolar")] = 0.0
+
+        table.matrix = {pair: 0.0 for pair in table.matrix}
+        self.assertEqual(graph.tick().graph_stats.total_bonds, 0)
+        self.assertEqual(set(table.serialize()["matrix"].values()), {0.0})
+
+        swapped = table.with_matrix({("nonpolar", "nonpolar"): 0.5})
+        self.assertEqual(table.matrix[("nonpolar", "nonpolar")], 0.0)
+        graph.set_affinity_table(swapped)
+        self.assertEqual(graph.tick().bonds[0].strength, 0.5)
+        graph.update_tower_thermal_state(1, 0.5)
+        graph.update_tower_thermal_state(2, 0.5)
+        self.assertEqual(graph.tick().graph_stats.total_bonds, 1)
+        swapped.thermal_penalty_gain = 2.0
+        self.assertEqual(graph.tick().graph_stats.total_bonds, 0)
+
+    def test_graph_stats_track_bond_changes(self) -> None:
+        rng = Random(11)
+        graph = TowerGraph()
+        cells = rng.sample([(x, y) for x in range(12) for y in range(12)], 90)
+        for tower_id, (x, y) in enumerate(cells, start=1):
+            graph.place_tower(TowerNode(tower_id, "t", rng.choice(RESIDUES), x, y, round(rng.random(), 3)))
+        for step in range(60):
+            tower_id = rng.choice(sorted(graph.towers))
+            if step % 5 == 0:
+                graph.remove_tower(tower_id)
+            else:
+                graph.update_tower_thermal_state(tower_id, round(rng.random() * 2.0, 3))
+            snap = graph.tick()
+
+            bonds = [graph.bonds[k] for k in sorted(graph.bonds)]
+            self.assertEqual(snap.bonds, tuple(bonds))
+            self.assertEqual([t.id for t in snap.towers], sorted(graph.towers))
+            self.assertEqual(graph.graph_stats, snap.graph_stats)
+            self.assertEqual(snap.graph_stats.total_bonds, len(bonds))
+            self.assertAlmostEqual(snap.graph_stats.avg_stability, math.fsum(b.contrib for b in bonds) / len(bonds), places=15)
+            self.assertEqual(snap.graph_stats.misfold_risk, sum(b.contrib < 0 for b in bonds) / len(bonds))
+
+        for tower_id in list(graph.towers):
+            graph.remove_tower(tower_id)
+        self.assertEqual(graph.graph_stats.total_bonds, 0)
+        self.assertEqual(graph.graph_stats.avg_stability, 0.0)
+
+    def test_evaluate_many_matches_scalar_evaluate(self) -> None:
+        rng = Random(5)
+        tables = [
+            AffinityTable.defaults(),
+            AffinityTable.from_serialized({"matrix": {f"{a}|{b}": rng.uniform(-1, 1) for a in RESIDUES for b in RESIDUES}}),
+        ]
+        pairs = []
+        for _ in range(200):
+            left = TowerNode(1, "a", rng.choice(RESIDUES), rng.randint(0, 3), rng.randint(0, 3), rng.random() * 3)
+            right = TowerNode(2, "b", rng.choice(RESIDUES), rng.randint(0, 3), rng.randint(0, 3), rng.random() * 3)
+            pairs.append((left, right))
+        for table in tables:
+            for diagonal in (False, True):
+                scores = table.evaluate_many(
+                    [RESIDUE_CODES[l.residue_class] for l, _ in pairs],
+                    [RESIDUE_CODES[r.residue_class] for _, r in pairs],
+                    [(l.thermal_state + r.thermal_state) * 0.5 for l, r in pairs],
+                    [l.pos_x - r.pos_x for l, r in pairs],
+                    [l.pos_y - r.pos_y for l, r in pairs],
+                    diagonal=diagonal,
+                )
+                self.assertEqual(scores, [table.evaluate(l, r, diagonal=diagonal)[0] for l, r in pairs])
+
+    def test_partial_matrix_reports_missing_pairs(self) -> None:
+        table = AffinityTable.from_serialized({"matrix": {"nonpolar|polar_uncharged": 0.9}})
+        nonpolar, special = RESIDUE_CODES["nonpolar"], RESIDUE_CODES["special"]
+        self.assertEqual(len(table.evaluate_many([nonpolar], [RESIDUE_CODES["polar_uncharged"]], [0.0], [1], [0])), 1)
+        with self.assertRaises(KeyError):
+            table.evaluate_many([nonpolar], [special], [0.0], [1], [0])
+        with self.assertRaises(KeyError):
+            table.evaluate(TowerNode(1, "a", "nonpolar", 0, 0), TowerNode(2, "b", "special", 1, 0))
+
+    def test_columnar_store_updates_thermal_state_in_place(self) -> None:
+        graph = TowerGraph()
+        graph.place_tower(TowerNode(1, "triangle", "nonpolar", 0, 0, 0.0, ("hydrophobic_core",)))
+        graph.place_tower(TowerNode(2, "square", "nonpolar", 1, 0, 0.0))
+        before = graph.tick()
+        tower = graph.towers[1]
+        bond = graph.bonds[(1, 2)]
+        self.assertEqual(tower, before.towers[0])
+        self.assertEqual(bond, before.bonds[0])
+
+        graph.update_tower_thermal_state(1, 0.9)
+        self.assertEqual(tower.thermal_state, 0.9)
+        self.assertEqual(tower.modifiers, ("hydrophobic_core",))
+        after = graph.tick()
+        self.assertEqual(before.towers[0].thermal_state, 0.0)
+        self.assertIsInstance(after.bonds[0], Bond)
+        self.assertEqual(bond.strength, after.bonds[0].strength)
+        self.assertLess(bond.strength, before.bonds[0].strength)
+        self.assertEqual(bond.timestamp, graph.tick_counter)
+
+    def test_tower_store_reuses_freed_slots(self) -> None:
+        store = TowerStore()
+        first = store.add(TowerNode(1, "a", "special", 0, 0))
+        store.add(TowerNode(2, "b", "polar_uncharged", 1, 0, 0.5, ("turn_preference",)))
+        store.remove(1)
+        self.assertEqual(store.add(TowerNode(3, "c", "nonpolar", 2, 0)), first)
+        self.assertEqual(sorted(store), [2, 3])
+        self.assertEqual(store[3].to_node(), TowerNode(3, "c", "nonpolar", 2, 0, 0.0))
+        self.assertEqual(store[2].modifiers, ("turn_preference",))
+        with self.assertRaises(ValueError):
+            store.add(TowerNode(4, "d", "metallic", 3, 0))
+
+    def test_towers_keep_dict_style_assignment_and_constructor(self) -> None:
+        left = TowerNode(1, "triangle", "nonpolar", 0, 0)
+        right = TowerNode(2, "square", "nonpolar", 1, 0)
+        graph = TowerGraph(towers={1: left, 2: right})
+        self.assertEqual(graph.tick().graph_stats.total_bonds, 1)
+
+        placed = TowerGraph()
+        placed.towers[1] = left
+        placed.towers[2] = right
+        self.assertEqual(list(placed.bonds), [(1, 2)])
+        self.assertEqual(placed.tower_at(1, 0).id, 2)
+        del placed.towers[2]
+        self.assertEqual(list(placed.towers), [1])
+        self.assertEqual(len(placed.bonds), 0)
+        with self.assertRaises(KeyError):
+            del placed.towers[2]
+        with self.assertRaises(ValueError):
+            placed.towers[3] = right
+
+        restored = TowerGraph(towers=graph.towers, bonds=graph.bonds, tick_counter=graph.tick_counter)
+        self.assertEqual(restored.serialize(), graph.serialize())
+
+    def test_float_valued_payload_loads_as_integers(self) -> None:
+        graph = TowerGraph()
+        graph.place_tower(TowerNode(1, "triangle", "nonpolar", 0, 0, 0.1))
+        graph.place_tower(TowerNode(2, "square", "nonpolar", 1, 0, 0.2))
+        graph.tick()
+        payload = graph.serialize()
+        godot = json.loads(json.dumps(payload), parse_int=float)
+        self.assertIsInstance(godot["towers"][0]["pos_x"], float)
+
+        restored = TowerGraph.from_serialized(godot)
+        self.assertEqual(restored.serialize(), payload)
+        self.assertIs(type(restored.serialize()["bonds"][0]["from_id"]), int)
+        self.assertEqual(restored.tower_at(1, 0).id, 2)
+        restored.place_tower(TowerNode(3.0, "hexagon", "nonpolar", 2.0, 0.0))
+        self.assertEqual(list(restored.towers), [1, 2, 3])
+        self.assertEqual(set(restored.bonds), {(1, 2), (2, 3)})
+
+        godot["towers"][1]["pos_x"] = 1.5
+        with self.assertRaises(ValueError):
+            TowerGraph.from_serialized(godot)
+        with self.assertRaises(ValueError):
+            TowerStore().add(TowerNode(4.5, "a", "special", 0, 0))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,125 @@
+"""Bulk replay audit of codex tokens across many ordered streams.
+
+``audit_tokens`` consumes an iterator of ``(stream_id, token)`` pairs. Format,
+checksum and schema checks (``codex_eigenstate.verify_token``) run on a pool
+in chunks; the order check against each stream's version watermark runs in
+input order on the calling thread, exactly as successive
+``decode_payload_with_rejection`` calls would. At most ``max_pending`` chunks
+are in flight and only the first ``max_offending`` indices per rejection type
+are kept, so memory is bounded by the number of streams, not tokens.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import Counter, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Hashable, Iterable, Sequence
+
+from codex_eigenstate import RejectionType, verify_token
+
+OnRejection = Callable[[int, Hashable, str], None]
+
+
+@dataclass
+class AuditReport:
+    total: int = 0
+    accepted: int = 0
+    rejections: Counter = field(default_factory=Counter)
+    offending: dict[str, list[int]] = field(default_factory=dict)
+    offending_truncated: bool = False
+    watermarks: dict[Hashable, int] = field(default_factory=dict)
+
+    @property
+    def rejected(self) -> int:
+        return self.total - self.accepted
+
+
+def _verify_chunk(tokens: Sequence[str]) -> list[tuple[str | None, int]]:
+    # Only the verdict crosses the pool boundary, never the decoded payload.
+    results: list[tuple[str | None, int]] = []
+    for token in tokens:
+        verdict = verify_token(token)
+        results.append((None, verdict["version_id"]) if verdict["valid"] else (verdict["rejection"], -1))
+    return results
+
+
+class _InlineExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def _make_executor(pool: str, workers: int | None) -> Executor:
+    if pool == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    if pool == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    if pool == "inline":
+        return _InlineExecutor()
+    raise ValueError(f"Unknown pool kind: {pool}")
+
+
+def audit_tokens(
+    items: Iterable[tuple[Hashable, str]],
+    *,
+    pool: str = "process",
+    workers: int | None = None,
+    chunk_size: int = 2048,
+    max_pending: int | None = None,
+    max_offending: int = 10_000,
+    last_version_ids: dict[Hashable, int] | None = None,
+    on_rejection: OnRejection | None = None,
+) -> AuditReport:
+    """Validate ``(stream_id, token)`` pairs; indices are positions in ``items``.
+
+    ``pool`` is ``"process"``, ``"thread"`` or ``"inline"``. Streams start at
+    ``last_version_ids.get(stream, -1)``; an accepted token raises its stream's
+    watermark and rejected tokens leave it unchanged. ``on_rejection`` sees
+    every rejection, including ones past the ``max_offending`` cap.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    report = AuditReport(watermarks=dict(last_version_ids or {}))
+    watermarks = report.watermarks
+    order = RejectionType.ORDER_VIOLATION.value
+
+    def reject(index: int, stream: Hashable, rejection: str) -> None:
+        report.rejections[rejection] += 1
+        indices = report.offending.setdefault(rejection, [])
+        if len(indices) < max_offending:
+            indices.append(index)
+        else:
+            report.offending_truncated = True
+        if on_rejection is not None:
+            on_rejection(index, stream, rejection)
+
+    def drain(start: int, streams: list[Hashable], future: Future) -> None:
+        for offset, (stream, (rejection, version_id)) in enumerate(zip(streams, future.result())):
+            index = start + offset
+            if rejection is None:
+                if version_id > watermarks.get(stream, -1):
+                    watermarks[stream] = version_id
+                    report.accepted += 1
+                    continue
+                rejection = order
+            reject(index, stream, rejection)
+
+    source = iter(items)
+    in_flight: deque[tuple[int, list[Hashable], Future]] = deque()
+    with _make_executor(pool, workers) as executor:
+        while chunk := list(islice(source, chunk_size)):
+            streams = [stream for stream, _ in chunk]
+            in_flight.append((report.total, streams, executor.submit(_verify_chunk, [token for _, token in chunk])))
+            report.total += len(chunk)
+            if len(in_flight) >= max_pending:
+                drain(*in_flight.popleft())
+        while in_flight:
+            drain(*in_flight.popleft())
+    return report
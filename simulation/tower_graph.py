@@ -3,14 +3,21 @@
 Phase 1 scope:
 - residue classification attached to tower definitions,
 - hot-swappable affinity table with thermal/distance/orientation modifiers,
-- deterministic 4-connectivity graph updates,
+  stored as a dense lookup over integer residue codes,
+- deterministic 4-connectivity graph updates over a cell index (one tower per
+  cell; a later tower on an occupied cell replaces the earlier one with a warning),
+- columnar tower and bond stores updated in place,
 - FoldGraph v0.1 round-trip serialization.
 """
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
-from typing import Literal
+import warnings
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field, replace
+from typing import Iterable, Iterator, Literal, Sequence
 
 ResidueClass = Literal[
     "nonpolar",
@@ -20,6 +27,16 @@ ResidueClass = Literal[
     "special",
 ]
 
+RESIDUE_CLASSES: tuple[ResidueClass, ...] = (
+    "nonpolar",
+    "polar_uncharged",
+    "positively_charged",
+    "negatively_charged",
+    "special",
+)
+RESIDUE_CODES: dict[str, int] = {name: code for code, name in enumerate(RESIDUE_CLASSES)}
+_RESIDUE_COUNT = len(RESIDUE_CLASSES)
+
 
 DEFAULT_TOWER_RESIDUE_CLASS: dict[str, ResidueClass] = {
     # Geometric defaults.
@@ -38,6 +55,27 @@ DEFAULT_TOWER_RESIDUE_CLASS: dict[str, ResidueClass] = {
 }
 
 
+# Bond contributions are summed as integers in units of 2**-1074 (the smallest
+# float step), so add/remove never drifts and the mean is order independent.
+_CONTRIB_SCALE_BITS = 1074
+
+
+def _exact_units(value: float) -> int:
+    numerator, denominator = value.as_integer_ratio()
+    return numerator << (_CONTRIB_SCALE_BITS + 1 - denominator.bit_length())
+
+
+_ORTHOGONAL_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_DIAGONAL_OFFSETS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+# One offset per unordered neighbour pair, for enumerating every edge once.
+_FORWARD_OFFSETS = ((1, 0), (0, 1))
+_FORWARD_DIAGONAL_OFFSETS = ((1, 1), (1, -1))
+
+
+class CellConflictWarning(UserWarning):
+    """A tower was placed on an occupied cell and replaced the tower there."""
+
+
 @dataclass(frozen=True)
 class TowerDefinition:
     id: str
@@ -81,14 +119,406 @@ class FoldGraphSnapshot:
     graph_stats: GraphStats
 
 
+def _integral(value: object, name: str) -> object:
+    """Return an integral float (as JSON from Godot carries ids and cells) as an int."""
+
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"{name} must be an integer, got {value!r}")
+        return int(value)
+    return value
+
+
+def _integral_node(node: TowerNode) -> TowerNode:
+    if isinstance(node.id, float) or isinstance(node.pos_x, float) or isinstance(node.pos_y, float):
+        return replace(
+            node, id=_integral(node.id, "id"), pos_x=_integral(node.pos_x, "pos_x"), pos_y=_integral(node.pos_y, "pos_y")
+        )
+    return node
+
+
+class TowerView:
+    """Live read-only view of one stored tower, attribute-compatible with ``TowerNode``.
+
+    A view is valid until its tower is removed; its slot may then be reused.
+    """
+
+    __slots__ = ("_store", "_slot")
+
+    def __init__(self, store: "TowerStore", slot: int) -> None:
+        self._store = store
+        self._slot = slot
+
+    @property
+    def id(self) -> int:
+        return self._store.ids[self._slot]
+
+    @property
+    def tower_id(self) -> str:
+        return self._store.tower_ids[self._slot]
+
+    @property
+    def residue_class(self) -> ResidueClass:
+        return RESIDUE_CLASSES[self._store.codes[self._slot]]
+
+    @property
+    def pos_x(self) -> int:
+        return self._store.pos_x[self._slot]
+
+    @property
+    def pos_y(self) -> int:
+        return self._store.pos_y[self._slot]
+
+    @property
+    def thermal_state(self) -> float:
+        return self._store.thermal[self._slot]
+
+    @property
+    def modifiers(self) -> tuple[str, ...]:
+        return self._store.modifier_sets[self._store.modifier_codes[self._slot]]
+
+    def to_node(self) -> TowerNode:
+        return self._store.node(self._slot)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (TowerNode, TowerView)):
+            return self.to_node() == (other if isinstance(other, TowerNode) else other.to_node())
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TowerView({self.to_node()!r})"
+
+
+class TowerStore(Mapping[int, TowerView]):
+    """Parallel-array tower table keyed by tower id.
+
+    Columns are indexed by slot; freed slots are reused, so the arrays only
+    grow to the peak tower count. Modifier tuples are interned and stored as a
+    small integer code per tower. Frozen ``TowerNode`` copies for snapshots are
+    cached per slot until the row changes.
+
+    Item assignment and deletion keep the dict API: on a ``TowerGraph``'s
+    store they go through ``place_tower``/``remove_tower`` so the cell index
+    and bonds stay in sync.
+    """
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.codes = array("b")
+        self.pos_x = array("q")
+        self.pos_y = array("q")
+        self.thermal = array("d")
+        self.modifier_codes = array("I")
+        self.tower_ids: list[str] = []
+        self._nodes: list[TowerNode | None] = []
+        self.modifier_sets: list[tuple[str, ...]] = []
+        self._modifier_index: dict[tuple[str, ...], int] = {}
+        self._slots: dict[int, int] = {}
+        self._free: list[int] = []
+        self._owner: TowerGraph | None = None
+
+    def slot(self, tower_id: int) -> int:
+        return self._slots[tower_id]
+
+    def live_slots(self) -> Iterable[int]:
+        return self._slots.values()
+
+    def add(self, node: TowerNode) -> int:
+        node = _integral_node(node)
+        if node.id in self._slots:
+            raise ValueError(f"Tower {node.id} is already stored")
+        code = RESIDUE_CODES.get(node.residue_class)
+        if code is None:
+            raise ValueError(f"Unknown residue class: {node.residue_class}")
+        modifiers = tuple(node.modifiers)
+        modifier_code = self._modifier_index.get(modifiers)
+        if modifier_code is None:
+            modifier_code = self._modifier_index[modifiers] = len(self.modifier_sets)
+            self.modifier_sets.append(modifiers)
+        row = (node.id, code, node.pos_x, node.pos_y, float(node.thermal_state), modifier_code)
+        columns = (self.ids, self.codes, self.pos_x, self.pos_y, self.thermal, self.modifier_codes)
+        if self._free:
+            slot = self._free.pop()
+            for column, value in zip(columns, row):
+                column[slot] = value
+            self.tower_ids[slot] = node.tower_id
+            self._nodes[slot] = None
+        else:
+            slot = len(self.ids)
+            for column, value in zip(columns, row):
+                column.append(value)
+            self.tower_ids.append(node.tower_id)
+            self._nodes.append(None)
+        self._slots[node.id] = slot
+        return slot
+
+    def set_thermal(self, tower_id: int, thermal_state: float) -> None:
+        slot = self._slots[tower_id]
+        self.thermal[slot] = thermal_state
+        self._nodes[slot] = None
+
+    def remove(self, tower_id: int) -> int:
+        slot = self._slots.pop(tower_id)
+        self._free.append(slot)
+        return slot
+
+    def node(self, slot: int) -> TowerNode:
+        node = self._nodes[slot]
+        if node is None:
+            node = self._nodes[slot] = TowerNode(
+                id=self.ids[slot],
+                tower_id=self.tower_ids[slot],
+                residue_class=RESIDUE_CLASSES[self.codes[slot]],
+                pos_x=self.pos_x[slot],
+                pos_y=self.pos_y[slot],
+                thermal_state=self.thermal[slot],
+                modifiers=self.modifier_sets[self.modifier_codes[slot]],
+            )
+        return node
+
+    def __getitem__(self, tower_id: int) -> TowerView:
+        return TowerView(self, self._slots[tower_id])
+
+    def __setitem__(self, tower_id: int, node: TowerNode | TowerView) -> None:
+        node = _as_node(tower_id, node)
+        if self._owner is not None:
+            self._owner.place_tower(node)
+            return
+        if node.id in self._slots:
+            self.remove(node.id)
+        self.add(node)
+
+    def __delitem__(self, tower_id: int) -> None:
+        if tower_id not in self._slots:
+            raise KeyError(tower_id)
+        if self._owner is not None:
+            self._owner.remove_tower(tower_id)
+        else:
+            self.remove(tower_id)
+
+    def __contains__(self, tower_id: object) -> bool:
+        return tower_id in self._slots
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __repr__(self) -> str:
+        return f"TowerStore({len(self)} towers)"
+
+
+def _as_node(tower_id: int, node: TowerNode | TowerView) -> TowerNode:
+    if isinstance(node, TowerView):
+        node = node.to_node()
+    if node.id != tower_id:
+        raise ValueError(f"Tower {node.id} cannot be stored under id {tower_id}")
+    return node
+
+
+class BondView:
+    """Live read-only view of one stored bond, attribute-compatible with ``Bond``."""
+
+    __slots__ = ("_store", "_slot")
+
+    def __init__(self, store: "BondStore", slot: int) -> None:
+        self._store = store
+        self._slot = slot
+
+    @property
+    def from_id(self) -> int:
+        return self._store.from_ids[self._slot]
+
+    @property
+    def to_id(self) -> int:
+        return self._store.to_ids[self._slot]
+
+    @property
+    def affinity_type(self) -> str:
+        return self._store.affinity_types[self._store.type_codes[self._slot]]
+
+    @property
+    def strength(self) -> float:
+        return self._store.strength[self._slot]
+
+    @property
+    def contrib(self) -> float:
+        return self._store.contrib[self._slot]
+
+    @property
+    def timestamp(self) -> int:
+        return self._store.timestamps[self._slot]
+
+    def to_bond(self) -> Bond:
+        return self._store.bond(self._slot)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Bond, BondView)):
+            return self.to_bond() == (other if isinstance(other, Bond) else other.to_bond())
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"BondView({self.to_bond()!r})"
+
+
+class BondStore(Mapping[tuple[int, int], BondView]):
+    """Parallel-array bond table keyed by ``(from_id, to_id)`` edge.
+
+    Rows are overwritten in place; as with ``TowerStore``, frozen ``Bond``
+    copies are cached per slot until the row changes.
+    """
+
+    def __init__(self) -> None:
+        self.from_ids = array("q")
+        self.to_ids = array("q")
+        self.type_codes = array("b")
+        self.strength = array("d")
+        self.contrib = array("d")
+        self.timestamps = array("q")
+        self.affinity_types: list[str] = ["attractive", "repulsive", "neutral"]
+        self._bonds: list[Bond | None] = []
+        self._slots: dict[tuple[int, int], int] = {}
+        self._free: list[int] = []
+
+    def put(self, edge: tuple[int, int], affinity_type: str, strength: float, contrib: float, timestamp: int) -> float | None:
+        """Insert or overwrite ``edge``; returns the previous contrib, or None if the edge is new."""
+
+        if affinity_type not in self.affinity_types:
+            self.affinity_types.append(affinity_type)
+        type_code = self.affinity_types.index(affinity_type)
+        slot = self._slots.get(edge)
+        previous = None if slot is None else self.contrib[slot]
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = len(self.from_ids)
+                for column in (self.from_ids, self.to_ids, self.type_codes, self.strength, self.contrib, self.timestamps):
+                    column.append(0)
+                self._bonds.append(None)
+            self._slots[edge] = slot
+            self.from_ids[slot], self.to_ids[slot] = edge
+        self.type_codes[slot] = type_code
+        self.strength[slot] = strength
+        self.contrib[slot] = contrib
+        self.timestamps[slot] = timestamp
+        self._bonds[slot] = None
+        return previous
+
+    def discard(self, edge: tuple[int, int]) -> float | None:
+        """Remove ``edge`` if present and return its contrib."""
+
+        slot = self._slots.pop(edge, None)
+        if slot is None:
+            return None
+        self._free.append(slot)
+        return self.contrib[slot]
+
+    def clear(self) -> None:
+        self._free.extend(self._slots.values())
+        self._slots.clear()
+
+    def contribs(self) -> list[float]:
+        contrib = self.contrib
+        return [contrib[slot] for slot in self._slots.values()]
+
+    def bond(self, slot: int) -> Bond:
+        bond = self._bonds[slot]
+        if bond is None:
+            bond = self._bonds[slot] = Bond(
+                from_id=self.from_ids[slot],
+                to_id=self.to_ids[slot],
+                affinity_type=self.affinity_types[self.type_codes[slot]],
+                strength=self.strength[slot],
+                contrib=self.contrib[slot],
+                timestamp=self.timestamps[slot],
+            )
+        return bond
+
+    def materialize(self, edge: tuple[int, int]) -> Bond:
+        return self.bond(self._slots[edge])
+
+    def __getitem__(self, edge: tuple[int, int]) -> BondView:
+        return BondView(self, self._slots[edge])
+
+    def __contains__(self, edge: object) -> bool:
+        return edge in self._slots
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return iter(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __repr__(self) -> str:
+        return f"BondStore({len(self)} bonds)"
+
+
+def _affinity_type(score: float) -> str:
+    return "attractive" if score > 0 else "repulsive" if score < 0 else "neutral"
+
+
+class AffinityMatrix(Mapping[tuple[ResidueClass, ResidueClass], float]):
+    """Read-only residue-pair matrix plus its dense row-major lookup over ``RESIDUE_CODES``."""
+
+    __slots__ = ("_values", "dense")
+
+    def __init__(self, values: Mapping[tuple[ResidueClass, ResidueClass], float]) -> None:
+        self._values = dict(values)
+        # None marks pairs the matrix leaves out; scoring them raises KeyError.
+        self.dense: list[float | None] = [None] * (_RESIDUE_COUNT * _RESIDUE_COUNT)
+        for (left, right), value in self._values.items():
+            if left in RESIDUE_CODES and right in RESIDUE_CODES:
+                self.dense[RESIDUE_CODES[left] * _RESIDUE_COUNT + RESIDUE_CODES[right]] = float(value)
+
+    def __getitem__(self, pair: tuple[ResidueClass, ResidueClass]) -> float:
+        return self._values[pair]
+
+    def __iter__(self) -> Iterator[tuple[ResidueClass, ResidueClass]]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"AffinityMatrix({self._values!r})"
+
+
+_TABLE_FIELDS = frozenset({"matrix", "thermal_penalty_gain", "distance_falloff", "orientation_gain"})
+
+
 @dataclass
 class AffinityTable:
-    """Serializable, hot-swappable affinity table and modifiers."""
+    """Serializable, hot-swappable affinity table and modifiers.
 
-    matrix: dict[tuple[ResidueClass, ResidueClass], float]
+    ``matrix`` is stored as a read-only ``AffinityMatrix`` so its dense lookup
+    cannot go stale; hot-swap pairs with ``with_matrix`` or by assigning a new
+    ``matrix``. Every assignment to a table field bumps a revision that
+    ``TowerGraph`` checks on ``tick`` to rebuild bonds scored with old values.
+    """
+
+    matrix: Mapping[tuple[ResidueClass, ResidueClass], float]
     thermal_penalty_gain: float = 0.40
     distance_falloff: float = 0.12
     orientation_gain: float = 0.05
+    _revision: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name == "matrix" and not isinstance(value, AffinityMatrix):
+            value = AffinityMatrix(value)
+        super().__setattr__(name, value)
+        if name in _TABLE_FIELDS:
+            super().__setattr__("_revision", self._revision + 1)
+
+    def with_matrix(self, updates: Mapping[tuple[ResidueClass, ResidueClass], float]) -> "AffinityTable":
+        """Return a copy of this table with ``updates`` applied to the matrix."""
+
+        return replace(self, matrix={**self.matrix, **updates})
 
     @classmethod
     def defaults(cls) -> "AffinityTable":
@@ -143,7 +573,9 @@ class AffinityTable:
         }
 
     def evaluate(self, left: TowerNode, right: TowerNode, *, diagonal: bool = False) -> tuple[float, str]:
-        base = self.matrix[(left.residue_class, right.residue_class)]
+        base = self.matrix.dense[RESIDUE_CODES[left.residue_class] * _RESIDUE_COUNT + RESIDUE_CODES[right.residue_class]]
+        if base is None:
+            raise KeyError((left.residue_class, right.residue_class))
         thermal = (left.thermal_state + right.thermal_state) * 0.5
         thermal_mod = max(0.0, 1.0 - thermal * self.thermal_penalty_gain)
         dx = abs(left.pos_x - right.pos_x)
@@ -152,58 +584,198 @@ class AffinityTable:
         distance_mod = max(0.0, 1.0 - max(0, manhattan - 1) * self.distance_falloff)
         orientation_mod = 1.0 + self.orientation_gain if (diagonal and dx == 1 and dy == 1) else 1.0
         score = base * thermal_mod * distance_mod * orientation_mod
-        affinity_type = "attractive" if score > 0 else "repulsive" if score < 0 else "neutral"
-        return score, affinity_type
+        return score, _affinity_type(score)
+
+    def evaluate_many(
+        self,
+        left_idx: Sequence[int],
+        right_idx: Sequence[int],
+        thermal: Sequence[float],
+        dx: Sequence[int],
+        dy: Sequence[int],
+        *,
+        diagonal: bool = False,
+    ) -> list[float]:
+        """Score a whole edge list in one pass; element ``i`` equals ``evaluate`` for that pair.
+
+        ``left_idx``/``right_idx`` are residue codes, ``thermal`` the pair's mean
+        thermal state and ``dx``/``dy`` the position offsets.
+        """
+
+        dense = self.matrix.dense
+        bases = [dense[left * _RESIDUE_COUNT + right] for left, right in zip(left_idx, right_idx)]
+        if None in bases:
+            missing = bases.index(None)
+            raise KeyError((RESIDUE_CLASSES[left_idx[missing]], RESIDUE_CLASSES[right_idx[missing]]))
+        gain = self.thermal_penalty_gain
+        falloff = self.distance_falloff
+        diagonal_mod = 1.0 + self.orientation_gain
+        scores: list[float] = []
+        for base, pair_thermal, off_x, off_y in zip(bases, thermal, dx, dy):
+            off_x = abs(off_x)
+            off_y = abs(off_y)
+            thermal_mod = max(0.0, 1.0 - pair_thermal * gain)
+            distance_mod = max(0.0, 1.0 - max(0, off_x + off_y - 1) * falloff)
+            orientation_mod = diagonal_mod if (diagonal and off_x == 1 and off_y == 1) else 1.0
+            scores.append(base * thermal_mod * distance_mod * orientation_mod)
+        return scores
+
+
+_RULE_FIELDS = frozenset({"affinity_table", "bond_threshold", "diagonal_connectivity"})
 
 
 @dataclass
 class TowerGraph:
+    """Bond graph over towers placed one per grid cell.
+
+    Placements and removals rebuild the affected bonds immediately. Thermal
+    updates and affinity-table swaps only mark towers dirty; ``tick`` then
+    re-evaluates the bonds of dirty towers alone, so a tick where nothing
+    changed does no bond work. Assigning ``affinity_table``, ``bond_threshold``
+    or ``diagonal_connectivity``, or any field of the current affinity table,
+    changes the bonding rules for every pair, so the next tick rebuilds all
+    bonds; ``tick(full=True)`` forces that rebuild.
+    ``verify_incremental`` cross-checks each incremental tick against a full
+    recompute. A bond's ``timestamp`` is the tick it was last evaluated on.
+
+    Sorted tower/bond keys and the ``graph_stats`` aggregates are maintained as
+    bonds change, so ``graph_stats`` is O(1) and ``snapshot`` only builds
+    tuples. ``towers`` and ``bonds`` are columnar stores handing out live
+    ``TowerView``/``BondView`` objects; snapshots hold frozen copies. Either may
+    be passed to the constructor as a plain mapping of ``TowerNode``/``Bond``
+    records, which is loaded like ``from_serialized``: bonds are taken as given
+    and every tower is re-evaluated on the next tick.
+    """
+
     affinity_table: AffinityTable = field(default_factory=AffinityTable.defaults)
     bond_threshold: float = 0.20
     diagonal_connectivity: bool = False
-    towers: dict[int, TowerNode] = field(default_factory=dict)
-    bonds: dict[tuple[int, int], Bond] = field(default_factory=dict)
+    towers: Mapping[int, TowerNode | TowerView] = field(default_factory=TowerStore)
+    bonds: Mapping[tuple[int, int], Bond | BondView] = field(default_factory=BondStore)
     tick_counter: int = 0
+    verify_incremental: bool = False
+    # (pos_x, pos_y) -> tower slot; kept in sync with ``towers`` so neighbour
+    # lookup probes adjacent cells instead of scanning every tower.
+    _cells: dict[tuple[int, int], int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _dirty: set[int] = field(default_factory=set, init=False, repr=False, compare=False)
+    _tower_order: list[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _bond_order: list[tuple[int, int]] = field(default_factory=list, init=False, repr=False, compare=False)
+    _contrib_units: int = field(default=0, init=False, repr=False, compare=False)
+    _negative_bonds: int = field(default=0, init=False, repr=False, compare=False)
+    _rules_changed: bool = field(default=False, init=False, repr=False, compare=False)
+    _table_revision: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        towers, bonds = self.towers, self.bonds
+        self.towers = TowerStore()
+        self.bonds = BondStore()
+        self.towers._owner = self
+        self._table_revision = self.affinity_table._revision
+        self._load(
+            (_as_node(tower_id, node) for tower_id, node in towers.items()),
+            (bond.to_bond() if isinstance(bond, BondView) else bond for bond in bonds.values()),
+        )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        # __init__ assigns the rule fields before the internal state exists.
+        if name in _RULE_FIELDS and "_dirty" in self.__dict__:
+            self._rules_changed = True
 
     def set_affinity_table(self, table: AffinityTable) -> None:
         self.affinity_table = table
 
-    def place_tower(self, node: TowerNode) -> None:
-        self.towers[node.id] = node
-        self._recompute_local(node.id)
+    def mark_dirty(self, tower_id: int) -> None:
+        if tower_id in self.towers:
+            self._dirty.add(tower_id)
+
+    def mark_all_dirty(self) -> None:
+        self._dirty.update(self.towers)
+
+    @property
+    def dirty_towers(self) -> frozenset[int]:
+        return frozenset(self._dirty)
+
+    def tower_at(self, pos_x: int, pos_y: int) -> TowerView | None:
+        slot = self._cells.get((pos_x, pos_y))
+        return None if slot is None else TowerView(self.towers, slot)
+
+    def place_tower(self, node: TowerNode, *, strict: bool = False) -> None:
+        """Place ``node``, replacing any tower with the same id.
+
+        A different tower on the same cell is removed with a
+        ``CellConflictWarning``; with ``strict`` that raises ValueError instead.
+        """
+
+        node = _integral_node(node)
+        self._claim_cell(node, strict)
+        if node.id in self.towers:
+            self.remove_tower(node.id)
+        self._index(node)
+        self._recompute_local((node.id,))
 
     def remove_tower(self, tower_id: int) -> None:
-        self.towers.pop(tower_id, None)
-        for edge in [k for k in self.bonds if tower_id in k]:
-            self.bonds.pop(edge, None)
+        if tower_id not in self.towers:
+            return
+        store = self.towers
+        slot = store.remove(tower_id)
+        x, y = store.pos_x[slot], store.pos_y[slot]
+        self._dirty.discard(tower_id)
+        del self._cells[(x, y)]
+        del self._tower_order[bisect_left(self._tower_order, tower_id)]
+        # Bonds only join adjacent cells, so probing all eight covers every edge.
+        for dx, dy in _ORTHOGONAL_OFFSETS + _DIAGONAL_OFFSETS:
+            neighbor = self._cells.get((x + dx, y + dy))
+            if neighbor is not None:
+                neighbor_id = store.ids[neighbor]
+                self._drop_bond((tower_id, neighbor_id) if tower_id < neighbor_id else (neighbor_id, tower_id))
 
     def update_tower_thermal_state(self, tower_id: int, thermal_state: float) -> None:
-        old = self.towers[tower_id]
-        self.towers[tower_id] = TowerNode(
-            id=old.id,
-            tower_id=old.tower_id,
-            residue_class=old.residue_class,
-            pos_x=old.pos_x,
-            pos_y=old.pos_y,
-            thermal_state=thermal_state,
-            modifiers=old.modifiers,
-        )
-        self._recompute_local(tower_id)
+        self.towers.set_thermal(tower_id, thermal_state)
+        self._dirty.add(tower_id)
 
-    def tick(self) -> FoldGraphSnapshot:
+    def tick(self, *, full: bool = False) -> FoldGraphSnapshot:
         self.tick_counter += 1
-        for tower_id in sorted(self.towers):
-            self._recompute_local(tower_id)
+        table_revision = self.affinity_table._revision
+        if full or self._rules_changed or table_revision != self._table_revision:
+            # Rebuild from scratch and sort the keys once rather than per insert.
+            # This also drops bonds a rule change made unreachable, such as
+            # diagonal bonds after ``diagonal_connectivity`` is switched off.
+            self._rules_changed = False
+            self._table_revision = table_revision
+            self._dirty.clear()
+            self.bonds.clear()
+            for edge, score in self._score_pairs(self._all_pairs()):
+                if score is not None:
+                    self.bonds.put(edge, _affinity_type(score), score, score, self.tick_counter)
+            self._rebuild_bond_index()
+            return self.snapshot()
+        # Every edge of a dirty tower is re-evaluated with it, so neighbours
+        # need no separate pass.
+        dirty, self._dirty = self._dirty, set()
+        self._recompute_local(dirty)
+        if self.verify_incremental:
+            self._verify_against_full_recompute()
         return self.snapshot()
 
+    @property
+    def graph_stats(self) -> GraphStats:
+        count = len(self._bond_order)
+        if not count:
+            return GraphStats(total_bonds=0, avg_stability=0.0, misfold_risk=0.0)
+        return GraphStats(
+            total_bonds=count,
+            avg_stability=self._contrib_units / (count << _CONTRIB_SCALE_BITS),
+            misfold_risk=self._negative_bonds / count,
+        )
+
     def snapshot(self) -> FoldGraphSnapshot:
-        bonds = tuple(self.bonds[k] for k in sorted(self.bonds))
-        stats = self._stats(bonds)
+        towers = self.towers
         return FoldGraphSnapshot(
             foldgraph_version=0.1,
-            towers=tuple(self.towers[k] for k in sorted(self.towers)),
-            bonds=bonds,
-            graph_stats=stats,
+            towers=tuple(towers.node(towers.slot(k)) for k in self._tower_order),
+            bonds=tuple(self.bonds.materialize(k) for k in self._bond_order),
+            graph_stats=self.graph_stats,
         )
 
     def serialize(self) -> dict[str, object]:
@@ -217,62 +789,156 @@ class TowerGraph:
         }
 
     @classmethod
-    def from_serialized(cls, payload: dict[str, object], affinity_table: AffinityTable | None = None) -> "TowerGraph":
+    def from_serialized(
+        cls,
+        payload: dict[str, object],
+        affinity_table: AffinityTable | None = None,
+        *,
+        strict: bool = False,
+    ) -> "TowerGraph":
+        """Load a FoldGraph payload; towers sharing a cell resolve as in ``place_tower``."""
+
         graph = cls(affinity_table=affinity_table or AffinityTable.defaults())
-        graph.tick_counter = int(payload.get("tick_counter", 0))
-        for tower in payload.get("towers", []):
-            normalized = dict(tower)
-            normalized["modifiers"] = tuple(normalized.get("modifiers", ()))
-            node = TowerNode(**normalized)
-            graph.towers[node.id] = node
-        for bond in payload.get("bonds", []):
-            record = Bond(**bond)
-            edge = tuple(sorted((record.from_id, record.to_id)))
-            graph.bonds[edge] = record
+        graph.tick_counter = int(_integral(payload.get("tick_counter", 0), "tick_counter"))
+        graph._load(
+            (TowerNode(**dict(tower, modifiers=tuple(tower.get("modifiers", ())))) for tower in payload.get("towers", [])),
+            (Bond(**bond) for bond in payload.get("bonds", [])),
+            strict=strict,
+        )
         return graph
 
-    def _recompute_local(self, tower_id: int) -> None:
-        node = self.towers.get(tower_id)
-        if node is None:
+    def _load(self, towers: Iterable[TowerNode], bonds: Iterable[Bond], *, strict: bool = False) -> None:
+        for node in map(_integral_node, towers):
+            self._claim_cell(node, strict)
+            if node.id in self.towers:
+                self.remove_tower(node.id)
+            self._index(node)
+        # Stored bonds may come from another table or rule set; refresh on the next tick.
+        self.mark_all_dirty()
+        for record in bonds:
+            edge = tuple(sorted((_integral(record.from_id, "from_id"), _integral(record.to_id, "to_id"))))
+            if edge[0] not in self.towers or edge[1] not in self.towers:
+                continue  # an endpoint lost its cell to a later tower
+            timestamp = _integral(record.timestamp, "timestamp")
+            self.bonds.put(edge, record.affinity_type, record.strength, record.contrib, timestamp)
+        self._rebuild_bond_index()
+
+    def _all_pairs(self) -> list[tuple[int, int]]:
+        offsets = _FORWARD_OFFSETS + _FORWARD_DIAGONAL_OFFSETS if self.diagonal_connectivity else _FORWARD_OFFSETS
+        store = self.towers
+        ids, xs, ys, cells = store.ids, store.pos_x, store.pos_y, self._cells
+        pairs: list[tuple[int, int]] = []
+        for slot in store.live_slots():
+            x, y = xs[slot], ys[slot]
+            for dx, dy in offsets:
+                neighbor = cells.get((x + dx, y + dy))
+                if neighbor is not None:
+                    pairs.append((slot, neighbor) if ids[slot] < ids[neighbor] else (neighbor, slot))
+        return pairs
+
+    def _score_pairs(self, pairs: list[tuple[int, int]]) -> list[tuple[tuple[int, int], float | None]]:
+        """Score slot pairs ``(lower id, higher id)``; None marks edges under the threshold."""
+
+        store = self.towers
+        ids, codes, thermal, xs, ys = store.ids, store.codes, store.thermal, store.pos_x, store.pos_y
+        scores = self.affinity_table.evaluate_many(
+            [codes[left] for left, _ in pairs],
+            [codes[right] for _, right in pairs],
+            [(thermal[left] + thermal[right]) * 0.5 for left, right in pairs],
+            [xs[left] - xs[right] for left, right in pairs],
+            [ys[left] - ys[right] for left, right in pairs],
+            diagonal=self.diagonal_connectivity,
+        )
+        threshold = self.bond_threshold
+        return [
+            ((ids[left], ids[right]), score if abs(score) >= threshold else None)
+            for (left, right), score in zip(pairs, scores)
+        ]
+
+    def _recompute_local(self, tower_ids: Iterable[int]) -> None:
+        store = self.towers
+        ids = store.ids
+        pairs: dict[tuple[int, int], tuple[int, int]] = {}
+        for tower_id in tower_ids:
+            if tower_id not in store:
+                continue
+            slot = store.slot(tower_id)
+            for neighbor in self._neighbor_slots(slot):
+                pair = (slot, neighbor) if tower_id < ids[neighbor] else (neighbor, slot)
+                pairs[(ids[pair[0]], ids[pair[1]])] = pair
+        for edge, score in self._score_pairs(list(pairs.values())):
+            if score is not None:
+                self._set_bond(edge, _affinity_type(score), score, score)
+            else:
+                self._drop_bond(edge)
+
+    def _rebuild_bond_index(self) -> None:
+        self._bond_order = sorted(self.bonds)
+        contribs = self.bonds.contribs()
+        self._contrib_units = sum(map(_exact_units, contribs))
+        self._negative_bonds = sum(contrib < 0 for contrib in contribs)
+
+    def _set_bond(self, edge: tuple[int, int], affinity_type: str, strength: float, contrib: float) -> None:
+        previous = self.bonds.put(edge, affinity_type, strength, contrib, self.tick_counter)
+        if previous is None:
+            insort(self._bond_order, edge)
+        elif previous == contrib:
+            return  # re-evaluated to the same value; only the timestamp moved
+        else:
+            self._contrib_units -= _exact_units(previous)
+            self._negative_bonds -= previous < 0
+        self._contrib_units += _exact_units(contrib)
+        self._negative_bonds += contrib < 0
+
+    def _drop_bond(self, edge: tuple[int, int]) -> None:
+        previous = self.bonds.discard(edge)
+        if previous is None:
             return
-        for neighbor in self._candidate_neighbors(node):
-            edge = tuple(sorted((node.id, neighbor.id)))
-            strength, affinity_type = self.affinity_table.evaluate(node, neighbor, diagonal=self.diagonal_connectivity)
+        del self._bond_order[bisect_left(self._bond_order, edge)]
+        self._contrib_units -= _exact_units(previous)
+        self._negative_bonds -= previous < 0
+
+    def _verify_against_full_recompute(self) -> None:
+        # Scalar ``evaluate`` on materialised nodes on purpose, so the bulk
+        # scoring path and the columnar store are both checked.
+        store = self.towers
+        expected: dict[tuple[int, int], tuple[str, float, float]] = {}
+        for left_slot, right_slot in self._all_pairs():
+            left, right = store.node(left_slot), store.node(right_slot)
+            strength, affinity_type = self.affinity_table.evaluate(left, right, diagonal=self.diagonal_connectivity)
             if abs(strength) >= self.bond_threshold:
-                self.bonds[edge] = Bond(
-                    from_id=edge[0],
-                    to_id=edge[1],
-                    affinity_type=affinity_type,
-                    strength=strength,
-                    contrib=strength,
-                    timestamp=self.tick_counter,
-                )
-            else:
-                self.bonds.pop(edge, None)
-
-    def _candidate_neighbors(self, node: TowerNode) -> list[TowerNode]:
-        out: list[TowerNode] = []
-        for other in self.towers.values():
-            if other.id == node.id:
-                continue
-            dx = abs(node.pos_x - other.pos_x)
-            dy = abs(node.pos_y - other.pos_y)
-            orthogonal = dx + dy == 1
-            diagonal = self.diagonal_connectivity and dx == 1 and dy == 1
-            if orthogonal or diagonal:
-                out.append(other)
-        return out
-
-    def _stats(self, bonds: tuple[Bond, ...]) -> GraphStats:
-        if not bonds:
-            return GraphStats(total_bonds=0, avg_stability=0.0, misfold_risk=0.0)
-        avg_stability = sum(b.contrib for b in bonds) / len(bonds)
-        negative = sum(1 for b in bonds if b.contrib < 0)
-        return GraphStats(
-            total_bonds=len(bonds),
-            avg_stability=avg_stability,
-            misfold_risk=negative / len(bonds),
-        )
+                expected[(left.id, right.id)] = (affinity_type, strength, strength)
+        actual = {edge: (b.affinity_type, b.strength, b.contrib) for edge, b in self.bonds.items()}
+        if actual != expected:
+            diverged = sorted(set(actual.items()) ^ set(expected.items()))
+            raise AssertionError(f"Incremental tick diverged from full recompute on {len(diverged)} edge(s): {diverged[:5]}")
+        if self._bond_order != sorted(self.bonds) or self._tower_order != sorted(self.towers):
+            raise AssertionError("Incremental key order diverged from the bond and tower tables")
+        contribs = self.bonds.contribs()
+        if self._contrib_units != sum(map(_exact_units, contribs)) or self._negative_bonds != sum(c < 0 for c in contribs):
+            raise AssertionError("Incremental graph stats diverged from the bond table")
+
+    def _claim_cell(self, node: TowerNode, strict: bool) -> None:
+        occupant = self._cells.get((node.pos_x, node.pos_y))
+        if occupant is None or self.towers.ids[occupant] == node.id:
+            return
+        occupant_id = self.towers.ids[occupant]
+        message = f"Cell ({node.pos_x}, {node.pos_y}) is already occupied by tower {occupant_id}"
+        if strict:
+            raise ValueError(message)
+        warnings.warn(f"{message}; tower {node.id} replaces it", CellConflictWarning, stacklevel=3)
+        self.remove_tower(occupant_id)
+
+    def _index(self, node: TowerNode) -> None:
+        slot = self.towers.add(node)
+        insort(self._tower_order, node.id)
+        self._cells[(node.pos_x, node.pos_y)] = slot
+
+    def _neighbor_slots(self, slot: int) -> list[int]:
+        offsets = _ORTHOGONAL_OFFSETS + _DIAGONAL_OFFSETS if self.diagonal_connectivity else _ORTHOGONAL_OFFSETS
+        x, y = self.towers.pos_x[slot], self.towers.pos_y[slot]
+        cells = self._cells
+        return [neighbor for dx, dy in offsets if (neighbor := cells.get((x + dx, y + dy))) is not None]
 
 
 def normalize_tower_definitions(tower_ids: list[str]) -> list[TowerDefinition]: